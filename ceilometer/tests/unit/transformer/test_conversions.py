@@ -0,0 +1,73 @@
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+from oslotest import base
+
+from ceilometer.transformer import conversions
+
+
+class TestPreviousSampleCache(base.BaseTestCase):
+
+    def setUp(self):
+        super(TestPreviousSampleCache, self).setUp()
+        patcher = mock.patch('ceilometer.transformer.conversions.time.time',
+                             return_value=1000.0)
+        self.time = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_evicts_least_recently_seen(self):
+        cache = conversions.PreviousSampleCache(2, None)
+        cache.set('a', 1, 't1')
+        cache.set('b', 2, 't2')
+        cache.set('a', 3, 't3')
+        cache.set('c', 4, 't4')
+
+        self.assertEqual(2, len(cache))
+        self.assertNotIn('b', cache)
+        self.assertEqual(3, cache.get('a').volume)
+        self.assertEqual(4, cache.get('c').volume)
+        self.assertEqual(1, cache.evictions)
+        self.assertEqual(0, cache.expirations)
+
+    def test_expires_idle_entries(self):
+        cache = conversions.PreviousSampleCache(10, 60)
+        cache.set('a', 1, 't1')
+        self.time.return_value = 1030.0
+        cache.set('b', 2, 't2')
+
+        self.time.return_value = 1061.0
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(2, cache.get('b').volume)
+        self.assertEqual(1, cache.expirations)
+
+        self.time.return_value = 1100.0
+        cache.set('c', 3, 't3')
+        self.assertEqual(1, len(cache))
+        self.assertEqual(2, cache.expirations)
+        self.assertEqual(0, cache.evictions)
+
+    def test_reports_drops_periodically(self):
+        cache = conversions.PreviousSampleCache(1, None)
+        with mock.patch.object(conversions.LOG, 'info') as info:
+            for index in range(5):
+                cache.set(index, index, 't')
+            self.assertFalse(info.called)
+
+            self.time.return_value = 1000.0 + conversions.REPORT_INTERVAL
+            cache.set('last', 0, 't')
+            self.assertEqual(1, info.call_count)
+            self.assertEqual(5, info.call_args[0][1]['evictions'])
+
+            cache.set('again', 0, 't')
+            self.assertEqual(1, info.call_count)
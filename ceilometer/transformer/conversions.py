@@ -15,6 +15,7 @@
 
 import collections
 import re
+import time
 
 from oslo_log import log
 from oslo_utils import timeutils
@@ -26,6 +27,101 @@ from ceilometer import transformer
 
 LOG = log.getLogger(__name__)
 
+# Default bounds on the per-resource state kept by the delta and
+# rate_of_change transformers, overridable as pipeline parameters.
+CACHE_SIZE = 100000
+CACHE_TTL = 3600
+
+# Seconds between two summaries of the samples dropped from a cache.
+REPORT_INTERVAL = 300
+
+
+class _PreviousSample(object):
+    """Volume and timestamp of the last sample seen for a resource."""
+
+    __slots__ = ('volume', 'timestamp', 'touched')
+
+    def __init__(self, volume, timestamp, touched):
+        self.volume = volume
+        self.timestamp = timestamp
+        self.touched = touched
+
+
+class PreviousSampleCache(object):
+    """Bounded LRU map of the previous sample seen per resource.
+
+    Entries not refreshed within ``ttl`` seconds are expired and, once
+    ``size`` entries are held, the least recently seen one is evicted, so
+    the state of a transformer does not grow with resource churn.
+    """
+
+    def __init__(self, size, ttl):
+        self.size = int(size)
+        self.ttl = float(ttl) if ttl else None
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = collections.OrderedDict()
+        self._reported = (0, 0)
+        self._reported_at = time.time()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def _expired(self, entry, now):
+        return self.ttl is not None and now - entry.touched > self.ttl
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        now = time.time()
+        if self._expired(entry, now):
+            del self._entries[key]
+            self.expirations += 1
+            self._report(now)
+            return None
+        return entry
+
+    def set(self, key, volume, timestamp):
+        now = time.time()
+        self._entries.pop(key, None)
+        self._entries[key] = _PreviousSample(volume, timestamp, now)
+        self._prune(now)
+
+    def _prune(self, now):
+        # The oldest entry is always first, so stop at the first live one.
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if self._expired(entry, now):
+                self.expirations += 1
+            elif len(self._entries) > self.size:
+                self.evictions += 1
+            else:
+                break
+            del self._entries[key]
+        self._report(now)
+
+    def _report(self, now):
+        """Logs the samples dropped since the last summary, at most once
+        every ``REPORT_INTERVAL`` seconds.
+        """
+        if now - self._reported_at < REPORT_INTERVAL:
+            return
+        evictions = self.evictions - self._reported[0]
+        expirations = self.expirations - self._reported[1]
+        if evictions or expirations:
+            LOG.info('Dropped %(evictions)d evicted and %(expirations)d '
+                     'expired cached samples in %(interval)d seconds '
+                     '(%(size)d cached)',
+                     {'evictions': evictions, 'expirations': expirations,
+                      'interval': now - self._reported_at,
+                      'size': len(self._entries)})
+        self._reported = (self.evictions, self.expirations)
+        self._reported_at = now
+
 
 class BaseConversionTransformer(transformer.TransformerBase):
     """Transformer to derive conversion."""
@@ -61,32 +157,34 @@ class BaseConversionTransformer(transformer.TransformerBase):
 class DeltaTransformer(BaseConversionTransformer):
     """Transformer based on the delta of a sample volume."""
 
-    def __init__(self, target=None, growth_only=False, **kwargs):
+    def __init__(self, target=None, growth_only=False,
+                 cache_size=CACHE_SIZE, cache_ttl=CACHE_TTL, **kwargs):
         """Initialize transformer with configured parameters.
 
         :param growth_only: capture only positive deltas
+        :param cache_size: maximum number of resources to track
+        :param cache_ttl: seconds after which an idle resource is forgotten
         """
         super(DeltaTransformer, self).__init__(target=target, **kwargs)
         self.growth_only = growth_only
-        self.cache = {}
+        self.cache = PreviousSampleCache(cache_size, cache_ttl)
 
     def handle_sample(self, s):
         """Handle a sample, converting if necessary."""
         key = s.name + s.resource_id
         prev = self.cache.get(key)
         timestamp = timeutils.parse_isotime(s.timestamp)
-        self.cache[key] = (s.volume, timestamp)
 
         if prev:
-            prev_volume = prev[0]
-            prev_timestamp = prev[1]
+            prev_volume = prev.volume
+            prev_timestamp = prev.timestamp
             time_delta = timeutils.delta_seconds(prev_timestamp, timestamp)
             # disallow violations of the arrow of time
             if time_delta < 0:
                 LOG.warning(_LW('Dropping out of time order sample: %s'), (s,))
-                # Reset the cache to the newer sample.
-                self.cache[key] = prev
+                # Keep the cache on the newer sample.
                 return None
+            self.cache.set(key, s.volume, timestamp)
             volume_delta = s.volume - prev_volume
             if self.growth_only and volume_delta < 0:
                 LOG.warning(_LW('Negative delta detected, dropping value'))
@@ -95,6 +193,7 @@ class DeltaTransformer(BaseConversionTransformer):
                 s = self._convert(s, volume_delta)
                 LOG.debug('Converted to: %s', s)
         else:
+            self.cache.set(key, s.volume, timestamp)
             LOG.warning(_LW('Dropping sample with no predecessor: %s'), (s,))
             s = None
         return s
@@ -173,10 +272,14 @@ class RateOfChangeTransformer(ScalingTransformer):
     and producing a gauge value based on the proportion of some maximum used.
     """
 
-    def __init__(self, **kwargs):
-        """Initialize transformer with configured parameters."""
+    def __init__(self, cache_size=CACHE_SIZE, cache_ttl=CACHE_TTL, **kwargs):
+        """Initialize transformer with configured parameters.
+
+        :param cache_size: maximum number of resources to track
+        :param cache_ttl: seconds after which an idle resource is forgotten
+        """
         super(RateOfChangeTransformer, self).__init__(**kwargs)
-        self.cache = {}
+        self.cache = PreviousSampleCache(cache_size, cache_ttl)
         self.scale = self.scale or '1'
 
     def handle_sample(self, s):
@@ -185,18 +288,17 @@ class RateOfChangeTransformer(ScalingTransformer):
         key = s.name + s.resource_id
         prev = self.cache.get(key)
         timestamp = timeutils.parse_isotime(s.timestamp)
-        self.cache[key] = (s.volume, timestamp)
 
         if prev:
-            prev_volume = prev[0]
-            prev_timestamp = prev[1]
+            prev_volume = prev.volume
+            prev_timestamp = prev.timestamp
             time_delta = timeutils.delta_seconds(prev_timestamp, timestamp)
             # disallow violations of the arrow of time
             if time_delta < 0:
                 LOG.warning(_('dropping out of time order sample: %s'), (s,))
-                # Reset the cache to the newer sample.
-                self.cache[key] = prev
+                # Keep the cache on the newer sample.
                 return None
+            self.cache.set(key, s.volume, timestamp)
             # we only allow negative volume deltas for noncumulative
             # samples, whereas for cumulative we assume that a reset has
             # occurred in the interim so that the current volume gives a
@@ -211,6 +313,7 @@ class RateOfChangeTransformer(ScalingTransformer):
             s = self._convert(s, rate_of_change)
             LOG.debug('converted to: %s', s)
         else:
+            self.cache.set(key, s.volume, timestamp)
             LOG.warning(_('dropping sample with no predecessor: %s'),
                         (s,))
             s = None
@@ -22,11 +22,14 @@ from django.conf.urls import url
 from django.views.generic import TemplateView  # noqa
 from django.views import i18n
 
+from horizon.tables import views as table_views
 from horizon.test.jasmine import jasmine
 from horizon import views
 
 urlpatterns = [
-    url(r'^home/$', views.user_home, name='user_home')
+    url(r'^home/$', views.user_home, name='user_home'),
+    url(r'^batch_action/(?P<job_id>[0-9a-f]+)/$',
+        table_views.batch_action_status, name='batch_action_status'),
 ]
 
 # Client-side i18n URLconf.
@@ -155,8 +155,12 @@ horizon.network_topology = {
       self.force.size([width, height]).resume();
     });
 
-    angular.element('#networktopology').on('change', function() {
-      self.retrieve_network_info(true);
+    angular.element('#networktopology').on('change', function(e, delta) {
+      if (delta) {
+        self.apply_delta(delta);
+      } else {
+        self.retrieve_network_info(true);
+      }
     });
 
     // register for message notifications
@@ -186,6 +190,58 @@ horizon.network_topology = {
     }
   },
 
+  // Update the nodes and links of a delta of the loader, leaving the rest
+  // of the graph where it is
+  apply_delta: function(delta) {
+    var self = this;
+    var changed = {networks: [], routers: [], servers: [], ports: []};
+    angular.forEach(delta, function(change, kind) {
+      var changedIds = {};
+      changed[kind] = change.changed;
+      angular.forEach(change.changed, function(node) {
+        changedIds[node.id] = true;
+      });
+      angular.forEach(change.removed, function(node) {
+        if (kind === 'ports') {
+          self.remove_port_link(node);
+        } else if (!changedIds[node.id]) {
+          var obj = self.find_by_id(node.id);
+          if (obj) {
+            self.removeNode(obj.data);
+          }
+          delete self.data[kind][node.id];
+        }
+      });
+    });
+    self.load_topology(changed);
+  },
+
+  // Remove the link drawn for a port that is gone or replaced
+  remove_port_link: function(port) {
+    var self = this;
+    delete self.data.ports[port.id + port.device_id + port.network_id];
+    for (var i = 0; i < self.links.length; i++) {
+      var link = self.links[i];
+      if (link.source.data.id == port.device_id &&
+          link.target.data.id == port.network_id) {
+        var device = link.source.data;
+        var network = link.target.data;
+        if (device.networks) {
+          var index = device.networks.indexOf(network);
+          if (index !== -1) {
+            device.networks.splice(index, 1);
+          }
+        }
+        if (device instanceof Server && network.instances) {
+          network.instances--;
+        }
+        self.removeLink(link);
+        self.force.resume();
+        return;
+      }
+    }
+  },
+
   // Load config from cookie
   load_config: function() {
     var labels = horizon.cookies.get('show_labels');
@@ -12,6 +12,8 @@ horizon.networktopologycommon = {
 horizon.networktopologyloader = {
   // data for the network topology views
   model: null,
+  // version of the topology held by 'model'
+  version: null,
   // timeout length
   reload_duration: 10000,
   // timer controlling update intervals
@@ -30,11 +32,27 @@ horizon.networktopologyloader = {
    */
   update:function() {
     var self = this;
+    var params = {'_': angular.element.now()};
+    if (self.model && self.version) {
+      params.version = self.version;
+    }
+    clearTimeout(self.update_timer);
     angular.element.getJSON(
-      angular.element('#networktopology').data('networktopology') + '?' + angular.element.now(),
+      angular.element('#networktopology').data('networktopology'),
+      params,
       function(data) {
-        self.model = data;
-        $('#networktopology').trigger('change');
+        var delta = null;
+        if (data.changes) {
+          delta = self.apply_changes(data.changes);
+        } else {
+          self.model = data;
+        }
+        self.version = data.version;
+        // Views redraw everything on a change without a delta, and only
+        // update the nodes of the delta otherwise.
+        if (delta === null || !angular.equals(delta, {})) {
+          $('#networktopology').trigger('change', [delta]);
+        }
         self.update_timer = setTimeout(function(){
           self.update();
         }, self.reload_duration);
@@ -42,6 +60,60 @@ horizon.networktopologyloader = {
     );
   },
 
+  /**
+   * key identifying a node among the nodes of its kind, as computed by the
+   * server: gateway ports share the id of their network, and ports without
+   * a device get an empty device id
+   */
+  node_key:function(kind, node) {
+    if (kind === 'ports') {
+      return (node.device_id || '') + ':' + node.id;
+    }
+    return node.id;
+  },
+
+  /**
+   * applies the nodes changed since the version held by 'model'
+   *
+   * @param {Object} changes for each kind of node that changed, the changed
+   * nodes and the keys of all the nodes of that kind, in order
+   *
+   * @return {Object} for each kind of node that changed, the 'changed'
+   * nodes and the previous version of the nodes 'removed' or replaced
+   */
+  apply_changes:function(changes) {
+    var self = this;
+    var delta = {};
+    angular.forEach(changes, function(change, kind) {
+      var nodes = {};
+      var removed = [];
+      angular.forEach(self.model[kind], function(node) {
+        nodes[self.node_key(kind, node)] = node;
+      });
+      angular.forEach(change.changed, function(node) {
+        var key = self.node_key(kind, node);
+        if (nodes[key] !== undefined) {
+          removed.push(nodes[key]);
+        }
+        nodes[key] = node;
+      });
+      var keys = {};
+      angular.forEach(change.keys, function(key) {
+        keys[key] = true;
+      });
+      angular.forEach(self.model[kind], function(node) {
+        if (!keys[self.node_key(kind, node)]) {
+          removed.push(node);
+        }
+      });
+      self.model[kind] = change.keys.map(function(key) {
+        return nodes[key];
+      });
+      delta[kind] = {changed: change.changed, removed: removed};
+    });
+    return delta;
+  },
+
   /**
    * stops the data update sequences
    */
@@ -633,6 +633,36 @@ horizon.datatables.set_table_fixed_filter = function (parent) {
   });
 };
 
+/* Follows the batch actions taken in the background. Their info message
+ * holds the URL reporting their progress, which is polled until the action
+ * finished. The last response carries the messages of the action. */
+horizon.datatables.poll_batch_actions = function () {
+  $('[data-batch-action-status]').each(function () {
+    var $status = $(this);
+    if ($status.data('polling')) { return; }
+    $status.data('polling', true);
+
+    function poll() {
+      horizon.ajax.queue({
+        url: $status.attr('data-batch-action-status'),
+        success: function (data) {
+          if (data.finished) {
+            $status.closest('.alert').remove();
+            return;
+          }
+          $status.find('.batch-action-progress').text(interpolate(
+            gettext('%(done)s of %(total)s done.'), data, true));
+          setTimeout(poll, 2000);
+        },
+        error: function () {
+          $status.closest('.alert').remove();
+        }
+      });
+    }
+    poll();
+  });
+};
+
 horizon.addInitFunction(horizon.datatables.init = function() {
   horizon.datatables.validate_button();
   horizon.datatables.disable_buttons();
@@ -673,4 +703,5 @@ horizon.addInitFunction(horizon.datatables.init = function() {
   });
 
   horizon.datatables.update();
+  horizon.datatables.poll_batch_actions();
 });
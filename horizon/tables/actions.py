@@ -17,13 +17,18 @@ from collections import OrderedDict
 import copy
 import logging
 import types
+import uuid
 import warnings
 
 from django.conf import settings
+from django.contrib.messages import constants
+from django.core.cache import cache
 from django.core import urlresolvers
+from django import http
 from django import shortcuts
 from django.template.loader import render_to_string  # noqa
 from django.utils.functional import Promise  # noqa
+from django.utils.html import format_html
 from django.utils.http import urlencode  # noqa
 from django.utils.translation import pgettext_lazy
 from django.utils.translation import ugettext_lazy as _
@@ -31,6 +36,7 @@ from django.utils.translation import ungettext_lazy
 import six
 
 from horizon import messages
+from horizon.utils import concurrency
 from horizon.utils import functions
 from horizon.utils import html
 
@@ -41,6 +47,44 @@ LOG = logging.getLogger(__name__)
 ACTION_CSS_CLASSES = ()
 STRING_SEPARATOR = "__"
 
+# Seconds during which the progress of a batch action running in the
+# background is kept.
+BATCH_JOB_TIMEOUT = 3600
+
+
+def _batch_job_key(job_id):
+    return 'horizon:batch-action:%s' % job_id
+
+
+def _save_batch_job(job_id, job):
+    cache.set(_batch_job_key(job_id), job, BATCH_JOB_TIMEOUT)
+
+
+def get_batch_job(job_id):
+    """Returns the progress of the batch action running as ``job_id``.
+
+    It is a dictionary with the ``user_id`` who took the action, the
+    ``total`` number of objects, the number of objects ``done`` and of those
+    that ``failed``, whether the action ``finished`` and, once it did, the
+    ``(level, message)`` summing it up in ``messages``. ``None`` is returned
+    for unknown or expired jobs.
+    """
+    return cache.get(_batch_job_key(job_id))
+
+
+def delete_batch_job(job_id):
+    cache.delete(_batch_job_key(job_id))
+
+
+def _detached_request(request):
+    """Returns a new request holding a copy of the user and session of
+    ``request``, i.e. the token, region and project the API calls need.
+    """
+    detached = http.HttpRequest()
+    detached.user = copy.copy(request.user)
+    detached.session = dict(request.session.items())
+    return detached
+
 
 class BaseActionMetaClass(type):
     """Metaclass for adding all actions options from inheritance tree
@@ -670,9 +714,35 @@ class BatchAction(Action):
 
        Optional message for providing an appropriate help text for
        the horizon user.
+
+    .. attribute:: concurrent_actions
+
+       Set to ``True`` to call ``action`` on the selected objects
+       concurrently, at most ``max_workers`` at a time. ``update`` and the
+       messages still follow the order of the selection. Only enable it when
+       ``action`` does not depend on state set by ``allowed`` or by the
+       action on another object. Defaults to ``False``.
+
+    .. attribute:: max_workers
+
+       Number of threads taking a concurrent action. Defaults to 10.
+
+    .. attribute:: asynchronous
+
+       Set to ``True`` to take the action in the background when several
+       objects are selected. The user is redirected at once, and the progress
+       of the action is polled from the ``horizon:batch_action_status`` view,
+       which also delivers the final messages. The progress is kept in the
+       Django cache, which must be shared by the dashboard processes. The
+       background ``action`` is called on a copy of the batch action that
+       has no ``table``, with a request only carrying the user and session,
+       and ``update`` is not called. Defaults to ``False``.
     """
 
     help_text = _("This action cannot be undone.")
+    concurrent_actions = False
+    max_workers = concurrency.DEFAULT_MAX_WORKERS
+    asynchronous = False
 
     def __init__(self, **kwargs):
         super(BatchAction, self).__init__(**kwargs)
@@ -824,9 +894,36 @@ class BatchAction(Action):
         attrs.update({'data-batch-action': 'true'})
         return attrs
 
-    def handle(self, table, request, obj_ids):
-        action_success = []
-        action_failure = []
+    def _call_action(self, request, datum_id):
+        """Calls ``action`` on one object and returns the raised exception,
+        or ``None`` when it succeeded.
+        """
+        try:
+            self.action(request, datum_id)
+        except Exception as ex:
+            return ex
+
+    def _call_actions(self, request, datum_ids):
+        """Calls ``action`` on every object and yields the outcome of each
+        call (see ``_call_action``), in the order of ``datum_ids``.
+        """
+        if not self.concurrent_actions or len(datum_ids) < 2:
+            for datum_id in datum_ids:
+                yield self._call_action(request, datum_id)
+            return
+        executor = concurrency.get_executor(
+            'batch_actions:%d' % self.max_workers, self.max_workers)
+        pending = [concurrency.submit(executor, self._call_action, request,
+                                      datum_id)
+                   for datum_id in datum_ids]
+        for future in pending:
+            yield future.result()
+
+    def _filter_objects(self, table, request, obj_ids):
+        """Returns the ``(id, datum, display)`` of the objects the action is
+        allowed on, and the display of the others.
+        """
+        allowed = []
         action_not_allowed = []
         for datum_id in obj_ids:
             datum = table.get_object_by_id(datum_id)
@@ -838,15 +935,30 @@ class BatchAction(Action):
                     'dis': datum_display
                 })
                 continue
-            try:
-                self.action(request, datum_id)
-                # Call update to invoke changes if needed
-                self.update(request, datum)
+            allowed.append((datum_id, datum, datum_display))
+        return allowed, action_not_allowed
+
+    def _run(self, request, allowed, progress=None):
+        """Takes the action on the ``allowed`` objects.
+
+        Returns the display of the objects the action succeeded and failed
+        on. ``progress`` is called with both lists after each object.
+        """
+        action_success = []
+        action_failure = []
+        outcomes = self._call_actions(
+            request, [datum_id for datum_id, datum, display in allowed])
+        for (datum_id, datum, datum_display), ex in zip(allowed, outcomes):
+            if ex is None:
+                # Call update to invoke changes if needed. Objects are not
+                # kept for actions taken in the background.
+                if datum is not None:
+                    self.update(request, datum)
                 action_success.append(datum_display)
                 self.success_ids.append(datum_id)
                 LOG.info(u'%s: "%s"' %
                          (self._get_action_name(past=True), datum_display))
-            except Exception as ex:
+            else:
                 # Handle the exception but silence it since we'll display
                 # an aggregate error message later. Otherwise we'd get
                 # multiple error messages displayed to the user.
@@ -856,28 +968,96 @@ class BatchAction(Action):
                 LOG.warning(
                     'Action %(action)s Failed for %(reason)s', {
                         'action': action_description, 'reason': ex})
-
+            if progress is not None:
+                progress(action_success, action_failure)
+        return action_success, action_failure
+
+    def _get_messages(self, action_not_allowed, action_success,
+                      action_failure):
+        """Returns the ``(level, message)`` summing up the action."""
+        result = []
         # Begin with success message class, downgrade to info if problems.
-        success_message_level = messages.success
+        success_message_level = constants.SUCCESS
         if action_not_allowed:
             msg = _('You are not allowed to %(action)s: %(objs)s')
             params = {"action":
                       self._get_action_name(action_not_allowed).lower(),
                       "objs": functions.lazy_join(", ", action_not_allowed)}
-            messages.error(request, msg % params)
-            success_message_level = messages.info
+            result.append((constants.ERROR, msg % params))
+            success_message_level = constants.INFO
         if action_failure:
             msg = _('Unable to %(action)s: %(objs)s')
             params = {"action": self._get_action_name(action_failure).lower(),
                       "objs": functions.lazy_join(", ", action_failure)}
-            messages.error(request, msg % params)
-            success_message_level = messages.info
+            result.append((constants.ERROR, msg % params))
+            success_message_level = constants.INFO
         if action_success:
             msg = _('%(action)s: %(objs)s')
             params = {"action":
                       self._get_action_name(action_success, past=True),
                       "objs": functions.lazy_join(", ", action_success)}
-            success_message_level(request, msg % params)
+            result.append((success_message_level, msg % params))
+        return result
+
+    def _run_job(self, request, job_id, job, allowed, action_not_allowed):
+        def progress(action_success, action_failure):
+            job['done'] = len(action_success) + len(action_failure)
+            job['failed'] = len(action_failure)
+            _save_batch_job(job_id, job)
+
+        try:
+            action_success, action_failure = self._run(request, allowed,
+                                                       progress)
+        except Exception:
+            LOG.exception('Batch action %s failed', self.name)
+            action_success, action_failure = [], [
+                display for datum_id, datum, display in allowed]
+        job['messages'] = [
+            (level, six.text_type(message))
+            for level, message in self._get_messages(
+                action_not_allowed, action_success, action_failure)]
+        job['finished'] = True
+        _save_batch_job(job_id, job)
+
+    def _handle_async(self, request, allowed, action_not_allowed):
+        job_id = uuid.uuid4().hex
+        job = {'user_id': request.user.id, 'total': len(allowed), 'done': 0,
+               'failed': 0, 'finished': False, 'messages': []}
+        _save_batch_job(job_id, job)
+        # The job outlives the response: it must not hold the request, the
+        # table or its data, only copies of what the action needs.
+        action = copy.copy(self)
+        action.table = None
+        action.datum = None
+        action.success_ids = []
+        objects = [(datum_id, None, six.text_type(datum_display))
+                   for datum_id, datum, datum_display in allowed]
+        not_allowed = [six.text_type(datum_display)
+                       for datum_display in action_not_allowed]
+        concurrency.submit(concurrency.get_executor('batch_jobs'),
+                           action._run_job, _detached_request(request),
+                           job_id, job, objects, not_allowed)
+        msg = _('%(action)s: %(count)d in progress.') % {
+            "action": self._get_action_name(allowed),
+            "count": len(allowed)}
+        messages.info(request, format_html(
+            '<span data-batch-action-status="{0}">{1} '
+            '<span class="batch-action-progress"></span></span>',
+            urlresolvers.reverse('horizon:batch_action_status',
+                                 args=[job_id]),
+            msg))
+        return shortcuts.redirect(self.get_success_url(request))
+
+    def handle(self, table, request, obj_ids):
+        allowed, action_not_allowed = self._filter_objects(table, request,
+                                                           obj_ids)
+        if self.asynchronous and len(allowed) > 1:
+            return self._handle_async(request, allowed, action_not_allowed)
+
+        action_success, action_failure = self._run(request, allowed)
+        for level, message in self._get_messages(
+                action_not_allowed, action_success, action_failure):
+            messages.add_message(request, level, message)
 
         return shortcuts.redirect(self.get_success_url(request))
 
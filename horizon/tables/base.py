@@ -28,6 +28,7 @@ from django import template
 from django.template.defaultfilters import slugify  # noqa
 from django.template.defaultfilters import truncatechars  # noqa
 from django.template.loader import render_to_string
+from django.utils.html import conditional_escape
 from django.utils.html import escape
 from django.utils import http
 from django.utils.http import urlencode
@@ -42,12 +43,22 @@ from horizon.forms import ThemableCheckboxInput
 from horizon import messages
 from horizon.tables.actions import FilterAction  # noqa
 from horizon.tables.actions import LinkAction  # noqa
+from horizon.utils import functions
 from horizon.utils import html
 
 
 LOG = logging.getLogger(__name__)
 PALETTE = termcolors.PALETTES[termcolors.DEFAULT_PALETTE]
 STRING_SEPARATOR = "__"
+# Object id reversed in place of the real ones to build the link templates
+# of tables with compiled rows; it has to match the usual id patterns.
+LINK_ID_PLACEHOLDER = "0123456789abcdef0123456789abcdef"
+# Characters left unquoted in object ids, as done by ``reverse``.
+LINK_ID_SAFE = http.RFC3986_SUBDELIMS + '/~:@'
+
+# What to ask the API for to get the current page of a table.
+PageQuery = collections.namedtuple('PageQuery', [
+    'marker', 'limit', 'sort_key', 'sort_dir', 'reversed_order', 'filters'])
 
 
 @six.python_2_unicode_compatible
@@ -360,7 +371,7 @@ class Column(html.HTMLElement):
         else:
             # Basic object lookups
             data = getattr(datum, self.transform, None)
-            if data is None:
+            if data is None and LOG.isEnabledFor(logging.DEBUG):
                 msg = _("The attribute %(attr)s doesn't exist on "
                         "%(obj)s.") % {'attr': self.transform, 'obj': datum}
                 msg = termcolors.colorize(msg, **PALETTE['ERROR'])
@@ -430,6 +441,10 @@ class Column(html.HTMLElement):
         obj_id = self.table.get_object_id(datum)
         if callable(self.link):
             return self.link(datum)
+        if self.table._meta.compiled_rows:
+            link_template = self.table.get_link_template(self)
+            if link_template is not None:
+                return link_template % http.urlquote(obj_id, LINK_ID_SAFE)
         try:
             return urlresolvers.reverse(self.link, args=(obj_id,))
         except urlresolvers.NoReverseMatch:
@@ -619,6 +634,9 @@ class Row(html.HTMLElement):
             return ''
 
     def render(self):
+        if self.table._meta.compiled_rows:
+            cells = u"".join(cell.render() for cell in self)
+            return mark_safe(u"<tr%s>%s</tr>" % (self.attr_string, cells))
         return render_to_string("horizon/common/_data_table_row.html",
                                 {"row": self})
 
@@ -773,9 +791,10 @@ class Cell(html.HTMLElement):
     @property
     def url(self):
         if self.column.link:
-            url = self.column.get_link_url(self.datum)
-            if url:
-                return url
+            if not hasattr(self, '_url'):
+                self._url = self.column.get_link_url(self.datum)
+            if self._url:
+                return self._url
         else:
             return None
 
@@ -845,6 +864,12 @@ class Cell(html.HTMLElement):
                                           self)
 
     def render(self):
+        if (self.column.table._meta.compiled_rows and
+                not self.inline_edit_available and not self.inline_edit_mod):
+            value = conditional_escape(self.value)
+            if self.wrap_list:
+                value = u"<ul>%s</ul>" % value
+            return mark_safe(u"<td%s>%s</td>" % (self.attr_string, value))
         return render_to_string("horizon/common/_data_table_cell.html",
                                 {"cell": self})
 
@@ -1007,6 +1032,56 @@ class DataTableOptions(object):
 
         A list of permission names which this table requires in order to be
         displayed. Defaults to an empty list (``[]``).
+
+    .. attribute:: api_pagination
+
+        Boolean to indicate that the API returns the data of the table one
+        page at a time, sorted and filtered. The view gets the page described
+        by :meth:`~horizon.tables.DataTable.get_page_query` from the API and
+        the data is not filtered again in Python, except on filter fields the
+        API does not support. Default: ``False``.
+
+    .. attribute:: api_sort_keys
+
+        A dictionary mapping the names of the columns the API can sort on to
+        the matching API sort keys. Default: ``{}``.
+
+    .. attribute:: default_sort_key
+
+        The API sort key used when the request does not ask for a sortable
+        column. Default: ``None``, which leaves the API order.
+
+    .. attribute:: default_sort_dir
+
+        The sort direction used when the request does not ask for one, either
+        ``"asc"`` or ``"desc"``. Default: ``"desc"``.
+
+    .. attribute:: sort_key_param
+
+        The name of the query string parameter holding the column to sort
+        on. Default: ``"sort_key"``.
+
+    .. attribute:: sort_dir_param
+
+        The name of the query string parameter holding the sort direction.
+        Default: ``"sort_dir"``.
+
+    .. attribute:: compiled_rows
+
+        Boolean to render the rows without going through the Django template
+        engine for every row and cell. Link URLs are built from a template
+        reversed once per column, and the row actions templates are loaded
+        and given the context processors output once per table. Cells being
+        edited inline are still rendered from their template.
+        Default: ``False``.
+
+    .. attribute:: row_actions_allowed_key
+
+        A callable returning, for a data object, a hashable key such that
+        the row actions allowed for an object are also allowed, in the same
+        state, for any object with the same key (its status, for instance).
+        When set, the ``allowed`` method of each row action is only called
+        once per distinct key. Default: ``None``.
     """
     def __init__(self, options):
         self.name = getattr(options, 'name', self.__class__.__name__)
@@ -1033,6 +1108,17 @@ class DataTableOptions(object):
                                        "no_data_message",
                                        _("No items to display."))
         self.permissions = getattr(options, 'permissions', [])
+        self.api_pagination = getattr(options, 'api_pagination', False)
+        self.api_sort_keys = getattr(options, 'api_sort_keys', {})
+        self.default_sort_key = getattr(options, 'default_sort_key', None)
+        self.default_sort_dir = getattr(options, 'default_sort_dir', 'desc')
+        self.sort_key_param = getattr(options, 'sort_key_param', 'sort_key')
+        self.sort_dir_param = getattr(options, 'sort_dir_param', 'sort_dir')
+        self.compiled_rows = getattr(options, 'compiled_rows', False)
+        allowed_key = getattr(options, 'row_actions_allowed_key', None)
+        # Functions set on Meta are unbound methods on Python 2.
+        self.row_actions_allowed_key = getattr(allowed_key, '__func__',
+                                               allowed_key)
 
         # Set self.filter if we have any FilterActions
         filter_actions = [action for action in self.table_actions if
@@ -1170,6 +1256,8 @@ class DataTableMetaclass(type):
         actions_dict = collections.OrderedDict([(action.name, action())
                                                 for action in actions])
         dt_attrs['base_actions'] = actions_dict
+        # Link templates of the compiled rows, shared by the table instances.
+        dt_attrs['_link_templates'] = {}
         if opts._filter_action:
             # Replace our filter action with the instantiated version
             opts._filter_action = actions_dict[opts._filter_action.name]
@@ -1225,6 +1313,8 @@ class DataTable(object):
             columns.append((key, column))
         self.columns = collections.OrderedDict(columns)
         self._populate_data_cache()
+        self._allowed_row_actions = {}
+        self._compiled_templates = {}
 
         # Associate these actions with this table
         for action in self.base_actions.values():
@@ -1270,6 +1360,10 @@ class DataTable(object):
                 valid_method = (request_method == action.method)
                 not_api_filter = (filter_string
                                   and not action.is_api_filter(filter_field))
+                if (self._meta.api_pagination and
+                        action.filter_type == 'server'):
+                    # The API already filtered the page.
+                    valid_method = needs_preloading = False
 
                 if valid_method or needs_preloading or not_api_filter:
                     if self._meta.mixed_data_type:
@@ -1435,16 +1529,40 @@ class DataTable(object):
     def get_row_actions(self, datum):
         """Returns a list of the action instances for a specific row."""
         bound_actions = []
+        allowed_key = None
+        if self._meta.row_actions_allowed_key is not None:
+            allowed_key = self._meta.row_actions_allowed_key(datum)
         for action in self._meta.row_actions:
-            # Copy to allow modifying properties per row
-            bound_action = copy.copy(self.base_actions[action.name])
-            bound_action.attrs = copy.copy(bound_action.attrs)
-            bound_action.datum = datum
-            # Remove disallowed actions.
-            if not self._filter_action(bound_action,
-                                       self.request,
-                                       datum):
-                continue
+            bound_action = None
+            if allowed_key is not None:
+                shared_action = self._allowed_row_actions.get((action.name,
+                                                               allowed_key))
+                if shared_action is False:
+                    continue
+                if shared_action is not None:
+                    bound_action = copy.copy(shared_action)
+                    bound_action.attrs = copy.copy(shared_action.attrs)
+                    bound_action.datum = datum
+            if bound_action is None:
+                # Copy to allow modifying properties per row
+                bound_action = copy.copy(self.base_actions[action.name])
+                bound_action.attrs = copy.copy(bound_action.attrs)
+                bound_action.datum = datum
+                allowed = self._filter_action(bound_action,
+                                              self.request,
+                                              datum)
+                if allowed_key is not None:
+                    # Rows with the same key reuse the action as left by
+                    # allowed(), which may have changed its state.
+                    shared_action = False
+                    if allowed:
+                        shared_action = copy.copy(bound_action)
+                        shared_action.attrs = copy.copy(bound_action.attrs)
+                    self._allowed_row_actions[(action.name,
+                                               allowed_key)] = shared_action
+                # Remove disallowed actions.
+                if not allowed:
+                    continue
             # Hook for modifying actions based on data. No-op by default.
             bound_action.update(self.request, datum)
             # Pre-create the URL for this link with appropriate parameters
@@ -1496,13 +1614,50 @@ class DataTable(object):
         else:
             template_path = self._meta.row_actions_dropdown_template
 
-        row_actions_template = template.loader.get_template(template_path)
         bound_actions = self.get_row_actions(datum)
         extra_context = {"row_actions": bound_actions,
                          "row_id": self.get_object_id(datum)}
+        if self._meta.compiled_rows:
+            return self._render_compiled(template_path, extra_context)
+        row_actions_template = template.loader.get_template(template_path)
         context = template.RequestContext(self.request, extra_context)
         return row_actions_template.render(context)
 
+    def _render_compiled(self, template_path, extra_context):
+        # The template is loaded and the context processors are run once per
+        # table instead of once per row.
+        if template_path not in self._compiled_templates:
+            compiled_template = template.loader.get_template(template_path)
+            context = template.RequestContext(self.request)
+            with context.bind_template(compiled_template.template):
+                base_context = context.flatten()
+            self._compiled_templates[template_path] = (compiled_template,
+                                                       base_context)
+        compiled_template, base_context = \
+            self._compiled_templates[template_path]
+        return compiled_template.render(dict(base_context, **extra_context))
+
+    def get_link_template(self, column):
+        """Returns the link URL template of ``column`` for compiled rows.
+
+        The template has a ``%s`` in place of the object id, or is ``None``
+        when the column link cannot be reversed ahead of time.
+        """
+        key = (column.name, urlresolvers.get_script_prefix())
+        if key not in self._link_templates:
+            try:
+                url = urlresolvers.reverse(column.link,
+                                           args=(LINK_ID_PLACEHOLDER,))
+            except urlresolvers.NoReverseMatch:
+                url = None
+            if url is not None and url.count(LINK_ID_PLACEHOLDER) == 1:
+                url = url.replace('%', '%%').replace(LINK_ID_PLACEHOLDER,
+                                                     '%s')
+            else:
+                url = None
+            self._link_templates[key] = url
+        return self._link_templates[key]
+
     @staticmethod
     def parse_action(action_string):
         """Parses the ``action`` parameter (a string) sent back with the
@@ -1778,13 +1933,63 @@ class DataTable(object):
         to the previous page.
         """
         return "=".join([self._meta.prev_pagination_param,
-                         self.get_prev_marker()])
+                         self.get_prev_marker()]) + self._get_sort_string()
 
     def get_pagination_string(self):
         """Returns the query parameter string to paginate this table
         to the next page.
         """
-        return "=".join([self._meta.pagination_param, self.get_marker()])
+        return "=".join([self._meta.pagination_param,
+                         self.get_marker()]) + self._get_sort_string()
+
+    def _get_sort_string(self):
+        # Keep the sorting asked for by the request on the other pages.
+        params = [(param, self.request.GET[param])
+                  for param in (self._meta.sort_key_param,
+                                self._meta.sort_dir_param)
+                  if self._meta.api_pagination and self.request.GET.get(param)]
+        return "&" + urlencode(params) if params else ""
+
+    def get_page_query(self):
+        """Returns the :class:`PageQuery` of the page asked for by the request.
+
+        The query holds the ``marker`` of the page and its ``limit``, the
+        user page size. When paginating backward, the marker is the first
+        object of the page following the one asked for and
+        ``reversed_order`` is set: the API has to be asked for the data in
+        the reverse order, and the data returned in the usual order.
+
+        The ``sort_key`` is the API sort key of the column named by the
+        sort key parameter if the API can sort on it, or the table default
+        one. The ``filters`` map the field of the server filter to the
+        filter string when it is an API filter.
+        """
+        meta = self._meta
+        marker = self.request.GET.get(meta.prev_pagination_param)
+        reversed_order = bool(marker)
+        if not reversed_order:
+            marker = self.request.GET.get(meta.pagination_param)
+
+        sort_key = meta.api_sort_keys.get(
+            self.request.GET.get(meta.sort_key_param), meta.default_sort_key)
+        sort_dir = self.request.GET.get(meta.sort_dir_param)
+        if sort_dir not in ('asc', 'desc'):
+            sort_dir = meta.default_sort_dir
+
+        filters = {}
+        action = meta._filter_action
+        if meta.filter and action and action.filter_type == 'server':
+            filter_field = self.get_filter_field()
+            filter_string = self.get_filter_string().strip()
+            if filter_string and action.is_api_filter(filter_field):
+                filters[filter_field] = filter_string
+
+        return PageQuery(marker=marker or None,
+                         limit=functions.get_page_size(self.request),
+                         sort_key=sort_key,
+                         sort_dir=sort_dir,
+                         reversed_order=reversed_order,
+                         filters=filters)
 
     def calculate_row_status(self, statuses):
         """Returns a boolean value determining the overall row status
@@ -13,35 +13,55 @@
 #    under the License.
 
 from collections import defaultdict
+from collections import OrderedDict
+import functools
 
+from django import http
 from django import shortcuts
 
+from horizon.decorators import require_auth
+from horizon import messages
+from horizon.tables import actions
+from horizon.utils import concurrency
 from horizon import views
 
 from horizon.templatetags.horizon import has_permissions  # noqa
 
 
 class MultiTableMixin(object):
-    """A generic mixin which provides methods for handling DataTables."""
+    """A generic mixin which provides methods for handling DataTables.
+
+    Setting ``concurrent_data_loading`` to ``True`` calls the data methods
+    of the different tables concurrently. Only enable it when those methods
+    are independent of each other.
+    """
     data_method_pattern = "get_%s_data"
+    concurrent_data_loading = False
 
     def __init__(self, *args, **kwargs):
         super(MultiTableMixin, self).__init__(*args, **kwargs)
         self.table_classes = getattr(self, "table_classes", [])
         self._data = {}
+        self.data_timings = {}
         self._tables = {}
         self._data_methods = defaultdict(list)
         self.get_data_methods(self.table_classes, self._data_methods)
 
+    def _load_table_data(self, name):
+        data = []
+        for func in self._data_methods.get(name, []):
+            data.extend(func())
+        return data
+
     def _get_data_dict(self):
         if not self._data:
-            for table in self.table_classes:
-                data = []
-                name = table._meta.name
-                func_list = self._data_methods.get(name, [])
-                for func in func_list:
-                    data.extend(func())
-                self._data[name] = data
+            loaders = OrderedDict(
+                (table._meta.name,
+                 functools.partial(self._load_table_data, table._meta.name))
+                for table in self.table_classes)
+            self._data, self.data_timings = concurrency.load_all(
+                loaders, concurrent=self.concurrent_data_loading,
+                name='tables')
         return self._data
 
     def get_data_methods(self, table_classes, methods):
@@ -236,10 +256,16 @@ class DataTableView(MultiTableView):
     table; and specify a template for the ``template_name`` attribute.
 
     Optionally, you can override the ``has_more_data`` method to trigger
-    pagination handling for APIs that support it.
+    pagination handling for APIs that support it. Tables with the
+    ``api_pagination`` option define a ``get_page`` method instead of
+    ``get_data``, which is given the table
+    :meth:`~horizon.tables.DataTable.get_page_query` and returns the page
+    along with whether there are more and previous pages.
     """
     table_class = None
     context_object_name = 'table'
+    _has_more_data = False
+    _has_prev_data = False
 
     def _get_data_dict(self):
         if not self._data:
@@ -248,7 +274,24 @@ class DataTableView(MultiTableView):
         return self._data
 
     def get_data(self):
-        return []
+        table = self.get_table()
+        if not table._meta.api_pagination:
+            return []
+        data, self._has_more_data, self._has_prev_data = self.get_page(
+            table.get_page_query())
+        return data
+
+    def get_page(self, query):
+        """Returns the page of data described by ``query``, whether there is
+        a next page and whether there is a previous one.
+        """
+        return [], False, False
+
+    def has_more_data(self, table):
+        return self._has_more_data
+
+    def has_prev_data(self, table):
+        return self._has_prev_data
 
     def get_tables(self):
         if not self._tables:
@@ -355,3 +398,21 @@ class MixedDataTableView(DataTableView):
                                  'in table %s to use MixedDataTableView.'
                                  % self.table._meta.name)
         return self.table
+
+
+@require_auth
+def batch_action_status(request, job_id):
+    """Returns the progress of a batch action running in the background.
+
+    Once the action finished, its messages are added to the response and
+    the progress is forgotten.
+    """
+    job = actions.get_batch_job(job_id)
+    if job is None or job['user_id'] != request.user.id:
+        raise http.Http404()
+    if job['finished']:
+        for level, message in job['messages']:
+            messages.add_message(request, level, message)
+        actions.delete_batch_job(job_id)
+    return http.JsonResponse(dict((key, job[key]) for key in
+                                  ('total', 'done', 'failed', 'finished')))
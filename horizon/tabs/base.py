@@ -13,6 +13,8 @@
 #    under the License.
 
 from collections import OrderedDict
+import functools
+import logging
 import sys
 
 import six
@@ -21,8 +23,11 @@ from django.template.loader import render_to_string
 from django.template import TemplateSyntaxError  # noqa
 
 from horizon import exceptions
+from horizon.utils import concurrency
 from horizon.utils import html
 
+LOG = logging.getLogger(__name__)
+
 SEPARATOR = "__"
 CSS_TAB_GROUP_CLASSES = ["nav", "nav-tabs", "ajax-tabs"]
 CSS_ACTIVE_TAB_CLASSES = ["active"]
@@ -77,12 +82,19 @@ class TabGroup(html.HTMLElement):
         Read-only property which is set to the value of the current active tab.
         This may not be the same as the value of ``selected`` if no
         specific tab was requested via the ``GET`` parameter.
+
+    .. attribute:: concurrent_data_loading
+
+        Boolean to control whether the data of the preloaded tabs is loaded
+        concurrently rather than one tab after another. Only enable it when
+        the tabs do not depend on each other. Default: ``False``
     """
     slug = None
     template_name = "horizon/common/_tab_group.html"
     param_name = 'tab'
     sticky = False
     show_single_tab = False
+    concurrent_data_loading = False
     _selected = None
     _active = None
 
@@ -105,6 +117,7 @@ class TabGroup(html.HTMLElement):
         self.request = request
         self.kwargs = kwargs
         self._data = None
+        self.data_timings = {}
         tab_instances = []
         for tab in self.tabs:
             tab_instances.append((tab.slug, tab(self, request)))
@@ -117,15 +130,32 @@ class TabGroup(html.HTMLElement):
     def __repr__(self):
         return "<%s: %s>" % (self.__class__.__name__, self.slug)
 
+    def _load_tab(self, tab):
+        # Failures are returned rather than handled here so that
+        # exceptions.handle() always runs on the request thread.
+        try:
+            tab._data = tab.get_context_data(self.request)
+        except Exception:
+            tab._data = False
+            return sys.exc_info()
+
     def load_tab_data(self):
         """Preload all data that for the tabs that will be displayed."""
-        for tab in self._tabs.values():
-            if tab.load and not tab.data_loaded:
-                try:
-                    tab._data = tab.get_context_data(self.request)
-                except Exception:
-                    tab._data = False
-                    exceptions.handle(self.request)
+        loaders = OrderedDict(
+            (slug, functools.partial(self._load_tab, tab))
+            for slug, tab in self._tabs.items()
+            if tab.load and not tab.data_loaded)
+        results, self.data_timings = concurrency.load_all(
+            loaders, concurrent=self.concurrent_data_loading, name='tabs')
+        for slug, exc_info in results.items():
+            if exc_info is None:
+                continue
+            LOG.error('Loading tab %s of %s failed: %s',
+                      slug, self.slug, exc_info[1])
+            try:
+                six.reraise(*exc_info)
+            except Exception:
+                exceptions.handle(self.request)
 
     def get_id(self):
         """Returns the id for this tab group. Defaults to the value of the tab
@@ -415,8 +445,14 @@ class TableTab(Tab):
         :class:`~horizon.tables.MultiTableView`. For each table class you
         need to define a corresponding ``get_{{ table_name }}_data`` method
         as with :class:`~horizon.tables.MultiTableView`.
+
+    .. attribute:: concurrent_data_loading
+
+        Boolean to control whether the ``get_{{ table_name }}_data`` methods
+        are called concurrently. Default: ``False``
     """
     table_classes = None
+    concurrent_data_loading = False
 
     def __init__(self, tab_group, request):
         super(TableTab, self).__init__(tab_group, request)
@@ -430,6 +466,7 @@ class TableTab(Tab):
                            for table in self.table_classes]
         self._tables = OrderedDict(table_instances)
         self._table_data_loaded = False
+        self.data_timings = {}
 
     def load_table_data(self):
         """Calls the ``get_{{ table_name }}_data`` methods for each table class
@@ -437,7 +474,8 @@ class TableTab(Tab):
         """
         # We only want the data to be loaded once, so we track if we have...
         if not self._table_data_loaded:
-            for table_name, table in self._tables.items():
+            loaders = OrderedDict()
+            for table_name in self._tables:
                 # Fetch the data function.
                 func_name = "get_%s_data" % table_name
                 data_func = getattr(self, func_name, None)
@@ -447,9 +485,14 @@ class TableTab(Tab):
                         "You must define a %(func_name)s method on"
                         " %(cls_name)s."
                         % {'func_name': func_name, 'cls_name': cls_name})
+                loaders[table_name] = data_func
 
-                # Load the data.
-                table.data = data_func()
+            # Load the data.
+            data, self.data_timings = concurrency.load_all(
+                loaders, concurrent=self.concurrent_data_loading,
+                name='tables')
+            for table_name, table in self._tables.items():
+                table.data = data[table_name]
                 table._meta.has_prev_data = self.has_prev_data(table)
                 table._meta.has_more_data = self.has_more_data(table)
             # Mark our data as loaded so we don't run the loaders again.
@@ -15,6 +15,12 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+from operator import attrgetter
+import re
+
+from concurrent import futures
+from django.core import urlresolvers
 from django.core.urlresolvers import reverse
 from django import forms
 from django import http
@@ -22,13 +28,17 @@ from django import shortcuts
 from django.template import defaultfilters
 from django.utils.translation import ungettext_lazy
 
+import mock
 from mox3.mox import IsA  # noqa
 import six
 
 from horizon import tables
+from horizon.tables import actions as table_actions
+from horizon.tables import base as table_base
 from horizon.tables import formset as table_formset
 from horizon.tables import views as table_views
 from horizon.test import helpers as test
+from horizon.utils import concurrency
 
 
 class FakeObject(object):
@@ -152,6 +162,29 @@ class MyBatchAction(tables.BatchAction):
         )
 
 
+class MyConcurrentBatchAction(MyBatchAction):
+    name = "concurrent_batch"
+    concurrent_actions = True
+    max_workers = 2
+
+    def action(self, request, object_id):
+        if object_id == '2':
+            raise Exception('Object 2 cannot be batched.')
+
+
+class MyAsynchronousBatchAction(MyConcurrentBatchAction):
+    name = "asynchronous_batch"
+    asynchronous = True
+
+    def __init__(self, **kwargs):
+        super(MyAsynchronousBatchAction, self).__init__(**kwargs)
+        self.calls = []
+
+    def action(self, request, object_id):
+        self.calls.append((request, self.table))
+        super(MyAsynchronousBatchAction, self).action(request, object_id)
+
+
 class MyBatchActionWithHelpText(MyBatchAction):
     name = "batch_help"
     help_text = "this is help."
@@ -319,6 +352,29 @@ class MyServerFilterTable(MyTable):
                        MyBatchActionWithHelpText)
 
 
+class MyCompiledTable(tables.DataTable):
+    name = tables.Column('name', link='horizon:objects:detail')
+    value = tables.Column('value')
+    status = tables.Column('status')
+
+    class Meta(object):
+        name = "compiled_table"
+        status_columns = ["status"]
+        row_actions = (MyAction, MyToggleAction)
+        compiled_rows = True
+        row_actions_allowed_key = attrgetter('status')
+
+
+class MyPagedTable(MyTable):
+    class Meta(object):
+        name = "my_table"
+        columns = ('id', 'name', 'value', 'status')
+        table_actions = (MyServerFilterAction,)
+        api_pagination = True
+        api_sort_keys = {'name': 'display_name'}
+        default_sort_dir = 'asc'
+
+
 class MyTableSelectable(MyTable):
     class Meta(object):
         name = "my_table"
@@ -614,6 +670,42 @@ class DataTableTests(test.TestCase):
         self.assertEqual('status_up',
                          row.cells['status'].get_status_class(cell_status))
 
+    def test_compiled_rows(self):
+        MyCompiledTable._link_templates.clear()
+        self.table = MyCompiledTable(self.request, TEST_DATA)
+        url = '/objects/%s/' % table_base.LINK_ID_PLACEHOLDER
+        with mock.patch.object(urlresolvers, 'reverse',
+                               return_value=url) as reverse:
+            rows = [row.render() for row in self.table.get_rows()]
+        # The link is reversed once for all the rows.
+        reverse.assert_called_once_with(
+            'horizon:objects:detail',
+            args=(table_base.LINK_ID_PLACEHOLDER,))
+        self.assertTrue(rows[0].startswith('<tr'))
+        self.assertIn('id="compiled_table__row__1"', rows[0])
+        self.assertIn('<a href="/objects/1/"', rows[0])
+        self.assertIn('compiled_table__delete__1', rows[0])
+        self.assertIn('&lt;strong&gt;evil&lt;/strong&gt;', rows[1])
+        self.assertNotIn('compiled_table__delete__2', rows[1])
+
+    def test_row_actions_allowed_key(self):
+        self.table = MyCompiledTable(self.request, TEST_DATA)
+        with mock.patch.object(MyAction, 'allowed',
+                               return_value=True) as allowed:
+            for datum in TEST_DATA:
+                self.table.get_row_actions(datum)
+        # The statuses of the test data are up, down, up and üp.
+        self.assertEqual(3, allowed.call_count)
+
+        # Actions shared between rows keep the state set by allowed().
+        self.table = MyCompiledTable(self.request, TEST_DATA)
+        self.table.get_row_actions(TEST_DATA[1])
+        datum = FakeObject('5', 'object_5', 'value_5', 'down')
+        actions = self.table.get_row_actions(datum)
+        self.assertEqual(['toggle'], [action.name for action in actions])
+        self.assertEqual(1, actions[0].current_present_action)
+        self.assertIs(datum, actions[0].datum)
+
     def test_table_column_truncation(self):
         self.table = MyTable(self.request, TEST_DATA_5)
         row = self.table.get_rows()[0]
@@ -1109,6 +1201,37 @@ class DataTableTests(test.TestCase):
                                   u'FakeObject: öbject_4'],
                                  transform=six.text_type)
 
+    def test_page_query(self):
+        req = self.factory.get('/my_url/', {'marker': '2',
+                                            'sort_key': 'name',
+                                            'sort_dir': 'desc'})
+        req.session['my_table__filter__q'] = 'up'
+        req.session['my_table__filter__q_field'] = 'status'
+        self.table = MyPagedTable(req, TEST_DATA)
+        query = self.table.get_page_query()
+        self.assertEqual('2', query.marker)
+        self.assertEqual(20, query.limit)
+        self.assertEqual('display_name', query.sort_key)
+        self.assertEqual('desc', query.sort_dir)
+        self.assertFalse(query.reversed_order)
+        self.assertEqual({'status': 'up'}, query.filters)
+        # The API already filtered the data.
+        self.assertEqual(TEST_DATA, self.table.filtered_data)
+        self.assertEqual('marker=4&sort_key=name&sort_dir=desc',
+                         self.table.get_pagination_string())
+
+        # Unknown sort keys and directions fall back to the defaults.
+        req = self.factory.get('/my_url/', {'prev_marker': '1',
+                                            'sort_key': 'value',
+                                            'sort_dir': 'sideways'})
+        self.table = MyPagedTable(req, TEST_DATA)
+        query = self.table.get_page_query()
+        self.assertEqual('1', query.marker)
+        self.assertIsNone(query.sort_key)
+        self.assertEqual('asc', query.sort_dir)
+        self.assertTrue(query.reversed_order)
+        self.assertEqual({}, query.filters)
+
     def test_inline_edit_update_action_get_non_ajax(self):
         # Non ajax inline edit request should return None.
         url = ('/my_url/?action=cell_update'
@@ -1314,6 +1437,59 @@ class DataTableTests(test.TestCase):
         self.assertEqual(u"Downed Item: 1",
                          list(req._messages)[0].message)
 
+    def test_batch_action_concurrent(self):
+        req = self.factory.post('/my_url/')
+        self.table = MyTable(req, TEST_DATA)
+        action = MyConcurrentBatchAction()
+        action.table = self.table
+
+        handled = action.handle(self.table, req, ['1', '2', '3'])
+        self.assertEqual(302, handled.status_code)
+        self.assertEqual(['1', '3'], action.success_ids)
+        self.assertEqual([u"Unable to batch item: object_2",
+                          u"Batched Items: object_1, object_3"],
+                         [m.message for m in req._messages])
+
+    def test_batch_action_asynchronous(self):
+        req = self.factory.post('/my_url/')
+        self.table = MyTable(req, TEST_DATA)
+        action = MyAsynchronousBatchAction()
+        action.table = self.table
+
+        def run_inline(func, *args, **kwargs):
+            future = futures.Future()
+            future.set_result(func(*args, **kwargs))
+            return future
+
+        executor = mock.Mock(submit=run_inline)
+        with mock.patch.object(concurrency, 'get_executor',
+                               return_value=executor):
+            handled = action.handle(self.table, req, ['1', '2', '3'])
+        self.assertEqual(302, handled.status_code)
+        # The job ran without the live request, table or objects.
+        self.assertEqual([], action.success_ids)
+        self.assertEqual(3, len(action.calls))
+        for request, table in action.calls:
+            self.assertIsNot(req, request)
+            self.assertEqual(req.user.id, request.user.id)
+            self.assertIsNone(table)
+        status_url = re.search(r'data-batch-action-status="([^"]+)"',
+                               list(req._messages)[0].message).group(1)
+        job_id = status_url.rstrip('/').rsplit('/', 1)[1]
+
+        status_req = self.factory.get(
+            status_url, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        status_req.horizon = {'async_messages': []}
+        response = table_views.batch_action_status(status_req, job_id)
+        self.assertEqual({'total': 3, 'done': 3, 'failed': 1,
+                          'finished': True},
+                         json.loads(response.content.decode('utf-8')))
+        self.assertEqual(
+            [['error', u"Unable to batch item: object_2", ''],
+             ['info', u"Batched Items: object_1, object_3", '']],
+            status_req.horizon['async_messages'])
+        self.assertIsNone(table_actions.get_batch_job(job_id))
+
     def test_table_column_can_be_selected(self):
         self.table = MyTableSelectable(self.request, TEST_DATA_6)
         # non selectable row
@@ -1446,6 +1622,10 @@ class MultiTableView(tables.MultiTableView):
         return TEST_DATA
 
 
+class ConcurrentMultiTableView(MultiTableView):
+    concurrent_data_loading = True
+
+
 class DataTableViewTests(test.TestCase):
     def _prepare_view(self, cls, *args, **kwargs):
         req = self.factory.get('/my_url/')
@@ -1489,6 +1669,13 @@ class DataTableViewTests(test.TestCase):
         self.assertEqual(TableWithPermissions,
                          context['table_with_permissions_table'].__class__)
 
+    def test_multi_table_view_concurrent_data_loading(self):
+        view = self._prepare_view(ConcurrentMultiTableView)
+        data = view._get_data_dict()
+        self.assertEqual(['table_with_permissions', 'my_table'], list(data))
+        self.assertEqual(TEST_DATA, data['my_table'])
+        self.assertEqual(TEST_DATA, data['table_with_permissions'])
+
     fil_value_param = "my_table__filter__q"
     fil_field_param = '%s_field' % fil_value_param
 
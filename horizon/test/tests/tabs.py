@@ -15,9 +15,11 @@
 #    under the License.
 
 import copy
+import threading
 
 from django import http
 
+import mock
 import six
 
 from horizon import exceptions
@@ -315,3 +317,23 @@ class TabExceptionTests(test.TestCase):
         req = self.factory.get("/")
         res = view(req)
         self.assertMessageCount(res, error=1)
+
+    def test_tab_view_exception_concurrent_data_loading(self):
+        handled_on = []
+        handle = exceptions.handle
+
+        def record_thread(*args, **kwargs):
+            handled_on.append(threading.current_thread())
+            return handle(*args, **kwargs)
+
+        TabWithTableView.tab_group_class.concurrent_data_loading = True
+        try:
+            with mock.patch.object(exceptions, 'handle', record_thread):
+                view = TabWithTableView.as_view()
+                req = self.factory.get("/")
+                res = view(req)
+        finally:
+            TabWithTableView.tab_group_class.concurrent_data_loading = False
+        self.assertContains(res, "Displaying 4 items", 1)
+        self.assertMessageCount(res, error=1)
+        self.assertEqual([threading.current_thread()], handled_on)
@@ -12,15 +12,23 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import datetime
 import os
+import warnings
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError  # noqa
+from django import http
 import django.template
 from django.template import defaultfilters
+from django.test.utils import override_settings
+import mock
 
 from horizon import forms
 from horizon.test import helpers as test
+from horizon.utils import concurrency
+from horizon.utils import csvbase
 from horizon.utils import filters
 # we have to import the filter in order to register it
 from horizon.utils.filters import parse_isotime  # noqa
@@ -397,6 +405,49 @@ class MemoizedTests(test.TestCase):
             cache_calls(1)
         self.assertEqual(1, len(values_list))
 
+    def test_memoized_evicts_least_recently_used(self):
+        calls = []
+
+        @memoized.memoized(max_entries=2)
+        def cache_calls(value):
+            calls.append(value)
+            return value
+
+        for value in (1, 2, 1, 3, 1, 2):
+            cache_calls(value)
+        # 2 was the least recently used value when 3 was added.
+        self.assertEqual([1, 2, 3, 2], calls)
+
+    def test_memoized_ttl(self):
+        calls = []
+
+        @memoized.memoized(ttl=60)
+        def cache_calls(value):
+            calls.append(value)
+            return value
+
+        with mock.patch.object(memoized.time, 'time', return_value=1000):
+            cache_calls(1)
+            cache_calls(1)
+        with mock.patch.object(memoized.time, 'time', return_value=1059):
+            cache_calls(1)
+        with mock.patch.object(memoized.time, 'time', return_value=1061):
+            cache_calls(1)
+        self.assertEqual([1, 1], calls)
+
+    def test_memoized_size_is_bounded(self):
+        @memoized.memoized
+        def soak(request_id, is_public=True):
+            return request_id
+
+        for request_id in range(100000):
+            soak('req-%d' % request_id, is_public=request_id % 2)
+        name = '%s.soak' % __name__
+        sizes = [size for size in memoized.cache_sizes()
+                 if size['name'] == name]
+        self.assertEqual([memoized.DEFAULT_MAX_ENTRIES],
+                         [size['entries'] for size in sizes])
+
     def test_memoized_with_request_call(self):
 
         chorus = [
@@ -443,6 +494,163 @@ class MemoizedTests(test.TestCase):
             # check that some_other_func returned a memoized list.
             self.assertIs(output1, output2)
 
+    def test_memoized_with_shared_cache(self):
+        cache.clear()
+        calls = []
+
+        @memoized.memoized_with_shared_cache(lambda request: (request.zone,))
+        def shared_func(request, value):
+            calls.append(value)
+            return [value, request.zone]
+
+        def make_request(zone):
+            request = http.HttpRequest()
+            request.zone = zone
+            return request
+
+        request = make_request('a')
+        value = shared_func(request, 1)
+        self.assertIs(value, shared_func(request, 1))
+        # A later request is answered from the shared cache, unless its
+        # namespace differs.
+        self.assertEqual(value, shared_func(make_request('a'), 1))
+        self.assertEqual([2, 'a'], shared_func(make_request('a'), 2))
+        self.assertEqual([1, 'b'], shared_func(make_request('b'), 1))
+        self.assertEqual([1, 2, 1], calls)
+
+        shared_func.invalidate()
+        shared_func(make_request('a'), 1)
+        self.assertEqual([1, 2, 1, 1], calls)
+
+        # Invalidating a namespace keeps the values of the others.
+        shared_func.invalidate(make_request('b'))
+        shared_func(make_request('a'), 1)
+        shared_func(make_request('b'), 1)
+        self.assertEqual([1, 2, 1, 1, 1], calls)
+
+        name = '%s.shared_func' % __name__
+        stats = memoized.shared_cache_stats()[name]
+        self.assertEqual(1, stats['l1_hits'])
+        self.assertEqual(2, stats['l2_hits'])
+        self.assertEqual(5, stats['misses'])
+
+        with override_settings(SHARED_MEMOIZED_TIMEOUTS={name: 0}):
+            shared_func(make_request('c'), 1)
+            shared_func(make_request('c'), 1)
+        self.assertEqual([1, 2, 1, 1, 1, 1, 1], calls)
+
+    def test_memoized_with_shared_cache_unhashable(self):
+        cache.clear()
+        calls = []
+
+        @memoized.memoized_with_shared_cache(lambda request: ())
+        def shared_func(request, values):
+            calls.append(values)
+            return len(values)
+
+        request = http.HttpRequest()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            self.assertEqual(2, shared_func(request, [1, 2]))
+            self.assertEqual(2, shared_func(request, [1, 2]))
+        self.assertEqual([[1, 2], [1, 2]], calls)
+        self.assertEqual([memoized.UnhashableKeyWarning] * 2,
+                         [warning.category for warning in caught])
+
+
+class ConcurrencyTests(test.TestCase):
+    def test_map_bounded_keeps_order(self):
+        results = concurrency.map_bounded(lambda x: x * 2, range(20),
+                                          name='test', max_workers=3)
+        self.assertEqual([x * 2 for x in range(20)], results)
+
+    def test_map_bounded_reraises(self):
+        def fail_on_odd(x):
+            if x % 2:
+                raise ValueError(x)
+            return x
+
+        self.assertRaises(ValueError, concurrency.map_bounded,
+                          fail_on_odd, range(4), name='test')
+
+    def test_get_executor_is_shared(self):
+        self.assertIs(concurrency.get_executor('test'),
+                      concurrency.get_executor('test'))
+
+    def test_load_all_keeps_order(self):
+        loaders = collections.OrderedDict(
+            (name, lambda name=name: name.upper()) for name in 'abcdef')
+        for concurrent in (False, True):
+            results, timings = concurrency.load_all(
+                loaders, concurrent=concurrent, name='test')
+            self.assertEqual(list('abcdef'), list(results))
+            self.assertEqual(list('ABCDEF'), list(results.values()))
+
+    @override_settings(DEBUG=True)
+    def test_load_all_timings(self):
+        loaders = {'a': lambda: 1, 'b': lambda: 2}
+        results, timings = concurrency.load_all(loaders, concurrent=True,
+                                                name='test')
+        self.assertEqual(set(loaders), set(timings))
+
+    def test_load_all_reraises(self):
+        def fail():
+            raise ValueError()
+
+        loaders = collections.OrderedDict([('ok', lambda: 1),
+                                           ('failing', fail)])
+        self.assertRaises(ValueError, concurrency.load_all, loaders,
+                          concurrent=True, name='test')
+
+    def test_load_all_logs_failed_key(self):
+        def fail():
+            raise ValueError('boom')
+
+        loaders = collections.OrderedDict([('ok', lambda: 1),
+                                           ('failing', fail)])
+        for concurrent in (False, True):
+            with mock.patch.object(concurrency.LOG, 'error') as log_error:
+                self.assertRaises(ValueError, concurrency.load_all, loaders,
+                                  concurrent=concurrent, name='test')
+            self.assertEqual(1, log_error.call_count)
+            self.assertIn('failing', log_error.call_args[0])
+
+
+class CsvStreamingResponseTests(test.TestCase):
+    def test_rows_are_streamed(self):
+        consumed = []
+
+        class Response(csvbase.BaseCsvStreamingResponse):
+            columns = ['Name', 'Size']
+
+            def get_row_data(self):
+                for row in (('a', 1), ('b', 2)):
+                    consumed.append(row)
+                    yield row
+
+        response = Response(http.HttpRequest(), None, {}, 'text/csv')
+        self.assertEqual([], consumed)
+        chunks = [chunk.decode('utf-8')
+                  for chunk in response.streaming_content]
+        self.assertEqual(['Name,Size\r\n', 'a,1\r\n', 'b,2\r\n'], chunks)
+
+    def test_failed_rows_end_with_error_row(self):
+        class Response(csvbase.BaseCsvStreamingResponse):
+            columns = ['Name', 'Size']
+            error_message = 'Incomplete'
+
+            def get_row_data(self):
+                yield ('a', 1)
+                raise ValueError()
+
+        response = Response(http.HttpRequest(), None, {}, 'text/csv',
+                            footer_template='_footer.html')
+        chunks = [chunk.decode('utf-8')
+                  for chunk in response.streaming_content]
+        # The footer is not rendered for an incomplete report.
+        self.assertEqual(['Name,Size\r\n', 'a,1\r\n', 'Incomplete,\r\n'],
+                         chunks)
+
 
 class GetPageSizeTests(test.TestCase):
     def test_bad_session_value(self):
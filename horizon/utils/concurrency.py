@@ -0,0 +1,134 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Bounded thread pools for running independent API calls concurrently."""
+
+from collections import OrderedDict
+import logging
+import os
+import threading
+import time
+
+from concurrent import futures
+from django.conf import settings
+from django.utils import timezone
+from django.utils import translation
+
+
+LOG = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_WORKERS = 10
+
+# Executors are keyed by (pid, name) so that a process forked after a pool
+# was created (e.g. a uWSGI worker) starts its own threads.
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name='default', max_workers=DEFAULT_MAX_WORKERS):
+    """Returns the thread pool registered under ``name`` for this process.
+
+    The pool is created on first use with ``max_workers`` threads and then
+    shared by every request served by the process. Code that submits work
+    from inside a pooled call must use a different ``name`` to avoid
+    waiting on itself.
+    """
+    key = (os.getpid(), name)
+    executor = _executors.get(key)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(key)
+            if executor is None:
+                executor = futures.ThreadPoolExecutor(max_workers)
+                _executors[key] = executor
+    return executor
+
+
+def submit(executor, func, *args, **kwargs):
+    """Schedules ``func`` on ``executor`` and returns its future.
+
+    The active translation and time zone of the calling thread are activated
+    for the duration of the call, so messages and dates built by ``func`` are
+    rendered as for the request that scheduled it.
+    """
+    language = translation.get_language()
+    current_timezone = timezone.get_current_timezone()
+
+    def run():
+        with translation.override(language):
+            with timezone.override(current_timezone):
+                return func(*args, **kwargs)
+
+    return executor.submit(run)
+
+
+def map_bounded(func, iterable, name='default',
+                max_workers=DEFAULT_MAX_WORKERS, timeout=None):
+    """Calls ``func`` on every item concurrently and returns the results.
+
+    Results are returned in the order of ``iterable``. The first exception
+    raised by a call (in that order) is re-raised once every call finished,
+    and ``futures.TimeoutError`` is raised if the calls do not complete
+    within ``timeout`` seconds.
+    """
+    executor = get_executor(name, max_workers)
+    pending = [submit(executor, func, item) for item in iterable]
+    futures.wait(pending, timeout=timeout)
+    return [future.result(timeout=0) for future in pending]
+
+
+def load_all(loaders, concurrent=False, name='loaders',
+             max_workers=DEFAULT_MAX_WORKERS):
+    """Calls every loader of the ``loaders`` mapping and returns the results.
+
+    The loaders are called one after another, stopping at the first
+    exception, unless ``concurrent`` is set. Concurrent loaders run on the
+    ``name`` thread pool and the exception of the first failed loader (in
+    ``loaders`` order) is raised on the calling thread once every loader
+    finished. Every failure is logged at error level with its key.
+
+    Returns two ``OrderedDict`` keyed like ``loaders``: the results and,
+    when ``DEBUG`` is enabled, the duration of each loader in seconds.
+    """
+    debug = settings.DEBUG
+    durations = {}
+
+    def timed(key, loader):
+        start = time.time()
+        try:
+            return loader()
+        except Exception as e:
+            LOG.error('Loading %s %s failed: %s', name, key, e)
+            raise
+        finally:
+            if debug:
+                durations[key] = time.time() - start
+
+    results = OrderedDict()
+    if concurrent:
+        executor = get_executor(name, max_workers)
+        pending = OrderedDict((key, submit(executor, timed, key, loader))
+                              for key, loader in loaders.items())
+        futures.wait(pending.values())
+        for key, future in pending.items():
+            results[key] = future.result()
+    else:
+        for key, loader in loaders.items():
+            results[key] = timed(key, loader)
+
+    timings = OrderedDict((key, durations[key])
+                          for key in loaders if key in durations)
+    if timings:
+        LOG.debug('Loaded %s', ', '.join('%s in %.3fs' % item
+                                         for item in timings.items()))
+    return results, timings
@@ -14,16 +14,21 @@ from __future__ import division
 
 from csv import DictWriter  # noqa
 from csv import writer  # noqa
+import logging
 
 
 from django.http import HttpResponse  # noqa
 from django.http import StreamingHttpResponse  # noqa
 from django import template as django_template
+from django.utils.translation import ugettext_lazy as _
 import six
 
 from six import StringIO
 
 
+LOG = logging.getLogger(__name__)
+
+
 class CsvDataMixin(object):
 
     """CSV data Mixin - provides handling for CSV data.
@@ -72,7 +77,11 @@ class CsvDataMixin(object):
 
 class BaseCsvResponse(CsvDataMixin, HttpResponse):
 
-    """Base CSV response class. Provides handling of CSV data."""
+    """Base CSV response class. Provides handling of CSV data.
+
+    A ``footer_template`` rendered after the rows, such as totals of the
+    rows, can be given besides the header ``template``.
+    """
 
     def __init__(self, request, template, context, content_type, **kwargs):
         super(BaseCsvResponse, self).__init__()
@@ -83,9 +92,7 @@ class BaseCsvResponse(CsvDataMixin, HttpResponse):
         self.header = None
         if template:
             # Display some header info if provided as a template
-            header_template = django_template.loader.get_template(template)
-            context = django_template.RequestContext(request, self.context)
-            self.header = header_template.render(context)
+            self.header = render_template(request, template, self.context)
 
         if self.header:
             self.out.write(self.encode(self.header))
@@ -95,6 +102,11 @@ class BaseCsvResponse(CsvDataMixin, HttpResponse):
         for row in self.get_row_data():
             self.write_csv_row(row)
 
+        footer_template = kwargs.get("footer_template")
+        if footer_template:
+            self.out.write(self.encode(
+                render_template(request, footer_template, self.context)))
+
         self.out.flush()
         self.content = self.out.getvalue()
         self.out.close()
@@ -105,20 +117,33 @@ class BaseCsvResponse(CsvDataMixin, HttpResponse):
 
 class BaseCsvStreamingResponse(CsvDataMixin, StreamingHttpResponse):
 
-    """Base CSV Streaming class. Provides streaming response for CSV data."""
+    """Base CSV Streaming class. Provides streaming response for CSV data.
+
+    Rows are sent as ``get_row_data`` yields them. The ``footer_template``
+    is rendered once they were all sent, so it can show what was gathered
+    while producing them.
+
+    Data should be retrieved before the response is created, so that
+    errors are handled as for any other view. As the status of the
+    response is sent with the first rows, an exception raised by
+    ``get_row_data`` ends the report with an ``error_message`` row, without
+    the footer.
+    """
+    error_message = _("Error: the report is incomplete, as the data could "
+                      "not be retrieved.")
 
     def __init__(self, request, template, context, content_type, **kwargs):
         super(BaseCsvStreamingResponse, self).__init__()
         self['Content-Disposition'] = 'attachment; filename="%s"' % (
             kwargs.get("filename", "export.csv"),)
         self['Content-Type'] = content_type
+        self.request = request
         self.context = context
         self.header = None
+        self.footer_template = kwargs.get("footer_template")
         if template:
             # Display some header info if provided as a template
-            header_template = django_template.loader.get_template(template)
-            context = django_template.RequestContext(request, self.context)
-            self.header = header_template.render(context)
+            self.header = render_template(request, template, self.context)
 
         self._closable_objects.append(self.out)
 
@@ -126,6 +151,7 @@ class BaseCsvStreamingResponse(CsvDataMixin, StreamingHttpResponse):
 
     def buffer(self):
         buf = self.out.getvalue()
+        self.out.seek(0)
         self.out.truncate(0)
         return buf
 
@@ -136,9 +162,25 @@ class BaseCsvStreamingResponse(CsvDataMixin, StreamingHttpResponse):
         self.write_csv_header()
         yield self.buffer()
 
-        for row in self.get_row_data():
-            self.write_csv_row(row)
+        try:
+            for row in self.get_row_data():
+                self.write_csv_row(row)
+                yield self.buffer()
+        except Exception:
+            LOG.exception('Unable to stream the rows of a CSV report.')
+            self.write_csv_row([self.error_message])
+            yield self.buffer()
+            return
+
+        if self.footer_template:
+            self.out.write(self.encode(render_template(
+                self.request, self.footer_template, self.context)))
             yield self.buffer()
 
     def get_row_data(self):
         return []
+
+
+def render_template(request, template, context):
+    template = django_template.loader.get_template(template)
+    return template.render(django_template.RequestContext(request, context))
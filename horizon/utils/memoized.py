@@ -12,10 +12,16 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import functools
+import hashlib
+import threading
+import time
 import warnings
 import weakref
 
+from django.conf import settings
+from django.core.cache import cache as shared_cache
 import six
 
 
@@ -46,7 +52,70 @@ def _get_key(args, kwargs, remove_callback):
     return weak_args, weak_kwargs
 
 
-def memoized(func):
+# Number of values a memoized function keeps by default; the least recently
+# used ones are dropped beyond that.
+DEFAULT_MAX_ENTRIES = 1000
+
+# Every cache of a memoized function, for cache_sizes().
+_caches = weakref.WeakSet()
+
+
+class _LRUCache(object):
+    """Values of a memoized function, evicting the least recently used.
+
+    Values older than ``ttl`` seconds, if set, are dropped when looked up.
+    """
+
+    def __init__(self, name, max_entries=None, ttl=None):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        # Reentrant, because the garbage collector may run a weak reference
+        # callback removing an entry while the lock is held.
+        self._lock = threading.RLock()
+        _caches.add(self)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, key):
+        with self._lock:
+            value, expires = self._entries.pop(key)
+            if expires is not None and expires < time.time():
+                raise KeyError(key)
+            # Moved to the end, as the most recently used.
+            self._entries[key] = (value, expires)
+        return value
+
+    def __setitem__(self, key, value):
+        expires = time.time() + self.ttl if self.ttl else None
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, expires)
+            while self.max_entries and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._entries[key]
+
+
+def cache_sizes():
+    """Returns the number of values kept by each memoized function.
+
+    The result is a list of dictionaries with the dotted ``name`` of the
+    function, its number of ``entries`` and its ``max_entries`` and ``ttl``
+    limits, largest caches first.
+    """
+    return sorted(({'name': cache.name,
+                    'entries': len(cache),
+                    'max_entries': cache.max_entries,
+                    'ttl': cache.ttl} for cache in list(_caches)),
+                  key=lambda size: (-size['entries'], size['name']))
+
+
+def memoized(func=None, max_entries=DEFAULT_MAX_ENTRIES, ttl=None):
     """Decorator that caches function calls.
 
     Caches the decorated function's return value the first time it is called
@@ -54,12 +123,19 @@ def memoized(func):
     cached value is returned instead of calling the decorated function again.
 
     The cache uses weak references to the passed arguments, so it doesn't keep
-    them alive in memory forever.
+    them alive in memory forever. It keeps at most ``max_entries`` values
+    (unbounded if None), dropping the least recently used ones, and
+    recomputes values older than ``ttl`` seconds if set. Use
+    ``@memoized(max_entries=100, ttl=60)`` to change those limits.
     """
+    if func is None:
+        return functools.partial(memoized, max_entries=max_entries, ttl=ttl)
+
     # The dictionary in which all the data will be cached. This is a separate
     # instance for every decorated function, and it's stored in a closure of
     # the wrapped function.
-    cache = {}
+    cache = _LRUCache('%s.%s' % (func.__module__, func.__name__),
+                      max_entries, ttl)
 
     @functools.wraps(func)
     def wrapped(*args, **kwargs):
@@ -106,7 +182,8 @@ def memoized(func):
 memoized_method = memoized
 
 
-def memoized_with_request(request_func, request_index=0):
+def memoized_with_request(request_func, request_index=0,
+                          max_entries=DEFAULT_MAX_ENTRIES, ttl=None):
     """Decorator for caching functions which receive a request argument
 
     memoized functions with a request argument are memoized only during the
@@ -128,6 +205,8 @@ def memoized_with_request(request_func, request_index=0):
     your memoized function will instead receive request_func(request)
     passed as argument at the request_index.
 
+    max_entries and ttl limit the values kept, as for ``memoized``.
+
     The intent of that function is to extract the information needed from the
     request, and thus the memoizing will operate just on that part of the
     request that is relevant to the function being memoized.
@@ -161,7 +240,7 @@ def memoized_with_request(request_func, request_index=0):
     See openstack_dashboard.api.nova for a complete example.
     """
     def wrapper(func):
-        memoized_func = memoized(func)
+        memoized_func = memoized(func, max_entries=max_entries, ttl=ttl)
 
         @functools.wraps(func)
         def wrapped(*args, **kwargs):
@@ -172,3 +251,172 @@ def memoized_with_request(request_func, request_index=0):
 
         return wrapped
     return wrapper
+
+
+# Default number of seconds a value memoized by memoized_with_shared_cache
+# stays in the shared cache.
+SHARED_CACHE_TIMEOUT = 300
+
+# A process computing a value holds a lock for at most this many seconds,
+# while the others wait up to LOCK_WAIT seconds for its result before
+# computing it themselves.
+LOCK_TIMEOUT = 10
+LOCK_WAIT = 2
+LOCK_POLL_INTERVAL = 0.05
+
+# Hit and miss counters of the current process, per decorated function.
+_shared_cache_stats = collections.defaultdict(collections.Counter)
+
+
+def shared_cache_stats():
+    """Returns the counters of every function memoized in the shared cache.
+
+    The result maps the dotted name of each decorated function to the number
+    of ``l1_hits`` (same request), ``l2_hits`` (shared cache), ``misses``
+    and ``waits`` (for another process computing the value) counted by the
+    current process.
+    """
+    return dict((name, dict(counters))
+                for name, counters in _shared_cache_stats.items())
+
+
+def bump_generation(key):
+    """Atomically increments the generation counter ``key`` of the cache.
+
+    Missing counters are created, never expiring, with a value of 1.
+    """
+    try:
+        return shared_cache.incr(key)
+    except ValueError:
+        # add() only succeeds for the first of concurrent creators.
+        if shared_cache.add(key, 1, None):
+            return 1
+        return shared_cache.incr(key)
+
+
+def memoized_with_shared_cache(namespace_func, timeout=SHARED_CACHE_TIMEOUT,
+                               request_index=0):
+    """Decorator memoizing functions of a request in two tiers.
+
+    The first tier is the request itself: as with ``memoized``, a function
+    called again with the same arguments while serving a request returns
+    the value computed the first time. The second tier is the Django cache,
+    so that a value computed by one process is used by every process
+    sharing that cache until it expires after ``timeout`` seconds. The
+    ``SHARED_MEMOIZED_TIMEOUTS`` setting overrides that timeout, with the
+    dotted name of the decorated function as key; a timeout of 0 keeps the
+    values in the request only.
+
+    ``namespace_func`` receives the request and returns a tuple of the
+    strings that values depend on besides the other arguments, e.g. the
+    service endpoint and the project. The other arguments must have a
+    stable ``repr`` and the values must be picklable. Calls with an
+    unhashable argument are not memoized and raise an
+    ``UnhashableKeyWarning``.
+
+    When a value is missing from the shared cache, only one process
+    computes it while the others wait for its result for a while.
+
+    request_index indicates which argument of the decorated function is the
+    request.
+
+    The decorated function gets an ``invalidate(request=None)`` attribute,
+    which drops every value it memoized in the shared cache, or only those
+    of the namespace of ``request`` when it is given.
+    """
+    def wrapper(func):
+        name = '%s.%s' % (func.__module__, func.__name__)
+        stats = _shared_cache_stats[name]
+        generation_key = 'horizon:memoized:%s:generation' % name
+
+        def get_namespace_generation_key(namespace):
+            digest = hashlib.md5(
+                repr(namespace).encode('utf-8')).hexdigest()
+            return '%s:%s' % (generation_key, digest)
+
+        def get_timeout():
+            timeouts = getattr(settings, 'SHARED_MEMOIZED_TIMEOUTS', {})
+            return timeouts.get(name, timeout)
+
+        def compute(key, args, kwargs):
+            lock_key = key + ':lock'
+            deadline = time.time() + LOCK_WAIT
+            while not shared_cache.add(lock_key, True, LOCK_TIMEOUT):
+                # Another process is computing the value.
+                if time.time() > deadline:
+                    return func(*args, **kwargs)
+                stats['waits'] += 1
+                time.sleep(LOCK_POLL_INTERVAL)
+                cached = shared_cache.get(key)
+                if cached is not None:
+                    return cached[0]
+            try:
+                value = func(*args, **kwargs)
+                # Wrapped in a tuple to tell a memoized None from a miss.
+                shared_cache.set(key, (value,), get_timeout())
+            finally:
+                shared_cache.delete(lock_key)
+            return value
+
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            request = args[request_index]
+            namespace = namespace_func(request)
+            call_key = (namespace,
+                        args[:request_index] + args[request_index + 1:],
+                        tuple(sorted(kwargs.items())))
+
+            # Kept in the instance dictionary, bypassing the attribute
+            # lookup of request proxies.
+            request_cache = vars(request).setdefault('_memoized_cache', {})
+            try:
+                value = request_cache[(name, call_key)]
+            except KeyError:
+                pass
+            except TypeError:
+                # As with memoized, an unhashable argument such as a list
+                # means that the call cannot be cached at all.
+                warnings.warn(
+                    "The key %r is not hashable and cannot be memoized."
+                    % (call_key,), UnhashableKeyWarning, 2)
+                return func(*args, **kwargs)
+            else:
+                stats['l1_hits'] += 1
+                return value
+
+            if not get_timeout():
+                stats['misses'] += 1
+                value = func(*args, **kwargs)
+            else:
+                namespace_generation_key = get_namespace_generation_key(
+                    namespace)
+                generations = shared_cache.get_many(
+                    [generation_key, namespace_generation_key])
+                generation = (generations.get(generation_key, 0),
+                              generations.get(namespace_generation_key, 0))
+                digest = hashlib.md5(
+                    repr((generation, call_key)).encode('utf-8')).hexdigest()
+                key = 'horizon:memoized:%s:%s' % (name, digest)
+                cached = shared_cache.get(key)
+                if cached is not None:
+                    stats['l2_hits'] += 1
+                    value = cached[0]
+                else:
+                    stats['misses'] += 1
+                    value = compute(key, args, kwargs)
+            request_cache[(name, call_key)] = value
+            return value
+
+        def invalidate(request=None):
+            # Values are keyed by the generations of the function and of
+            # their namespace, so that bumping one orphans them; they
+            # expire on their own.
+            if request is None:
+                bump_generation(generation_key)
+            else:
+                bump_generation(
+                    get_namespace_generation_key(namespace_func(request)))
+
+        wrapped.invalidate = invalidate
+        return wrapped
+    return wrapper
@@ -0,0 +1,86 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+
+import webob.exc
+
+from nova.api.openstack import common
+from nova.api.openstack import extensions
+from nova.api.openstack import wsgi
+from nova.i18n import _
+from nova import objects
+from nova.policies import server_status_counts as ssc_policies
+
+ALIAS = 'os-server-status-counts'
+
+# Instance fields servers may additionally be grouped and filtered by.
+GROUP_FIELDS = ('host', 'availability_zone', 'project_id')
+
+
+class ServerStatusCountsController(wsgi.Controller):
+    """Counts servers by status without listing them."""
+
+    @extensions.expected_errors(400)
+    def index(self, req):
+        """Returns the number of servers in each status.
+
+        Servers are grouped by status and vm_state, and by any ``group_by``
+        query parameter among host, availability_zone and project_id. The
+        same fields may be passed as query parameters to filter servers.
+        """
+        context = req.environ['nova.context']
+        context.can(ssc_policies.BASE_POLICY_NAME)
+
+        group_by = req.GET.getall('group_by')
+        invalid = set(group_by) - set(GROUP_FIELDS)
+        if invalid:
+            msg = _("Invalid group_by field(s): %s") % ', '.join(
+                sorted(invalid))
+            raise webob.exc.HTTPBadRequest(explanation=msg)
+        filters = dict((field, req.GET[field]) for field in GROUP_FIELDS
+                       if req.GET.get(field))
+
+        rows = objects.InstanceList.get_counts_by_group(
+            context, ['vm_state', 'task_state'] + group_by, filters=filters)
+
+        # Several task states map to the same status; sum their rows.
+        counts = collections.OrderedDict()
+        for row in rows:
+            status = common.status_from_state(row['vm_state'],
+                                              row['task_state'])
+            key = (status, row['vm_state']) + tuple(
+                row[field] for field in group_by)
+            counts[key] = counts.get(key, 0) + row['count']
+
+        server_status_counts = []
+        for key, count in counts.items():
+            item = dict(zip(['status', 'vm_state'] + group_by, key))
+            item['count'] = count
+            server_status_counts.append(item)
+        return {'server_status_counts': server_status_counts}
+
+
+class ServerStatusCounts(extensions.V21APIExtensionBase):
+    """Server counts by status."""
+
+    name = "ServerStatusCounts"
+    alias = ALIAS
+    version = 1
+
+    def get_resources(self):
+        ext = extensions.ResourceExtension(ALIAS,
+                                           ServerStatusCountsController())
+        return [ext]
+
+    def get_controller_extensions(self):
+        return []
@@ -776,6 +776,15 @@ def instance_get_active_by_window_joined(context, begin, end=None,
                                               columns_to_join=columns_to_join)
 
 
+def instance_count_by_group(context, group_by, filters=None):
+    """Count instances grouped by the instance columns in group_by.
+
+    filters maps instance columns to the exact value they must match.
+    Returns a list of dicts holding the group_by columns and a count.
+    """
+    return IMPL.instance_count_by_group(context, group_by, filters=filters)
+
+
 def instance_get_all_by_host(context, host, columns_to_join=None):
     """Get all instances belonging to a host."""
     return IMPL.instance_get_all_by_host(context, host, columns_to_join)
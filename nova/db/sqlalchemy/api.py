@@ -2489,6 +2489,26 @@ def instance_get_active_by_window_joined(context, begin, end=None,
     return _instances_fill_metadata(context, query.all(), manual_joins)
 
 
+@require_context
+@pick_context_manager_reader_allow_async
+def instance_count_by_group(context, group_by, filters=None):
+    """Return the number of instances for each distinct group_by value.
+
+    Rows are counted with a single GROUP BY on the instances table, so no
+    instance is loaded.
+    """
+    columns = [getattr(models.Instance, column) for column in group_by]
+    query = model_query(context, models.Instance,
+                        columns + [func.count(models.Instance.id)],
+                        read_deleted="no", project_only=True)
+    for key, value in (filters or {}).items():
+        query = query.filter(getattr(models.Instance, key) == value)
+    query = query.group_by(*columns)
+
+    return [dict(zip(group_by, row[:-1]), count=row[-1])
+            for row in query.all()]
+
+
 def _instance_get_all_query(context, project_only=False, joins=None):
     if joins is None:
         joins = ['info_cache', 'security_groups']
@@ -1163,7 +1163,8 @@ def _make_instance_list(context, inst_list, db_inst_list, expected_attrs):
 class InstanceList(base.ObjectListBase, base.NovaObject):
     # Version 2.0: Initial Version
     # Version 2.1: Add get_uuids_by_host()
-    VERSION = '2.1'
+    # Version 2.2: Add get_counts_by_group()
+    VERSION = '2.2'
 
     fields = {
         'objects': fields.ListOfObjectsField('Instance'),
@@ -1347,6 +1348,14 @@ class InstanceList(base.ObjectListBase, base.NovaObject):
                                                    columns_to_join=[])
         return [inst['uuid'] for inst in db_instances]
 
+    @base.remotable_classmethod
+    def get_counts_by_group(cls, context, group_by, filters=None):
+        """Returns instance counts grouped by the group_by fields.
+
+        Each item is a dict of the group_by field values and a 'count'.
+        """
+        return db.instance_count_by_group(context, group_by, filters=filters)
+
 
 @db_api.main_context_manager.writer
 def _migrate_instance_keypairs(ctxt, count):
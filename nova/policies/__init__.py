@@ -84,6 +84,7 @@ from nova.policies import server_external_events
 from nova.policies import server_groups
 from nova.policies import server_metadata
 from nova.policies import server_password
+from nova.policies import server_status_counts
 from nova.policies import server_tags
 from nova.policies import server_usage
 from nova.policies import servers
@@ -174,6 +175,7 @@ def list_rules():
         server_groups.list_rules(),
         server_metadata.list_rules(),
         server_password.list_rules(),
+        server_status_counts.list_rules(),
         server_tags.list_rules(),
         server_usage.list_rules(),
         servers.list_rules(),
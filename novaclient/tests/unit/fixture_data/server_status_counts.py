@@ -0,0 +1,39 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from novaclient.tests.unit.fixture_data import base
+
+
+class Fixture(base.Fixture):
+
+    base_url = 'os-server-status-counts'
+
+    def setUp(self):
+        super(Fixture, self).setUp()
+
+        get_os_server_status_counts = {
+            'server_status_counts': [
+                {
+                    "status": "ACTIVE",
+                    "vm_state": "active",
+                    "count": 3,
+                },
+                {
+                    "status": "SHUTOFF",
+                    "vm_state": "stopped",
+                    "count": 1,
+                },
+            ]
+        }
+        self.requests.register_uri('GET', self.url(),
+                                   json=get_os_server_status_counts,
+                                   headers=self.json_headers)
@@ -0,0 +1,39 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from novaclient.tests.unit.fixture_data import client
+from novaclient.tests.unit.fixture_data import server_status_counts as data
+from novaclient.tests.unit import utils
+from novaclient.tests.unit.v2 import fakes
+from novaclient.v2 import server_status_counts
+
+
+class ServerStatusCountsTest(utils.FixturedTestCase):
+
+    client_fixture_class = client.V1
+    data_fixture_class = data.Fixture
+
+    def test_list_server_status_counts(self):
+        counts = self.cs.server_status_counts.list()
+        self.assert_request_id(counts, fakes.FAKE_REQUEST_ID_LIST)
+        self.assert_called('GET', '/os-server-status-counts')
+        for c in counts:
+            self.assertIsInstance(c, server_status_counts.ServerStatusCount)
+        self.assertEqual({'ACTIVE': 3, 'SHUTOFF': 1},
+                         dict((c.status, c.count) for c in counts))
+
+    def test_list_server_status_counts_grouped(self):
+        self.cs.server_status_counts.list(
+            group_by=['host', 'project_id'], availability_zone='nova')
+        self.assert_called('GET', '/os-server-status-counts?group_by=host'
+                                  '&group_by=project_id'
+                                  '&availability_zone=nova')
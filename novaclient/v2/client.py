@@ -46,6 +46,7 @@ from novaclient.v2 import security_group_rules
 from novaclient.v2 import security_groups
 from novaclient.v2 import server_groups
 from novaclient.v2 import server_migrations
+from novaclient.v2 import server_status_counts
 from novaclient.v2 import servers
 from novaclient.v2 import services
 from novaclient.v2 import usage
@@ -168,6 +169,8 @@ class Client(object):
         self.hypervisors = hypervisors.HypervisorManager(self)
         self.hypervisor_stats = hypervisors.HypervisorStatsManager(self)
         self.services = services.ServiceManager(self)
+        self.server_status_counts = \
+            server_status_counts.ServerStatusCountManager(self)
         self.fixed_ips = fixed_ips.FixedIPsManager(self)
         self.floating_ips_bulk = floating_ips_bulk.FloatingIPBulkManager(self)
         self.os_cache = os_cache or not no_cache
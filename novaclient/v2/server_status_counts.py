@@ -0,0 +1,53 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Server status counts interface.
+"""
+from six.moves import urllib
+
+from novaclient import base
+
+
+class ServerStatusCount(base.Resource):
+    """The number of servers in one status (and optional group)."""
+
+    def __repr__(self):
+        return "<ServerStatusCount: %s=%s>" % (self.status, self.count)
+
+
+class ServerStatusCountManager(base.Manager):
+    """Manage :class:`ServerStatusCount` resources."""
+    resource_class = ServerStatusCount
+
+    def list(self, group_by=None, host=None, availability_zone=None,
+             project_id=None):
+        """Count servers by status.
+
+        :param group_by: list of additional fields to group servers by,
+                         among ``host``, ``availability_zone`` and
+                         ``project_id``.
+        :param host: only count servers of this compute host.
+        :param availability_zone: only count servers of this zone.
+        :param project_id: only count servers of this project.
+        :returns: list of :class:`ServerStatusCount`.
+        """
+        params = [("group_by", field) for field in group_by or []]
+        for field, value in (("host", host),
+                             ("availability_zone", availability_zone),
+                             ("project_id", project_id)):
+            if value:
+                params.append((field, value))
+        url = "/os-server-status-counts"
+        if params:
+            url = "%s?%s" % (url, urllib.parse.urlencode(params))
+        return self._list(url, "server_status_counts")
@@ -34,6 +34,7 @@ Keystone/Nova/Glance/Swift et. al.
 from openstack_dashboard.api import base
 from openstack_dashboard.api import ceilometer
 from openstack_dashboard.api import cinder
+from openstack_dashboard.api import enrichment
 from openstack_dashboard.api import fwaas
 from openstack_dashboard.api import glance
 from openstack_dashboard.api import heat
@@ -49,6 +50,7 @@ from openstack_dashboard.api import vpn
 __all__ = [
     "base",
     "cinder",
+    "enrichment",
     "fwaas",
     "glance",
     "heat",
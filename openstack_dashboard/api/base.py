@@ -17,10 +17,12 @@
 #    under the License.
 
 from collections import Sequence  # noqa
+import functools
 
 from django.conf import settings
 
 from horizon import exceptions
+from horizon.utils import memoized
 
 import six
 
@@ -321,6 +323,84 @@ def url_for(request, service_type, endpoint_type=None, region=None):
     raise exceptions.ServiceCatalogException(service_type)
 
 
+def cache_namespace(service_type, per_project=False, per_roles=False):
+    """Returns the shared memoization namespace function of a service.
+
+    Values memoized with it are shared by the requests using the same
+    ``service_type`` endpoint and, if ``per_project`` is set, the same
+    project. If ``per_roles`` is set, they are only shared by users with
+    the same roles, for values whose visibility depends on them (e.g. the
+    private flavors listed for admins). See
+    ``horizon.utils.memoized.memoized_with_shared_cache``.
+    """
+    def namespace(request):
+        try:
+            endpoint = url_for(request, service_type)
+        except exceptions.ServiceCatalogException:
+            endpoint = None
+        parts = [endpoint]
+        if per_project:
+            parts.append(request.user.project_id)
+        if per_roles:
+            parts.append(tuple(sorted(role['name']
+                                      for role in request.user.roles)))
+        return tuple(parts)
+    return namespace
+
+
+# Functions memoized in the shared cache whose results depend on the
+# resources of a project; see changes_usage().
+_usage_caches = []
+
+
+def register_usage_cache(func):
+    """Registers a shared memoized function to drop on resource changes.
+
+    Any object with an ``invalidate(request=None)`` method can be
+    registered.
+    """
+    _usage_caches.append(func)
+    return func
+
+
+def usage_changed(request=None):
+    """Drops the values of every function registered as a usage cache.
+
+    Only the values of the region and project of ``request`` are dropped
+    when it is given, those of every project otherwise.
+    """
+    for func in _usage_caches:
+        func.invalidate(request)
+
+
+def changes_usage(func=None, all_projects=False):
+    """Decorator for API calls creating or deleting project resources.
+
+    Once the call succeeded, the values of the functions registered with
+    register_usage_cache, such as the quota usages, are dropped for the
+    project of the request. Use ``@changes_usage(all_projects=True)`` for
+    calls which may change the usages of other projects, such as quota
+    updates.
+    """
+    if func is None:
+        return functools.partial(changes_usage, all_projects=all_projects)
+
+    @functools.wraps(func)
+    def wrapped(request, *args, **kwargs):
+        result = func(request, *args, **kwargs)
+        usage_changed(None if all_projects else request)
+        return result
+    return wrapped
+
+
+def _region_namespace(request):
+    return request.user.project_id, request.user.services_region
+
+
+# Computed from the service catalog of the request alone, so that looking
+# it up in the shared cache costs more than computing it: memoized in the
+# request unless SHARED_MEMOIZED_TIMEOUTS says otherwise.
+@memoized.memoized_with_shared_cache(_region_namespace, timeout=0)
 def is_service_enabled(request, service_type):
     service = get_service_from_catalog(request.user.service_catalog,
                                        service_type)
@@ -346,3 +426,38 @@ def _get_endpoint_region(endpoint):
     both Keystone V2 and V3.
     """
     return endpoint.get('region_id') or endpoint.get('region')
+
+
+class _RegionScopedUser(object):
+    """Proxy of a user whose ``services_region`` is pinned to ``region``."""
+
+    def __init__(self, user, region):
+        self.__dict__['_user'] = user
+        self.__dict__['services_region'] = region
+
+    def __getattr__(self, attr):
+        return getattr(self._user, attr)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("Region scoped users are read-only.")
+
+
+class RegionScopedRequest(object):
+    """Proxy of a request whose API calls target ``region``.
+
+    Unlike assigning ``request.user.services_region``, wrapping the request
+    leaves the shared user object untouched, so API calls for several
+    regions can run concurrently from the same request. Every other
+    attribute is looked up on the wrapped request.
+    """
+
+    def __init__(self, request, region):
+        self.__dict__['_request'] = request
+        self.__dict__['user'] = _RegionScopedUser(request.user, region)
+        self.__dict__['region'] = region
+
+    def __getattr__(self, attr):
+        return getattr(self._request, attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._request, attr, value)
@@ -11,14 +11,23 @@
 # under the License.
 
 from collections import OrderedDict
+import hashlib
+import os
 import threading
 
-from ceilometerclient import client as ceilometer_client
+from ceilometerclient.v2 import client as ceilometer_client
+from ceilometerclient.v2 import meters as ceilometer_meters
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import ugettext_lazy as _
+from keystoneauth1 import session
+from keystoneauth1 import token_endpoint
+import requests
+from requests import adapters
 
 from horizon import exceptions
-from horizon.utils.memoized import memoized  # noqa
+from horizon.utils import concurrency
+from horizon.utils.memoized import memoized_with_request  # noqa
 
 from openstack_dashboard.api import base
 from openstack_dashboard.api import keystone
@@ -252,7 +261,7 @@ class Statistic(base.APIResourceWrapper):
 
     _attrs = ['period', 'period_start', 'period_end',
               'count', 'min', 'max', 'sum', 'avg',
-              'duration', 'duration_start', 'duration_end']
+              'duration', 'duration_start', 'duration_end', 'groupby']
 
 
 class Alarm(base.APIResourceWrapper):
@@ -290,17 +299,70 @@ class Alarm(base.APIResourceWrapper):
         return self._user
 
 
-@memoized
-def ceilometerclient(request):
+# HTTP sessions shared by all Ceilometer clients of a process, keyed by pid
+# so that forked workers do not share connections with their parent.
+_http_sessions = {}
+_http_sessions_lock = threading.Lock()
+
+
+def _get_http_session():
+    """Returns the per-process HTTP session used to talk to Ceilometer.
+
+    Its connection pool is bounded by ``CEILOMETER_CONNECTION_POOL_SIZE``;
+    once every connection is busy further requests wait for a free one
+    instead of opening new sockets.
+    """
+    pid = os.getpid()
+    with _http_sessions_lock:
+        http_session = _http_sessions.get(pid)
+        if http_session is None:
+            pool_size = getattr(settings, 'CEILOMETER_CONNECTION_POOL_SIZE',
+                                10)
+            adapter = adapters.HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size,
+                pool_block=True)
+            http_session = requests.Session()
+            http_session.mount('http://', adapter)
+            http_session.mount('https://', adapter)
+            _http_sessions[pid] = http_session
+    return http_session
+
+
+class _MeteringClient(ceilometer_client.Client):
+    """Ceilometer client serving alarms from the metering endpoint.
+
+    Given a session, the stock client probes the "alarming" service with a
+    ``GET /`` whenever it is built. The token plugin used here has a fixed
+    endpoint, so the probe would reach ceilometer itself and switch alarms
+    to aodh mode. Alarms stay on the metering client instead, as they were
+    before clients shared a session.
+    """
+
+    @staticmethod
+    def _get_alarm_client(**kwargs):
+        return None
+
+
+def get_auth_params_from_request(request):
+    """Extracts the properties the ceilometer client is memoized on."""
+    return (
+        request.user.token.id,
+        base.url_for(request, 'metering'),
+    )
+
+
+@memoized_with_request(get_auth_params_from_request)
+def ceilometerclient(request_auth_params):
     """Initialization of Ceilometer client."""
 
-    endpoint = base.url_for(request, 'metering')
+    token_id, endpoint = request_auth_params
     insecure = getattr(settings, 'OPENSTACK_SSL_NO_VERIFY', False)
     cacert = getattr(settings, 'OPENSTACK_SSL_CACERT', None)
-    return ceilometer_client.Client('2', endpoint,
-                                    token=(lambda: request.user.token.id),
-                                    insecure=insecure,
-                                    cacert=cacert)
+    ks_session = session.Session(
+        auth=token_endpoint.Token(endpoint, token_id),
+        session=_get_http_session(),
+        verify=not insecure and (cacert or True))
+    return _MeteringClient(endpoint, session=ks_session)
 
 
 def alarm_list(request, query=None, ceilometer_usage=None):
@@ -335,6 +397,12 @@ def alarm_create(request, ceilometer_usage=None, **kwargs):
 def resource_list(request, query=None, ceilometer_usage_object=None):
     """List the resources."""
     resources = ceilometerclient(request).resources.list(q=query)
+    if ceilometer_usage_object:
+        # Resolve the owners of all the resources in one batch.
+        ceilometer_usage_object.preload_tenants(
+            [r.project_id for r in resources if r.project_id])
+        ceilometer_usage_object.preload_users(
+            [r.user_id for r in resources if r.user_id])
     return [Resource(r, ceilometer_usage_object) for r in resources]
 
 
@@ -351,10 +419,53 @@ def meter_list(request, query=None):
     return [Meter(m) for m in meters]
 
 
-def statistic_list(request, meter_name, query=None, period=None):
-    """List of statistics."""
+def unique_meter_list(request):
+    """List one meter per distinct meter name.
+
+    Unlike meter_list, which returns one meter per resource, the size of
+    the result does not grow with the number of resources.
+    """
+    meters = ceilometerclient(request).meters.list(unique=True)
+    return [Meter(m) for m in meters]
+
+
+def _meter_catalog_cache_key(request):
+    # Non-admin users only see the meters of their project.
+    scope = '%s:%s:%s' % (base.url_for(request, 'metering'),
+                          request.user.tenant_id,
+                          request.user.is_superuser)
+    return 'horizon:ceilometer-meters:%s' % (
+        hashlib.md5(scope.encode('utf-8')).hexdigest())
+
+
+def meter_catalog(request):
+    """List the distinct meters, cached per region and project.
+
+    The catalog is kept in the Django cache for
+    ``CEILOMETER_METERS_CACHE_TTL`` seconds, so it is shared by all
+    dashboard workers.
+    """
+    key = _meter_catalog_cache_key(request)
+    infos = cache.get(key)
+    if infos is None:
+        infos = [m.to_dict() for m in unique_meter_list(request)]
+        cache.set(key, infos,
+                  getattr(settings, 'CEILOMETER_METERS_CACHE_TTL', 600))
+    return [Meter(ceilometer_meters.Meter(None, info, loaded=True))
+            for info in infos]
+
+
+def statistic_list(request, meter_name, query=None, period=None,
+                   groupby=None):
+    """List of statistics.
+
+    If ``groupby`` is given, the statistics are computed separately for
+    each distinct combination of the given fields (e.g. resource_id,
+    project_id) and every Statistic has a ``groupby`` dictionary of them.
+    """
     statistics = ceilometerclient(request).\
-        statistics.list(meter_name=meter_name, q=query, period=period)
+        statistics.list(meter_name=meter_name, q=query, period=period,
+                        groupby=groupby)
     return [Statistic(s) for s in statistics]
 
 
@@ -374,72 +485,15 @@ def get_capability_instance(request, instance_id, start, end, timetype):
     return ceilometerclient(request).capabilities.get_capability_instance(instance_id=instance_id, start=start, end=end, type=timetype)
 
 
-class ThreadedUpdateResourceWithStatistics(threading.Thread):
-    """Multithread wrapper for update_with_statistics method of
-    resource_usage.
-
-    A join logic is placed in process_list class method. All resources
-    will have its statistics attribute filled in separate threads.
-
-    The resource_usage object is shared between threads. Each thread is
-    updating one Resource.
-
-    :Parameters:
-      - `resource`: Resource or ResourceAggregate object, that will
-                    be filled by statistic data.
-      - `resources`: List of Resource or ResourceAggregate object,
-                     that will be filled by statistic data.
-      - `resource_usage`: Wrapping resource usage object, that holds
-                          all statistics data.
-      - `meter_names`: List of meter names of the statistics we want.
-      - `period`: In seconds. If no period is given, only one aggregate
-                  statistic is returned. If given, a faceted result will be
-                  returned, divided into given periods. Periods with no
-                  data are ignored.
-      - `stats_attr`: String representing the attribute name of the stats.
-                      E.g. (avg, max, min...) If None is given, whole
-                      statistic object is returned,
-      - `additional_query`: Additional query for the statistics.
-                            E.g. timespan, etc.
-    """
-    # TODO(lsmola) Can be removed once Ceilometer supports sample-api
-    # and group-by, so all of this optimization will not be necessary.
-    # It is planned somewhere to I.
-
-    def __init__(self, resource_usage, resource, meter_names=None,
-                 period=None, filter_func=None, stats_attr=None,
-                 additional_query=None):
-        super(ThreadedUpdateResourceWithStatistics, self).__init__()
-        self.resource_usage = resource_usage
-        self.resource = resource
-        self.meter_names = meter_names
-        self.period = period
-        self.stats_attr = stats_attr
-        self.additional_query = additional_query
-
-    def run(self):
-        # Run the job
-        self.resource_usage.update_with_statistics(
-            self.resource,
-            meter_names=self.meter_names, period=self.period,
-            stats_attr=self.stats_attr, additional_query=self.additional_query)
-
-    @classmethod
-    def process_list(cls, resource_usage, resources, meter_names=None,
-                     period=None, filter_func=None, stats_attr=None,
-                     additional_query=None):
-        threads = []
+def _identity(object_id, name):
+    """Returns a minimal user or tenant object, None if name is unknown."""
+    if name is None:
+        return None
+    return base.APIDictWrapper({'id': object_id, 'name': name})
 
-        for resource in resources:
-            # add statistics data into resource
-            thread = cls(resource_usage, resource, meter_names=meter_names,
-                         period=period, stats_attr=stats_attr,
-                         additional_query=additional_query)
-            thread.start()
-            threads.append(thread)
 
-        for thread in threads:
-            thread.join()
+# Fields identifying one Resource in statistics grouped by resource.
+RESOURCE_GROUPBY = ['project_id', 'user_id', 'resource_id']
 
 
 class CeilometerUsage(object):
@@ -449,8 +503,8 @@ class CeilometerUsage(object):
     as this class provides a place where users and tenants are
     cached. So there are no duplicate queries to API.
 
-    This class also wraps Ceilometer API calls and provides parallel
-    HTTP calls to API.
+    This class also wraps Ceilometer API calls and fetches statistics of
+    many resources with one group-by query per meter.
 
     This class should also serve as reasonable abstraction, that will
     cover huge amount of optimization due to optimization of Ceilometer
@@ -468,15 +522,28 @@ class CeilometerUsage(object):
         """Returns user fetched from API.
 
         Caching the result, so it doesn't contact API twice with the
-        same query.
+        same query. The returned object only has an id and a name, and
+        None is returned for users that do not exist.
         """
 
-        user = self._users.get(user_id, None)
-        if not user:
-            user = keystone.user_get(self._request, user_id)
-            # caching the user, for later use
-            self._users[user_id] = user
-        return user
+        if user_id not in self._users:
+            self.preload_users([user_id])
+        return self._users.get(user_id)
+
+    def preload_users(self, user_ids):
+        """Preloads the given users into dictionary.
+
+        The names are resolved by one lookup in the cache shared by all
+        dashboard workers, only the users missing there are fetched from
+        Keystone.
+        """
+
+        user_ids = set(user_ids) - set(self._users)
+        if not user_ids:
+            return
+        names = keystone.user_names(self._request, user_ids)
+        for user_id in user_ids:
+            self._users[user_id] = _identity(user_id, names.get(user_id))
 
     def preload_all_users(self):
         """Preloads all users into dictionary.
@@ -495,15 +562,29 @@ class CeilometerUsage(object):
         """Returns tenant fetched from API.
 
         Caching the result, so it doesn't contact API twice with the
-        same query.
+        same query. The returned object only has an id and a name, and
+        None is returned for tenants that do not exist.
         """
 
-        tenant = self._tenants.get(tenant_id, None)
-        if not tenant:
-            tenant = keystone.tenant_get(self._request, tenant_id)
-            # caching the tenant for later use
-            self._tenants[tenant_id] = tenant
-        return tenant
+        if tenant_id not in self._tenants:
+            self.preload_tenants([tenant_id])
+        return self._tenants.get(tenant_id)
+
+    def preload_tenants(self, tenant_ids):
+        """Preloads the given tenants into dictionary.
+
+        The names are resolved by one lookup in the cache shared by all
+        dashboard workers, only the tenants missing there are fetched from
+        Keystone.
+        """
+
+        tenant_ids = set(tenant_ids) - set(self._tenants)
+        if not tenant_ids:
+            return
+        names = keystone.tenant_names(self._request, tenant_ids)
+        for tenant_id in tenant_ids:
+            self._tenants[tenant_id] = _identity(tenant_id,
+                                                 names.get(tenant_id))
 
     def preload_all_tenants(self):
         """Preloads all tenants into dictionary.
@@ -627,36 +708,106 @@ class CeilometerUsage(object):
                              "able to obtain the statistics.")
 
         # query for identifying one resource in meters
-        query = resource.query
-        if additional_query:
-            if not is_iterable(additional_query):
-                raise ValueError("Additional query must be list of"
-                                 " conditions. See the docs for format.")
-            query = query + additional_query
+        query = self._statistics_query(resource.query, additional_query)
 
-        # TODO(lsmola) thread for each meter will be probably overkill
-        # but I should test lets say thread pool with 100 of threads
-        # and apply it only to this code.
-        # Though I do expect Ceilometer will support bulk requests,
-        # so all of this optimization will not be necessary.
         for meter in meter_names:
             statistics = statistic_list(self._request, meter,
                                         query=query, period=period)
-            meter = meter.replace(".", "_")
-            if statistics:
-                if stats_attr:
-                    # I want to load only a specific attribute
-                    resource.set_meter(
-                        meter,
-                        getattr(statistics[0], stats_attr, None))
-                else:
-                    # I want a dictionary of all statistics
-                    resource.set_meter(meter, statistics)
-            else:
-                resource.set_meter(meter, None)
+            self._set_statistics(resource, meter, statistics, stats_attr)
 
         return resource
 
+    def grouped_statistics(self, meter_name, groupby, query=None,
+                           period=None):
+        """Obtaining statistics of one meter grouped by the given fields.
+
+        All the groups are fetched by one API call. Returns a dictionary
+        mapping the tuple of groupby field values (missing values are
+        replaced by empty strings, as in Resource) to the list of the
+        statistics of that group.
+
+        :Parameters:
+          - `meter_name`: A meter name of which we want the statistics.
+          - `groupby`: List of fields to group the statistics by.
+          - `query`: Query for the statistics.
+          - `period`: In seconds. See update_with_statistics.
+        """
+        grouped = {}
+        statistics = statistic_list(self._request, meter_name, query=query,
+                                    period=period, groupby=groupby)
+        for statistic in statistics:
+            group = getattr(statistic, 'groupby', None) or {}
+            key = tuple(group.get(field) or "" for field in groupby)
+            grouped.setdefault(key, []).append(statistic)
+        return grouped
+
+    def update_with_grouped_statistics(self, resources, groupby, group_key,
+                                       query=None, meter_names=None,
+                                       period=None, stats_attr=None,
+                                       additional_query=None):
+        """Adding statistical data into many resources at once.
+
+        Makes one grouped statistics call per meter, instead of one call
+        per resource and meter, and sets the statistics of each group to
+        the resource it belongs to. See update_with_statistics for the
+        meaning of the attributes set.
+
+        :Parameters:
+          - `resources`: List of Resource or ResourceAggregate objects,
+                         that will be filled by statistic data.
+          - `groupby`: List of fields to group the statistics by.
+          - `group_key`: Callable returning the tuple of groupby field
+                         values identifying the given resource.
+          - `query`: Query selecting the samples of all the resources.
+          - `meter_names`: List of meter names of which we want the
+                           statistics.
+          - `period`: In seconds. See update_with_statistics.
+          - `stats_attr`: String representing the specific name of the stats.
+                          See update_with_statistics.
+          - `additional_query`: Additional query for the statistics.
+                                E.g. timespan, etc.
+        """
+        if not meter_names:
+            raise ValueError("meter_names and resources must be defined to be "
+                             "able to obtain the statistics.")
+
+        query = self._statistics_query(query, additional_query)
+
+        for meter in meter_names:
+            grouped = self.grouped_statistics(meter, groupby, query=query,
+                                              period=period)
+            for resource in resources:
+                self._set_statistics(resource, meter,
+                                     grouped.get(group_key(resource)),
+                                     stats_attr)
+
+        return resources
+
+    @staticmethod
+    def _statistics_query(query, additional_query):
+        query = query or []
+        if additional_query:
+            if not is_iterable(additional_query):
+                raise ValueError("Additional query must be list of"
+                                 " conditions. See the docs for format.")
+            query = query + additional_query
+        return query
+
+    @staticmethod
+    def _set_statistics(resource, meter, statistics, stats_attr):
+        meter = meter.replace(".", "_")
+        if statistics:
+            if stats_attr:
+                # I want to load only a specific attribute
+                resource.set_meter(
+                    meter,
+                    getattr(statistics[0], stats_attr, None))
+            else:
+                # I want a dictionary of all statistics
+                resource.set_meter(meter, statistics)
+        else:
+            resource.set_meter(meter, None)
+
     def resources(self, query=None, filter_func=None,
                   with_users_and_tenants=False):
         """Obtaining resources with the query or filter_func.
@@ -715,10 +866,12 @@ class CeilometerUsage(object):
             query, filter_func=filter_func,
             with_users_and_tenants=with_users_and_tenants)
 
-        ThreadedUpdateResourceWithStatistics.process_list(
-            self, resources,
-            meter_names=meter_names, period=period, stats_attr=stats_attr,
-            additional_query=additional_query)
+        if resources:
+            self.update_with_grouped_statistics(
+                resources, RESOURCE_GROUPBY,
+                lambda r: (r.project_id, r.user_id, r.resource_id),
+                query=query, meter_names=meter_names, period=period,
+                stats_attr=stats_attr, additional_query=additional_query)
 
         return resources
 
@@ -764,11 +917,64 @@ class CeilometerUsage(object):
         """
         resource_aggregates = self.resource_aggregates(queries)
 
-        ThreadedUpdateResourceWithStatistics.process_list(
-            self,
-            resource_aggregates, meter_names=meter_names, period=period,
-            stats_attr=stats_attr, additional_query=additional_query)
+        def update(resource_aggregate):
+            self.update_with_statistics(
+                resource_aggregate, meter_names=meter_names, period=period,
+                stats_attr=stats_attr, additional_query=additional_query)
+
+        # Arbitrary queries cannot be grouped into one call, so they are
+        # run on the bounded ceilometer pool.
+        concurrency.map_bounded(
+            update, resource_aggregates, name='ceilometer',
+            max_workers=getattr(settings, 'CEILOMETER_MAX_WORKERS', 10))
+
+        return resource_aggregates
+
+    def project_aggregates_with_statistics(self, meter_names=None,
+                                           period=None, stats_attr=None,
+                                           additional_query=None):
+        """Obtaining per-project resource aggregates with statistics data.
+
+        The statistics of all the projects are fetched by one call per
+        meter grouped by project_id. One aggregate, identified by the
+        project name, is returned for every existing project that has
+        statistics of any of the meters.
+
+        :Parameters:
+          - `meter_names`: List of meter names of which we want the
+                           statistics.
+          - `period`: In seconds. See resource_aggregates_with_statistics.
+          - `stats_attr`: String representing the specific name of the stats.
+                          See resource_aggregates_with_statistics.
+          - `additional_query`: Additional query for the statistics.
+                                E.g. timespan, etc.
+        """
+        if not meter_names:
+            raise ValueError("meter_names must be defined to be able to "
+                             "obtain the statistics.")
+
+        query = self._statistics_query(None, additional_query)
+        grouped = dict((meter, self.grouped_statistics(meter, ['project_id'],
+                                                       query=query,
+                                                       period=period))
+                       for meter in meter_names)
+        project_ids = set(key[0] for statistics in grouped.values()
+                          for key in statistics if key[0])
+        self.preload_tenants(project_ids)
 
+        resource_aggregates = []
+        for project_id in project_ids:
+            tenant = self.get_tenant(project_id)
+            if not tenant:
+                continue
+            resource_aggregate = ResourceAggregate(
+                query=make_query(tenant_id=project_id),
+                identifier=tenant.name)
+            for meter, statistics in grouped.items():
+                self._set_statistics(resource_aggregate, meter,
+                                     statistics.get((project_id,)),
+                                     stats_attr)
+            resource_aggregates.append(resource_aggregate)
         return resource_aggregates
 
 
@@ -792,49 +998,74 @@ class Meters(object):
 
     """
 
+    # The static meters info does not depend on the request, it is built
+    # once per process by _get_services_meters_info.
+    _services_meters_info = None
+
     def __init__(self, request=None, ceilometer_meter_list=None):
         # Storing the request.
         self._request = request
 
-        # Storing the Ceilometer meter list
-        if ceilometer_meter_list:
-            self._ceilometer_meter_list = ceilometer_meter_list
-        else:
-            try:
-                self._ceilometer_meter_list = meter_list(request)
-            except Exception:
-                self._ceilometer_meter_list = []
-                exceptions.handle(self._request,
-                                  _('Unable to retrieve Ceilometer meter '
-                                    'list.'))
+        # Storing the Ceilometer meter list, it is loaded lazily by the
+        # first listing.
+        self._meter_list = ceilometer_meter_list
+        self._meters_by_name = None
 
         # Storing the meters info categorized by their services.
-        self._nova_meters_info = self._get_nova_meters_info()
-        self._neutron_meters_info = self._get_neutron_meters_info()
-        self._glance_meters_info = self._get_glance_meters_info()
-        self._cinder_meters_info = self._get_cinder_meters_info()
-        self._swift_meters_info = self._get_swift_meters_info()
-        self._kwapi_meters_info = self._get_kwapi_meters_info()
-        self._ipmi_meters_info = self._get_ipmi_meters_info()
+        services_meters_info = self._get_services_meters_info()
+        self._nova_meters_info = services_meters_info['nova']
+        self._neutron_meters_info = services_meters_info['neutron']
+        self._glance_meters_info = services_meters_info['glance']
+        self._cinder_meters_info = services_meters_info['cinder']
+        self._swift_meters_info = services_meters_info['swift']
+        self._kwapi_meters_info = services_meters_info['kwapi']
+        self._ipmi_meters_info = services_meters_info['ipmi']
 
         # Storing the meters info of all services together.
-        all_services_meters = (self._nova_meters_info,
-                               self._neutron_meters_info,
-                               self._glance_meters_info,
-                               self._cinder_meters_info,
-                               self._swift_meters_info,
-                               self._kwapi_meters_info,
-                               self._ipmi_meters_info)
-        self._all_meters_info = {}
-        for service_meters in all_services_meters:
-            self._all_meters_info.update(dict([(meter_name, meter_info)
-                                               for meter_name, meter_info
-                                               in service_meters.items()]))
+        self._all_meters_info = services_meters_info['all']
 
         # Here will be the cached Meter objects, that will be reused for
         # repeated listing.
         self._cached_meters = {}
 
+    @classmethod
+    def _get_services_meters_info(cls):
+        if cls._services_meters_info is None:
+            services_meters_info = OrderedDict([
+                ('nova', cls._get_nova_meters_info()),
+                ('neutron', cls._get_neutron_meters_info()),
+                ('glance', cls._get_glance_meters_info()),
+                ('cinder', cls._get_cinder_meters_info()),
+                ('swift', cls._get_swift_meters_info()),
+                ('kwapi', cls._get_kwapi_meters_info()),
+                ('ipmi', cls._get_ipmi_meters_info()),
+            ])
+            all_meters_info = {}
+            for service_meters in services_meters_info.values():
+                all_meters_info.update(service_meters)
+            services_meters_info['all'] = all_meters_info
+            cls._services_meters_info = services_meters_info
+        return cls._services_meters_info
+
+    @property
+    def _ceilometer_meter_list(self):
+        if self._meter_list is None:
+            try:
+                self._meter_list = meter_catalog(self._request)
+            except Exception:
+                self._meter_list = []
+                exceptions.handle(self._request,
+                                  _('Unable to retrieve Ceilometer meter '
+                                    'list.'))
+        return self._meter_list
+
+    def _get_ceilometer_meter(self, meter_name):
+        if self._meters_by_name is None:
+            self._meters_by_name = {}
+            for meter in self._ceilometer_meter_list:
+                self._meters_by_name.setdefault(meter.name, meter)
+        return self._meters_by_name.get(meter_name)
+
     def list_all(self, only_meters=None, except_meters=None):
         """Returns a list of meters based on the meters names.
 
@@ -962,10 +1193,9 @@ class Meters(object):
         """
         meter = self._cached_meters.get(meter_name, None)
         if not meter:
-            meter_candidates = [m for m in self._ceilometer_meter_list
-                                if m.name == meter_name]
+            meter = self._get_ceilometer_meter(meter_name)
 
-            if meter_candidates:
+            if meter:
                 meter_info = self._all_meters_info.get(meter_name, None)
                 if meter_info:
                     label = meter_info["label"]
@@ -973,14 +1203,14 @@ class Meters(object):
                 else:
                     label = ""
                     description = ""
-                meter = meter_candidates[0]
                 meter.augment(label=label, description=description)
 
                 self._cached_meters[meter_name] = meter
 
         return meter
 
-    def _get_nova_meters_info(self):
+    @staticmethod
+    def _get_nova_meters_info():
         """Returns additional info for each meter.
 
         That will be used for augmenting the Ceilometer meter.
@@ -1106,7 +1336,8 @@ class Meters(object):
         # because users can have their own agents and meters.
         return meters_info
 
-    def _get_neutron_meters_info(self):
+    @staticmethod
+    def _get_neutron_meters_info():
         """Returns additional info for each meter.
 
         That will be used for augmenting the Ceilometer meter.
@@ -1179,7 +1410,8 @@ class Meters(object):
             }),
         ])
 
-    def _get_glance_meters_info(self):
+    @staticmethod
+    def _get_glance_meters_info():
         """Returns additional info for each meter.
 
         That will be used for augmenting the Ceilometer meter.
@@ -1220,7 +1452,8 @@ class Meters(object):
             }),
         ])
 
-    def _get_cinder_meters_info(self):
+    @staticmethod
+    def _get_cinder_meters_info():
         """Returns additional info for each meter.
 
         That will be used for augmenting the Ceilometer meter.
@@ -1241,7 +1474,8 @@ class Meters(object):
             }),
         ])
 
-    def _get_swift_meters_info(self):
+    @staticmethod
+    def _get_swift_meters_info():
         """Returns additional info for each meter.
 
         That will be used for augmenting the Ceilometer meter.
@@ -1278,7 +1512,8 @@ class Meters(object):
             }),
         ])
 
-    def _get_kwapi_meters_info(self):
+    @staticmethod
+    def _get_kwapi_meters_info():
         """Returns additional info for each meter.
 
         That will be used for augmenting the Ceilometer meter.
@@ -1299,7 +1534,8 @@ class Meters(object):
             }),
         ])
 
-    def _get_ipmi_meters_info(self):
+    @staticmethod
+    def _get_ipmi_meters_info():
         """Returns additional info for each meter
 
         That will be used for augmenting the Ceilometer meter
@@ -311,6 +311,7 @@ def volume_get(request, volume_id):
     return Volume(volume_data)
 
 
+@base.changes_usage
 def volume_create(request, size, name, description, volume_type,
                   snapshot_id=None, metadata=None, image_id=None,
                   availability_zone=None, source_volid=None):
@@ -328,10 +329,12 @@ def volume_create(request, size, name, description, volume_type,
     return Volume(volume)
 
 
+@base.changes_usage
 def volume_extend(request, volume_id, new_size):
     return cinderclient(request).volumes.extend(volume_id, new_size)
 
 
+@base.changes_usage
 def volume_delete(request, volume_id):
     return cinderclient(request).volumes.delete(volume_id)
 
@@ -422,6 +425,7 @@ def volume_snapshot_list_paged(request, search_opts=None, marker=None,
     return snapshots, has_more_data, has_prev_data
 
 
+@base.changes_usage
 def volume_snapshot_create(request, volume_id, name,
                            description=None, force=False):
     data = {'name': name,
@@ -433,6 +437,7 @@ def volume_snapshot_create(request, volume_id, name,
         volume_id, **data))
 
 
+@base.changes_usage
 def volume_snapshot_delete(request, snapshot_id):
     return cinderclient(request).volume_snapshots.delete(snapshot_id)
 
@@ -669,6 +674,7 @@ def tenant_quota_get(request, tenant_id):
     return base.QuotaSet(c_client.quotas.get(tenant_id))
 
 
+@base.changes_usage(all_projects=True)
 def tenant_quota_update(request, tenant_id, **kwargs):
     return cinderclient(request).quotas.update(tenant_id, **kwargs)
 
@@ -717,6 +723,7 @@ def volume_type_get_with_qos_association(request, volume_type_id):
     return vol_type
 
 
+@base.changes_usage(all_projects=True)
 def default_quota_update(request, **kwargs):
     cinderclient(request).quota_classes.update(DEFAULT_QUOTA_NAME, **kwargs)
 
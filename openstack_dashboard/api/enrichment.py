@@ -0,0 +1,143 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Details of a page of servers shown by the instance tables.
+
+Once the servers of a page are known, their addresses, flavors, images and
+project names come from independent services. They are looked up
+concurrently, and only for the flavors, images and projects the page
+references.
+"""
+
+from collections import OrderedDict
+import functools
+import logging
+
+from django.utils.translation import ugettext_lazy as _
+
+from horizon import exceptions
+from horizon.utils import concurrency
+
+from openstack_dashboard.api import glance
+from openstack_dashboard.api import keystone
+from openstack_dashboard.api import network
+from openstack_dashboard.api import nova
+
+
+LOG = logging.getLogger(__name__)
+
+
+def _update_addresses(request, servers, all_tenants):
+    try:
+        if all_tenants:
+            network.servers_update_addresses(request, servers,
+                                             all_tenants=True)
+        else:
+            network.servers_update_addresses(request, servers)
+    except Exception:
+        exceptions.handle(
+            request,
+            message=_('Unable to retrieve IP addresses from Neutron.'),
+            ignore=True)
+
+
+def _get_flavors(request, flavor_ids, error_message):
+    try:
+        flavors = dict((str(flavor.id), flavor)
+                       for flavor in nova.flavor_list(request))
+    except Exception:
+        flavors = {}
+        exceptions.handle(request, ignore=True)
+
+    def get_flavor(flavor_id):
+        try:
+            return nova.flavor_get(request, flavor_id)
+        except Exception:
+            if error_message:
+                exceptions.handle(request, error_message)
+            else:
+                LOG.info('Unable to retrieve flavor "%s".', flavor_id)
+
+    # Flavors missing from the list (private or deleted ones) are fetched
+    # once each, however many servers use them.
+    missing = [flavor_id for flavor_id in flavor_ids
+               if flavor_id not in flavors]
+    flavors.update(zip(missing, concurrency.map_bounded(
+        get_flavor, missing, name='flavors')))
+    return flavors
+
+
+def _get_images(request, image_ids):
+    try:
+        return dict((str(image.id), image)
+                    for image in glance.image_list_by_ids(request, image_ids))
+    except Exception:
+        exceptions.handle(request, ignore=True)
+        return {}
+
+
+def _get_tenant_names(request, tenant_ids):
+    try:
+        return keystone.tenant_names(request, tenant_ids)
+    except Exception:
+        exceptions.handle(
+            request, _('Unable to retrieve instance project information.'))
+        return {}
+
+
+def servers_update_details(request, servers, all_tenants=False, images=True,
+                           tenant_names=False, flavor_error_message=None):
+    """Sets the details shown by the instance tables on ``servers``.
+
+    The addresses of the servers are updated from Neutron, their
+    ``full_flavor`` is set and, if ``images`` is set, their ``image``
+    dictionary is replaced by the image it refers to. With
+    ``tenant_names``, their ``tenant_name`` is set too. The lookups run
+    concurrently, and failures are reported without stopping the others.
+
+    A flavor missing from the flavor list is retrieved on its own;
+    ``flavor_error_message`` is shown when that fails, which is only
+    logged otherwise.
+    """
+    if not servers:
+        return
+
+    flavor_ids = OrderedDict((str(server.flavor['id']), None)
+                             for server in servers)
+    lookups = OrderedDict()
+    lookups['addresses'] = functools.partial(
+        _update_addresses, request, servers, all_tenants)
+    lookups['flavors'] = functools.partial(
+        _get_flavors, request, list(flavor_ids), flavor_error_message)
+    if images:
+        image_ids = set(server.image['id'] for server in servers
+                        if isinstance(getattr(server, 'image', None), dict)
+                        and server.image.get('id'))
+        lookups['images'] = functools.partial(_get_images, request,
+                                              image_ids)
+    if tenant_names:
+        lookups['tenants'] = functools.partial(
+            _get_tenant_names, request,
+            set(server.tenant_id for server in servers))
+    results = concurrency.load_all(lookups, concurrent=True,
+                                   name='enrichment')[0]
+
+    for server in servers:
+        flavor = results['flavors'].get(str(server.flavor['id']))
+        if flavor is not None:
+            server.full_flavor = flavor
+        if images and isinstance(getattr(server, 'image', None), dict):
+            image = results['images'].get(server.image.get('id'))
+            if image is not None:
+                server.image = image
+        if tenant_names:
+            server.tenant_name = results['tenants'].get(server.tenant_id)
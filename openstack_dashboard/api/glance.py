@@ -327,6 +327,30 @@ def image_list_detailed(request, marker=None, sort_dir='desc',
     return wrapped_images, has_more_data, has_prev_data
 
 
+# Number of image ids looked up by a single "in:" filter.
+IMAGE_IDS_PER_QUERY = 100
+
+
+def image_list_by_ids(request, image_ids):
+    """Returns the images whose id is one of ``image_ids``.
+
+    With the Image API v2 the images are listed with an "in:" filter on
+    their ids, so that only those images are transferred. The v1 API has
+    no such filter and lists every image instead.
+    """
+    image_ids = sorted(set(image_ids))
+    if not image_ids:
+        return []
+    if VERSIONS.active < 2:
+        return image_list_detailed(request, filters=None)[0]
+    images = []
+    for start in range(0, len(image_ids), IMAGE_IDS_PER_QUERY):
+        chunk = image_ids[start:start + IMAGE_IDS_PER_QUERY]
+        images.extend(image_list_detailed(
+            request, filters={'id': 'in:%s' % ','.join(chunk)})[0])
+    return images
+
+
 def image_update(request, image_id, **kwargs):
     image_data = kwargs.get('data', None)
     try:
@@ -18,9 +18,11 @@
 #    under the License.
 
 import collections
+import hashlib
 import logging
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import ugettext_lazy as _
 import six
 import six.moves.urllib.parse as urlparse
@@ -32,6 +34,7 @@ from openstack_auth import utils as auth_utils
 
 from horizon import exceptions
 from horizon import messages
+from horizon.utils import concurrency
 from horizon.utils import functions as utils
 
 from openstack_dashboard.api import base
@@ -428,6 +431,65 @@ def user_get(request, user_id, admin=True):
     return VERSIONS.upgrade_v2_user(user)
 
 
+# Marks ids that do not exist (anymore) in the identity name cache, so
+# that deleted users and projects are not looked up on every page.
+_NAME_NOT_FOUND = False
+
+
+def _identity_name_cache_key(request, kind, object_id):
+    endpoint = _get_endpoint_url(request, 'adminURL')
+    return 'horizon:identity-name:%s:%s:%s' % (
+        hashlib.md5(endpoint.encode('utf-8')).hexdigest(), kind, object_id)
+
+
+def _identity_names(request, kind, getter, ids):
+    """Returns a dictionary mapping the given ids to their names.
+
+    Names are looked up in the Django cache first, so they are shared by
+    all the dashboard workers. The ids missing there are fetched from
+    Keystone concurrently and cached for ``IDENTITY_NAME_CACHE_TTL``
+    seconds. Ids that do not exist are cached too and are left out of the
+    result.
+    """
+    keys = dict((_identity_name_cache_key(request, kind, object_id),
+                 object_id)
+                for object_id in set(ids) if object_id)
+    names = dict((keys[key], name)
+                 for key, name in cache.get_many(list(keys)).items())
+    missing = [object_id for object_id in keys.values()
+               if object_id not in names]
+
+    if missing:
+        def get_name(object_id):
+            try:
+                return getter(request, object_id).name
+            except keystone_exceptions.NotFound:
+                return _NAME_NOT_FOUND
+
+        # Create the client before fanning out, it is cached on the request.
+        keystoneclient(request, admin=True)
+        fetched = dict(zip(missing, concurrency.map_bounded(
+            get_name, missing, name='keystone')))
+        cache.set_many(
+            dict((_identity_name_cache_key(request, kind, object_id), name)
+                 for object_id, name in fetched.items()),
+            getattr(settings, 'IDENTITY_NAME_CACHE_TTL', 300))
+        names.update(fetched)
+
+    return dict((object_id, name) for object_id, name in names.items()
+                if name is not _NAME_NOT_FOUND)
+
+
+def user_names(request, user_ids):
+    """Returns a dictionary mapping the given user ids to user names."""
+    return _identity_names(request, 'user', user_get, user_ids)
+
+
+def tenant_names(request, tenant_ids):
+    """Returns a dictionary mapping the given project ids to names."""
+    return _identity_names(request, 'project', tenant_get, tenant_ids)
+
+
 def user_update(request, user, **data):
     manager = keystoneclient(request, admin=True).users
     error = None
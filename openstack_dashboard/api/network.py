@@ -58,12 +58,14 @@ def tenant_floating_ip_get(request, floating_ip_id):
     return NetworkClient(request).floating_ips.get(floating_ip_id)
 
 
+@base.changes_usage
 def tenant_floating_ip_allocate(request, pool=None, tenant_id=None, **params):
     return NetworkClient(request).floating_ips.allocate(pool,
                                                         tenant_id,
                                                         **params)
 
 
+@base.changes_usage
 def tenant_floating_ip_release(request, floating_ip_id):
     return NetworkClient(request).floating_ips.release(floating_ip_id)
 
@@ -108,10 +110,12 @@ def security_group_get(request, sg_id):
     return NetworkClient(request).secgroups.get(sg_id)
 
 
+@base.changes_usage
 def security_group_create(request, name, desc):
     return NetworkClient(request).secgroups.create(name, desc)
 
 
+@base.changes_usage
 def security_group_delete(request, sg_id):
     return NetworkClient(request).secgroups.delete(sg_id)
 
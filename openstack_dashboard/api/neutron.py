@@ -21,11 +21,13 @@ from __future__ import absolute_import
 
 import collections
 import copy
+import hashlib
 import logging
 
 import netaddr
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import ugettext_lazy as _
 from neutronclient.common import exceptions as neutron_exc
 from neutronclient.v2_0 import client as neutron_client
@@ -33,7 +35,9 @@ import six
 
 from horizon import exceptions
 from horizon import messages
+from horizon.utils import concurrency
 from horizon.utils.memoized import memoized  # noqa
+from horizon.utils.memoized import memoized_with_shared_cache  # noqa
 from openstack_dashboard.api import base
 from openstack_dashboard.api import network_base
 from openstack_dashboard.api import nova
@@ -565,6 +569,38 @@ def neutronclient(request):
     return c
 
 
+# Seconds during which the filter length learned from a "414 Request-URI
+# Too Long" response of a Neutron endpoint is remembered.
+FILTER_LENGTH_CACHE_TIMEOUT = 24 * 3600
+
+
+def _filter_length_cache_key(list_method, params):
+    # The listing method is either given the request or bound to an object
+    # holding it, such as a FloatingIpManager.
+    request = params.get('request',
+                         getattr(getattr(list_method, '__self__', None),
+                                 'request', None))
+    if request is None:
+        return None
+    # The other parameters take up part of the URI too, so the length left
+    # for the filter values depends on them and on the resource listed.
+    other_params = sorted((key, repr(value))
+                          for key, value in params.items()
+                          if key != 'request')
+    scope = repr((base.url_for(request, 'network'),
+                  getattr(list_method, '__name__', repr(list_method)),
+                  other_params))
+    return 'horizon:neutron-filter-length:%s' % (
+        hashlib.md5(scope.encode('utf-8')).hexdigest())
+
+
+def _filter_length(filter_attr, filter_values):
+    # Length of each query filter is:
+    # <key>=<value>& (e.g., id=<uuid>)
+    # The length will be key_len + value_len + 2
+    return sum(len(filter_attr) + len(val) + 2 for val in filter_values)
+
+
 def list_resources_with_long_filters(list_method,
                                      filter_attr, filter_values, **params):
     """List neutron resources with handling RequestURITooLong exception.
@@ -572,7 +608,13 @@ def list_resources_with_long_filters(list_method,
     If filter parameters are long, list resources API request leads to
     414 error (URL is too long). For such case, this method split
     list parameters specified by a list_field argument into chunks
-    and call the specified list_method repeatedly.
+    and call the specified list_method concurrently for each chunk.
+
+    The filter length accepted by the neutron server is learned from the
+    first 414 error and kept in the Django cache for each endpoint, listing
+    method and set of other parameters, so that later calls split the
+    filter values up front. A chunk still rejected as too long is split
+    again according to its own 414 error.
 
     :param list_method: Method used to retrieve resource list.
     :param filter_attr: attribute name to be filtered. The value corresponding
@@ -587,36 +629,82 @@ def list_resources_with_long_filters(list_method,
         without any changes. You can specify more filter conditions
         in addition to a pair of filter_attr and filter_values.
     """
-    try:
-        params[filter_attr] = filter_values
-        return list_method(**params)
-    except neutron_exc.RequestURITooLong as uri_len_exc:
-        # The URI is too long because of too many filter values.
-        # Use the excess attribute of the exception to know how many
-        # filter values can be inserted into a single request.
-
-        # We consider only the filter condition from (filter_attr,
-        # filter_values) and do not consider other filter conditions
-        # which may be specified in **params.
-        if type(filter_values) != list:
-            filter_values = [filter_values]
-
-        # Length of each query filter is:
-        # <key>=<value>& (e.g., id=<uuid>)
-        # The length will be key_len + value_maxlen + 2
-        all_filter_len = sum(len(filter_attr) + len(val) + 2
-                             for val in filter_values)
-        allowed_filter_len = all_filter_len - uri_len_exc.excess
-
-        val_maxlen = max(len(val) for val in filter_values)
-        filter_maxlen = len(filter_attr) + val_maxlen + 2
-        chunk_size = allowed_filter_len // filter_maxlen
-
-        resources = []
-        for i in range(0, len(filter_values), chunk_size):
-            params[filter_attr] = filter_values[i:i + chunk_size]
-            resources.extend(list_method(**params))
-        return resources
+    if isinstance(filter_values, six.string_types):
+        values = [filter_values]
+    else:
+        values = list(filter_values)
+
+    # We consider only the filter condition from (filter_attr,
+    # filter_values) and do not consider other filter conditions
+    # which may be specified in **params.
+    all_filter_len = _filter_length(filter_attr, values)
+    cache_key = _filter_length_cache_key(list_method, params)
+    allowed_filter_len = cache_key and cache.get(cache_key)
+    if not allowed_filter_len or all_filter_len <= allowed_filter_len:
+        try:
+            params[filter_attr] = filter_values
+            return list_method(**params)
+        except neutron_exc.RequestURITooLong as uri_len_exc:
+            # The URI is too long because of too many filter values.
+            # Use the excess attribute of the exception to know how many
+            # filter values can be inserted into a single request.
+            allowed_filter_len = all_filter_len - uri_len_exc.excess
+            if cache_key:
+                cache.set(cache_key, allowed_filter_len,
+                          FILTER_LENGTH_CACHE_TIMEOUT)
+
+    values = list(collections.OrderedDict.fromkeys(values))
+    val_maxlen = max(len(val) for val in values)
+    filter_maxlen = len(filter_attr) + val_maxlen + 2
+
+    def split(chunk, allowed_len):
+        size = max(1, allowed_len // filter_maxlen)
+        return [chunk[i:i + size] for i in range(0, len(chunk), size)]
+
+    def list_chunk(chunk):
+        try:
+            return list_method(**dict(params, **{filter_attr: chunk}))
+        except neutron_exc.RequestURITooLong as uri_len_exc:
+            # The cached length is out of date: probe again with the
+            # excess of this chunk and list its parts one after another.
+            if len(chunk) == 1:
+                raise
+            allowed_len = (_filter_length(filter_attr, chunk) -
+                           uri_len_exc.excess)
+            if cache_key:
+                cache.set(cache_key, allowed_len,
+                          FILTER_LENGTH_CACHE_TIMEOUT)
+            parts = split(chunk, allowed_len)
+            if len(parts) == 1:
+                parts = [chunk[:len(chunk) // 2], chunk[len(chunk) // 2:]]
+            return [resource for part in parts
+                    for resource in list_chunk(part)]
+
+    chunks = split(values, allowed_filter_len)
+    resources = []
+    ids = set()
+    for chunk_resources in concurrency.map_bounded(list_chunk, chunks,
+                                                   name='neutron-filters'):
+        for resource in chunk_resources:
+            # Values of filter_attr other than ids may match a resource
+            # in several chunks.
+            resource_id = getattr(resource, 'id', None)
+            if resource_id is not None:
+                if resource_id in ids:
+                    continue
+                ids.add(resource_id)
+            resources.append(resource)
+    return resources
+
+
+def resource_count(request, resource, **params):
+    """Counts the neutron resources matching the filters of ``params``.
+
+    ``resource`` is the plural name used by the listing API, such as
+    "networks" or "routers". Only the resource ids are retrieved.
+    """
+    list_method = getattr(neutronclient(request), 'list_%s' % resource)
+    return len(list_method(fields='id', **params).get(resource))
 
 
 def network_list(request, **params):
@@ -690,6 +778,7 @@ def network_get(request, network_id, expand_subnet=True, **params):
     return Network(network)
 
 
+@base.changes_usage
 def network_create(request, **kwargs):
     """Create a  network object.
 
@@ -717,6 +806,7 @@ def network_update(request, network_id, **kwargs):
     return Network(network)
 
 
+@base.changes_usage
 def network_delete(request, network_id):
     LOG.debug("network_delete(): netid=%s" % network_id)
     neutronclient(request).delete_network(network_id)
@@ -735,6 +825,7 @@ def subnet_get(request, subnet_id, **params):
     return Subnet(subnet)
 
 
+@base.changes_usage
 def subnet_create(request, network_id, **kwargs):
     """Create a subnet on a specified network.
 
@@ -771,6 +862,7 @@ def subnet_update(request, subnet_id, **kwargs):
     return Subnet(subnet)
 
 
+@base.changes_usage
 def subnet_delete(request, subnet_id):
     LOG.debug("subnet_delete(): subnetid=%s" % subnet_id)
     neutronclient(request).delete_subnet(subnet_id)
@@ -862,6 +954,7 @@ def unescape_port_kwargs(**kwargs):
     return kwargs
 
 
+@base.changes_usage
 def port_create(request, network_id, **kwargs):
     """Create a port on a specified network.
 
@@ -885,6 +978,7 @@ def port_create(request, network_id, **kwargs):
     return Port(port)
 
 
+@base.changes_usage
 def port_delete(request, port_id):
     LOG.debug("port_delete(): portid=%s" % port_id)
     neutronclient(request).delete_port(port_id)
@@ -957,6 +1051,7 @@ def profile_bindings_list(request, type_p, **params):
     return [Profile(n) for n in bindings]
 
 
+@base.changes_usage
 def router_create(request, **kwargs):
     LOG.debug("router_create():, kwargs=%s" % kwargs)
     body = {'router': {}}
@@ -993,10 +1088,12 @@ def router_list_on_l3_agent(request, l3_agent_id, **params):
     return [Router(r) for r in routers]
 
 
+@base.changes_usage
 def router_delete(request, router_id):
     neutronclient(request).delete_router(router_id)
 
 
+@base.changes_usage
 def router_add_interface(request, router_id, subnet_id=None, port_id=None):
     body = {}
     if subnet_id:
@@ -1007,6 +1104,7 @@ def router_add_interface(request, router_id, subnet_id=None, port_id=None):
     return client.add_interface_router(router_id, body)
 
 
+@base.changes_usage
 def router_remove_interface(request, router_id, subnet_id=None, port_id=None):
     body = {}
     if subnet_id:
@@ -1016,11 +1114,13 @@ def router_remove_interface(request, router_id, subnet_id=None, port_id=None):
     neutronclient(request).remove_interface_router(router_id, body)
 
 
+@base.changes_usage
 def router_add_gateway(request, router_id, network_id):
     body = {'network_id': network_id}
     neutronclient(request).add_gateway_router(router_id, body)
 
 
+@base.changes_usage
 def router_remove_gateway(request, router_id):
     neutronclient(request).remove_gateway_router(router_id)
 
@@ -1063,6 +1163,7 @@ def tenant_quota_get(request, tenant_id):
     return base.QuotaSet(neutronclient(request).show_quota(tenant_id)['quota'])
 
 
+@base.changes_usage(all_projects=True)
 def tenant_quota_update(request, tenant_id, **kwargs):
     quotas = {'quota': kwargs}
     return neutronclient(request).update_quota(tenant_id, quotas)
@@ -1195,7 +1296,7 @@ def _server_get_addresses(request, server, ports, floating_ips, network_names):
     return dict(addresses)
 
 
-@memoized
+@memoized_with_shared_cache(base.cache_namespace('network'), timeout=3600)
 def list_extensions(request):
     try:
         extensions_list = neutronclient(request).list_extensions()
@@ -1207,7 +1308,7 @@ def list_extensions(request):
         return ()
 
 
-@memoized
+@memoized_with_shared_cache(base.cache_namespace('network'), timeout=3600)
 def is_extension_supported(request, extension_alias):
     extensions = list_extensions(request)
 
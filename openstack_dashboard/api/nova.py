@@ -31,6 +31,7 @@ from novaclient import client as nova_client
 from novaclient import exceptions as nova_exceptions
 from novaclient.v2.contrib import instance_action as nova_instance_action
 from novaclient.v2.contrib import list_extensions as nova_list_extensions
+from novaclient.v2 import flavors as nova_flavors
 from novaclient.v2 import security_group_rules as nova_rules
 from novaclient.v2 import security_groups as nova_security_groups
 from novaclient.v2 import servers as nova_servers
@@ -40,6 +41,7 @@ from horizon import exceptions as horizon_exceptions
 from horizon.utils import functions as utils
 from horizon.utils.memoized import memoized  # noqa
 from horizon.utils.memoized import memoized_with_request  # noqa
+from horizon.utils.memoized import memoized_with_shared_cache  # noqa
 
 from openstack_dashboard.api import base
 from openstack_dashboard.api import network_base
@@ -209,6 +211,25 @@ class NovaUsage(base.APIResourceWrapper):
         return getattr(self, "total_memory_mb_usage", 0)
 
 
+class NovaUsageSummary(base.APIDictWrapper):
+    """Totals of the usage of a project, without the usage of its servers.
+
+    It stands for a ``NovaUsage`` where only the totals of each project are
+    shown.
+    """
+
+    server_usages = ()
+
+    def get_summary(self):
+        summary = dict(self._apidict)
+        del summary['tenant_id']
+        return summary
+
+    @property
+    def total_active_instances(self):
+        return self.instances
+
+
 class SecurityGroup(base.APIResourceWrapper):
     """Wrapper around novaclient.security_groups.SecurityGroup.
 
@@ -514,11 +535,13 @@ def flavor_create(request, name, memory, vcpu, disk, flavorid='auto',
                                                 rxtx_factor=rxtx_factor)
     if (metadata):
         flavor_extra_set(request, flavor.id, metadata)
+    _flavor_list.invalidate()
     return flavor
 
 
 def flavor_delete(request, flavor_id):
     novaclient(request).flavors.delete(flavor_id)
+    _flavor_list.invalidate()
 
 
 def flavor_get(request, flavor_id, get_extras=False):
@@ -528,13 +551,29 @@ def flavor_get(request, flavor_id, get_extras=False):
     return flavor
 
 
-@memoized
+# Invalidated by every flavor change made through this module. Admins see
+# the private flavors of every project, hence the roles in the namespace.
+@memoized_with_shared_cache(base.cache_namespace('compute', per_project=True,
+                                                 per_roles=True))
+def _flavor_list(request, is_public, get_extras):
+    """Returns the details and extra specs of the flavors, as dictionaries."""
+    flavors = novaclient(request).flavors.list(is_public=is_public)
+    return tuple(
+        (flavor.to_dict(),
+         flavor_get_extras(request, flavor.id, True, flavor)
+         if get_extras else None)
+        for flavor in flavors)
+
+
 def flavor_list(request, is_public=True, get_extras=False):
     """Get the list of available instance sizes (flavors)."""
-    flavors = novaclient(request).flavors.list(is_public=is_public)
-    if get_extras:
-        for flavor in flavors:
-            flavor.extras = flavor_get_extras(request, flavor.id, True, flavor)
+    manager = novaclient(request).flavors
+    flavors = []
+    for info, extras in _flavor_list(request, is_public, get_extras):
+        flavor = nova_flavors.Flavor(manager, info, loaded=True)
+        if get_extras:
+            flavor.extras = extras
+        flavors.append(flavor)
     return flavors
 
 
@@ -599,14 +638,18 @@ def flavor_access_list(nova_api, flavor=None):
 
 def add_tenant_to_flavor(request, flavor, tenant):
     """Add a tenant to the given flavor access list."""
-    return novaclient(request).flavor_access.add_tenant_access(
+    access = novaclient(request).flavor_access.add_tenant_access(
         flavor=flavor, tenant=tenant)
+    _flavor_list.invalidate()
+    return access
 
 
 def remove_tenant_from_flavor(request, flavor, tenant):
     """Remove a tenant from the given flavor access list."""
-    return novaclient(request).flavor_access.remove_tenant_access(
+    access = novaclient(request).flavor_access.remove_tenant_access(
         flavor=flavor, tenant=tenant)
+    _flavor_list.invalidate()
+    return access
 
 
 def flavor_get_extras(request, flavor_id, raw=False, flavor=None):
@@ -623,7 +666,9 @@ def flavor_get_extras(request, flavor_id, raw=False, flavor=None):
 def flavor_extra_delete(request, flavor_id, keys):
     """Unset the flavor extra spec keys."""
     flavor = novaclient(request).flavors.get(flavor_id)
-    return flavor.unset_keys(keys)
+    result = flavor.unset_keys(keys)
+    _flavor_list.invalidate()
+    return result
 
 
 def flavor_extra_set(request, flavor_id, metadata):
@@ -631,21 +676,26 @@ def flavor_extra_set(request, flavor_id, metadata):
     flavor = novaclient(request).flavors.get(flavor_id)
     if (not metadata):  # not a way to delete keys
         return None
-    return flavor.set_keys(metadata)
+    result = flavor.set_keys(metadata)
+    _flavor_list.invalidate()
+    return result
 
 
 def snapshot_create(request, instance_id, name):
     return novaclient(request).servers.create_image(instance_id, name)
 
 
+@base.changes_usage
 def keypair_create(request, name):
     return novaclient(request).keypairs.create(name)
 
 
+@base.changes_usage
 def keypair_import(request, name, public_key):
     return novaclient(request).keypairs.create(name, public_key)
 
 
+@base.changes_usage
 def keypair_delete(request, keypair_id):
     novaclient(request).keypairs.delete(keypair_id)
 
@@ -658,6 +708,7 @@ def keypair_get(request, keypair_id):
     return novaclient(request).keypairs.get(keypair_id)
 
 
+@base.changes_usage
 def server_create(request, name, image, flavor, key_name, user_data,
                   security_groups, block_device_mapping=None,
                   block_device_mapping_v2=None, nics=None,
@@ -675,6 +726,7 @@ def server_create(request, name, image, flavor, key_name, user_data,
         meta=meta, scheduler_hints=scheduler_hints), request)
 
 
+@base.changes_usage
 def server_delete(request, instance_id):
     novaclient(request).servers.delete(instance_id)
 
@@ -713,6 +765,19 @@ def server_list(request, search_opts=None, all_tenants=False, project_id=None):
     return (servers, has_more_data)
 
 
+def server_status_counts(request, group_by=None, host=None,
+                         availability_zone=None, project_id=None):
+    """Counts the servers of all projects by status.
+
+    Requires the ServerStatusCounts compute extension. Each returned item
+    has a ``status``, a ``vm_state`` and a ``count``, plus the ``group_by``
+    fields (host, availability_zone, project_id).
+    """
+    return novaclient(request).server_status_counts.list(
+        group_by=group_by, host=host, availability_zone=availability_zone,
+        project_id=project_id)
+
+
 def server_console_output(request, instance_id, tail_length=None):
     """Gets console output of an instance."""
     return novaclient(request).servers.get_console_output(instance_id,
@@ -771,6 +836,7 @@ def server_live_migrate(request, instance_id, host, block_migration=False,
                                              disk_over_commit)
 
 
+@base.changes_usage
 def server_resize(request, instance_id, flavor, disk_config=None, **kwargs):
     novaclient(request).servers.resize(instance_id, flavor,
                                        disk_config, **kwargs)
@@ -812,6 +878,7 @@ def tenant_quota_get(request, tenant_id):
     return base.QuotaSet(novaclient(request).quotas.get(tenant_id))
 
 
+@base.changes_usage(all_projects=True)
 def tenant_quota_update(request, tenant_id, **kwargs):
     if kwargs:
         novaclient(request).quotas.update(tenant_id, **kwargs)
@@ -821,6 +888,7 @@ def default_quota_get(request, tenant_id):
     return base.QuotaSet(novaclient(request).quotas.defaults(tenant_id))
 
 
+@base.changes_usage(all_projects=True)
 def default_quota_update(request, **kwargs):
     novaclient(request).quota_classes.update(DEFAULT_QUOTA_NAME, **kwargs)
 
@@ -829,7 +897,24 @@ def usage_get(request, tenant_id, start, end):
     return NovaUsage(novaclient(request).usage.get(tenant_id, start, end))
 
 
-def usage_list(request, start, end):
+@memoized_with_shared_cache(base.cache_namespace('compute'))
+def _usage_summaries(request, start, end):
+    """Returns the usage totals of every project, as dictionaries."""
+    return tuple(dict(NovaUsage(u).get_summary(), tenant_id=u.tenant_id)
+                 for u in novaclient(request).usage.list(start, end, True))
+
+
+def usage_list(request, start, end, detailed=True):
+    """Returns the usage of every project between ``start`` and ``end``.
+
+    Without ``detailed``, the usage of the servers of each project is left
+    out and ``NovaUsageSummary`` totals are returned. They are computed once
+    for a period and shared through the cache by the requests for the same
+    period, which the usage views align on whole days.
+    """
+    if not detailed:
+        return [NovaUsageSummary(summary)
+                for summary in _usage_summaries(request, start, end)]
     return [NovaUsage(u) for u in
             novaclient(request).usage.list(start, end, True)]
 
@@ -1047,26 +1132,34 @@ def interface_detach(request, server, port_id):
     return novaclient(request).servers.interface_detach(server, port_id)
 
 
-@memoized_with_request(novaclient)
-def list_extensions(nova_api):
+@memoized_with_shared_cache(base.cache_namespace('compute'), timeout=3600)
+def _list_extensions(request):
+    """Returns the details of every nova extension, as dictionaries."""
+    manager = nova_list_extensions.ListExtManager(novaclient(request))
+    return tuple(extension.to_dict() for extension in manager.show_all())
+
+
+def list_extensions(request):
     """List all nova extensions, except the ones in the blacklist."""
     blacklist = set(getattr(settings,
                             'OPENSTACK_NOVA_EXTENSIONS_BLACKLIST', []))
+    manager = nova_list_extensions.ListExtManager(novaclient(request))
     return tuple(
-        extension for extension in
-        nova_list_extensions.ListExtManager(nova_api).show_all()
-        if extension.name not in blacklist
+        nova_list_extensions.ListExtResource(manager, info, loaded=True)
+        for info in _list_extensions(request)
+        if info['name'] not in blacklist
     )
 
 
-@memoized_with_request(list_extensions, 1)
-def extension_supported(extension_name, extensions):
+@memoized_with_shared_cache(base.cache_namespace('compute'), timeout=3600,
+                            request_index=1)
+def extension_supported(extension_name, request):
     """Determine if nova supports a given extension name.
 
     Example values for the extension_name include AdminActions, ConsoleOutput,
     etc.
     """
-    for extension in extensions:
+    for extension in list_extensions(request):
         if extension.name == extension_name:
             return True
     return False
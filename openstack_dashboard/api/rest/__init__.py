@@ -30,5 +30,6 @@ from . import keystone     # noqa
 from . import network      # noqa
 from . import neutron      # noqa
 from . import nova         # noqa
+from . import overview     # noqa
 from . import policy       # noqa
 from . import swift        # noqa
@@ -13,12 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 from django.conf import settings
 from django.views import generic
 
+from horizon.utils import memoized
+
 from openstack_dashboard import api
 from openstack_dashboard.api.rest import urls
 from openstack_dashboard.api.rest import utils as rest_utils
+from openstack_dashboard import policy
 
 
 # settings that we allow to be retrieved via REST API
@@ -52,3 +57,28 @@ class Settings(generic.View):
                           in settings_allowed if k not in self.SPECIALS}
         plain_settings.update(self.SPECIALS)
         return plain_settings
+
+
+@urls.register
+class MemoizedCaches(generic.View):
+    """API for inspecting the memoized caches of the serving process.
+    """
+    url_regex = r'settings/memoized/$'
+
+    @rest_utils.ajax()
+    def get(self, request):
+        """Get the size of the memoized caches of this dashboard process.
+
+        The result has an "items" list, largest first, of objects with the
+        "name" of each memoized function, its number of "entries" and its
+        "max_entries" and "ttl" limits. "shared" holds the hit and miss
+        counters of the functions memoized in the shared cache.
+
+        Each dashboard process has its own caches; the response describes
+        the process that served it, whose "pid" is returned.
+        """
+        if not policy.check((('identity', 'admin_required'),), request):
+            raise rest_utils.AjaxError(403, 'admin role required')
+        return {'pid': os.getpid(),
+                'items': memoized.cache_sizes(),
+                'shared': memoized.shared_cache_stats()}
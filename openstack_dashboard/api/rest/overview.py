@@ -0,0 +1,81 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""API over the cached cluster overview widgets.
+"""
+from django.views import generic
+
+from horizon.templatetags import sizeformat
+
+from openstack_dashboard.api.rest import urls
+from openstack_dashboard.api.rest import utils as rest_utils
+from openstack_dashboard import policy
+from openstack_dashboard.usage import overview
+
+# Hypervisor totals returned pre-formatted, as the templates display them.
+MB_FIELDS = ('memory_mb', 'memory_mb_used')
+GB_FIELDS = ('local_gb', 'local_gb_used')
+
+
+def _display(stats):
+    display = {}
+    for field in MB_FIELDS:
+        display[field] = sizeformat.mb_float_format(stats[field])
+    for field in GB_FIELDS:
+        display[field] = sizeformat.diskgbformat(stats[field])
+    display['local_gb_free'] = sizeformat.diskgbformat(
+        stats['local_gb'] - stats['local_gb_used'])
+    return display
+
+
+@urls.register
+class OverviewWidget(generic.View):
+    """API for one widget of the cluster overview.
+    """
+    url_regex = r'overview/(?P<widget>[a-z_]+)/$'
+
+    @rest_utils.ajax()
+    def get(self, request, widget):
+        """Get one widget of the cluster overview of a region.
+
+        The widget is one of hypervisors, instances and
+        availability_zones. The optional "region" query parameter selects
+        the region, which defaults to the current one, and "refresh"
+        recomputes the widget instead of serving it from the cache. With
+        "all_regions", the widget of every region of the user is summed up;
+        the regions are then listed in "regions", along with their
+        "region_timings" and the "missing_regions" that failed or timed
+        out.
+
+        The result carries the widget data along with "region",
+        "computed_at" and "age" (in seconds).
+        """
+        if not policy.check((('identity', 'admin_required'),), request):
+            raise rest_utils.AjaxError(403, 'admin role required')
+        if widget not in overview.WIDGETS:
+            raise rest_utils.AjaxError(404, 'unknown widget %s' % widget)
+
+        refresh = 'refresh' in request.GET
+        region = request.GET.get('region')
+        if 'all_regions' in request.GET:
+            data = overview.get_regions_widget(
+                request, widget, request.user.available_services_regions,
+                refresh=refresh)
+        elif (region and
+              region not in request.user.available_services_regions):
+            raise rest_utils.AjaxError(400, 'unknown region %s' % region)
+        else:
+            data = overview.get_widget(request, widget, region=region,
+                                       refresh=refresh)
+        data['computed_at'] = data['computed_at'].isoformat()
+        if 'hypervisor_stats' in data:
+            data['display'] = _display(data['hypervisor_stats'])
+        return data
@@ -13,14 +13,10 @@
 # limitations under the License.
 """API for the swift service.
 """
-import os
-
 from django import forms
-from django.http import StreamingHttpResponse
 from django.utils.http import urlunquote
 from django.views.decorators.csrf import csrf_exempt
 from django.views import generic
-import six
 
 from horizon import exceptions
 from openstack_dashboard import api
@@ -124,7 +120,7 @@ class Objects(generic.View):
         if path is not None:
             path = urlunquote(path)
 
-        objects = api.swift.swift_get_objects(
+        objects = api.swift.swift_iter_objects(
             request,
             container,
             prefix=path
@@ -139,7 +135,7 @@ class Objects(generic.View):
             'is_subdir': isinstance(o, swift.PseudoFolder),
             'is_object': not isinstance(o, swift.PseudoFolder),
             'content_type': getattr(o, 'content_type', None)
-        } for o in objects[0] if o.name != path]
+        } for o in objects if o.name != path]
         return {'items': contents}
 
 
@@ -211,27 +207,12 @@ class Object(generic.View):
 
     def get(self, request, container, object_name):
         """Get the object contents.
-        """
-        obj = api.swift.swift_get_object(
-            request,
-            container,
-            object_name
-        )
 
-        # Add the original file extension back on if it wasn't preserved in the
-        # name given to the object.
-        filename = object_name.rsplit(api.swift.FOLDER_DELIMITER)[-1]
-        if not os.path.splitext(obj.name)[1] and obj.orig_name:
-            name, ext = os.path.splitext(obj.orig_name)
-            filename = "%s%s" % (filename, ext)
-        response = StreamingHttpResponse(obj.data)
-        safe = filename.replace(",", "")
-        if six.PY2:
-            safe = safe.encode('utf-8')
-        response['Content-Disposition'] = 'attachment; filename="%s"' % safe
-        response['Content-Type'] = 'application/octet-stream'
-        response['Content-Length'] = obj.bytes
-        return response
+        The contents are streamed, and Range and conditional headers are
+        passed on to Swift.
+        """
+        return api.swift.object_download_response(request, container,
+                                                  object_name)
 
 
 @urls.register
@@ -17,24 +17,57 @@
 #    under the License.
 
 from datetime import datetime
+import hashlib
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+
+import six
 import six.moves.urllib.parse as urlparse
 import swiftclient
 
 from django.conf import settings
+from django import http
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
+from horizon.utils import concurrency
 
 from openstack_dashboard.api import base
 
 
+LOG = logging.getLogger(__name__)
+
 FOLDER_DELIMITER = "/"
 CHUNK_SIZE = getattr(settings, 'SWIFT_FILE_TRANSFER_CHUNK_SIZE', 512 * 1024)
+# Objects larger than this are uploaded as segments of this size, tied
+# together by a static large object manifest.
+SEGMENT_SIZE = getattr(settings, 'SWIFT_SEGMENT_SIZE', 1024 * 1024 * 1024)
+SEGMENTS_CONTAINER_SUFFIX = '_segments'
+# Number of entries of a folder looked at by a filter.
+FILTER_LIMIT = 9999
 # Swift ACL
 GLOBAL_READ_ACL = ".r:*"
 LIST_CONTENTS_ACL = ".rlistings"
 
 
+# Headers of a download request passed on to Swift, by their key in the
+# request META.
+DOWNLOAD_REQUEST_HEADERS = {
+    'HTTP_RANGE': 'Range',
+    'HTTP_IF_RANGE': 'If-Range',
+    'HTTP_IF_NONE_MATCH': 'If-None-Match',
+    'HTTP_IF_MODIFIED_SINCE': 'If-Modified-Since',
+}
+
+# Downloads streamed at the same time by a dashboard process.
+_downloads = threading.BoundedSemaphore(
+    getattr(settings, 'SWIFT_DOWNLOADS_PER_WORKER', 10))
+
+
 class Container(base.APIDictWrapper):
     pass
 
@@ -194,8 +227,7 @@ def swift_update_container(request, name, metadata=({})):
 def swift_delete_container(request, name):
     # It cannot be deleted if it's not empty. The batch remove of objects
     # be done in swiftclient instead of Horizon.
-    objects, more = swift_get_objects(request, name)
-    if objects:
+    if not swift_is_empty(request, name):
         error_msg = _("The container cannot be deleted "
                       "since it is not empty.")
         exc = exceptions.Conflict(error_msg)
@@ -204,14 +236,25 @@ def swift_delete_container(request, name):
     return True
 
 
+def swift_is_empty(request, container_name, prefix=None):
+    """Returns whether no object of ``container_name`` starts with ``prefix``.
+
+    The placeholder object of a pseudo folder, named ``prefix``, does not
+    count. At most two objects are listed, however many the container holds.
+    """
+    headers, objects = swift_api(request).get_container(container_name,
+                                                        prefix=prefix,
+                                                        limit=2)
+    return all(obj.get('name') == prefix for obj in objects)
+
+
 def swift_get_objects(request, container_name, prefix=None, marker=None,
                       limit=None):
     limit = limit or getattr(settings, 'API_RESULT_LIMIT', 1000)
     kwargs = dict(prefix=prefix,
                   marker=marker,
                   limit=limit + 1,
-                  delimiter=FOLDER_DELIMITER,
-                  full_listing=True)
+                  delimiter=FOLDER_DELIMITER)
     headers, objects = swift_api(request).get_container(container_name,
                                                         **kwargs)
     object_objs = _objectify(objects, container_name)
@@ -222,25 +265,50 @@ def swift_get_objects(request, container_name, prefix=None, marker=None,
         return (object_objs, False)
 
 
+def swift_iter_objects(request, container_name, prefix=None, marker=None,
+                       page_size=None):
+    """Yields the objects and pseudo folders of a folder in listing order.
+
+    The folder is listed one page of ``page_size`` entries at a time, each
+    page being requested once the previous one was consumed.
+    """
+    page_size = page_size or getattr(settings, 'API_RESULT_LIMIT', 1000)
+    api = swift_api(request)
+    while True:
+        headers, items = api.get_container(container_name,
+                                           prefix=prefix,
+                                           marker=marker,
+                                           limit=page_size,
+                                           delimiter=FOLDER_DELIMITER)
+        for obj in _objectify(items, container_name):
+            yield obj
+        if len(items) < page_size:
+            return
+        marker = items[-1].get('name', items[-1].get('subdir'))
+
+
 def swift_filter_objects(request, filter_string, container_name, prefix=None,
                          marker=None):
-    # FIXME(kewu): Swift currently has no real filtering API, thus the marker
-    # parameter here won't actually help the pagination. For now I am just
-    # getting the largest number of objects from a container and filtering
-    # based on those objects.
-    limit = 9999
-    objects = swift_get_objects(request,
-                                container_name,
-                                prefix=prefix,
-                                marker=marker,
-                                limit=limit)
+    """Returns the objects and pseudo folders of a folder matching a filter.
+
+    As Swift has no real filtering API, the first ``FILTER_LIMIT`` entries
+    of the folder are listed a page at a time and filtered with
+    ``wildcard_search``. A Swift prefix query cannot be used, even for a
+    filter such as ``name*``, since the filter text may appear anywhere in
+    a name.
+    """
+    objects = swift_iter_objects(request,
+                                 container_name,
+                                 prefix=prefix,
+                                 marker=marker)
     filter_string_list = filter_string.lower().strip().split(' ')
 
     def matches_filter(obj):
         for q in filter_string_list:
             return wildcard_search(obj.name.lower(), q)
 
-    return filter(matches_filter, objects[0])
+    return [obj for obj in itertools.islice(objects, FILTER_LIMIT)
+            if matches_filter(obj)]
 
 
 def wildcard_search(string, q):
@@ -270,14 +338,177 @@ def swift_copy_object(request, orig_container_name, orig_object_name,
                                          headers=headers)
 
 
+class _SegmentReader(object):
+    """File-like object reading the ``length`` bytes of a file at ``offset``.
+
+    Positions given to ``seek`` and returned by ``tell`` are relative to
+    the segment, so that a segment can be read again, e.g. when its upload
+    is retried. ``on_close`` is called once the segment is closed.
+    """
+
+    def __init__(self, fileobj, offset, length, on_close):
+        self._file = fileobj
+        self._offset = offset
+        self._length = length
+        self._on_close = on_close
+        self._closed = False
+        self.seek(0)
+
+    def read(self, size=-1):
+        remaining = self._length - self._position
+        if size < 0 or size > remaining:
+            size = remaining
+        data = self._file.read(size)
+        self._position += len(data)
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._length
+        offset = max(0, min(offset, self._length))
+        self._file.seek(self._offset + offset)
+        self._position = offset
+
+    def tell(self):
+        return self._position
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._on_close()
+
+
+def _segment_opener(object_file):
+    # Uploads saved to disk are read through a file handle for each segment,
+    # so that segments are streamed concurrently. Other files are streamed
+    # one segment at a time. Either way, only the chunks being sent are held
+    # in memory.
+    if hasattr(object_file, 'temporary_file_path'):
+        path = object_file.temporary_file_path()
+
+        def open_segment(offset, length):
+            segment = open(path, 'rb')
+            try:
+                return _SegmentReader(segment, offset, length, segment.close)
+            except Exception:
+                segment.close()
+                raise
+    else:
+        lock = threading.Lock()
+
+        def open_segment(offset, length):
+            # Held until the segment is closed, unless it cannot be opened.
+            lock.acquire()
+            try:
+                return _SegmentReader(object_file, offset, length,
+                                      lock.release)
+            except Exception:
+                lock.release()
+                raise
+    return open_segment
+
+
+def _segment_etag(segment):
+    md5 = hashlib.md5()
+    for data in iter(lambda: segment.read(CHUNK_SIZE), b''):
+        md5.update(data)
+    return md5.hexdigest()
+
+
+def _upload_segmented_object(request, container_name, object_name,
+                             object_file, headers, segment_size):
+    start = time.time()
+    size = object_file.size
+    segments_container = container_name + SEGMENTS_CONTAINER_SUFFIX
+    # Segment names only depend on the object and its size, so that an
+    # upload of the same file retried after a failure finds the segments
+    # stored by the previous attempt.
+    prefix = '%s/slo/%d/%d/' % (object_name, size, segment_size)
+
+    swift_api(request).put_container(segments_container)
+    try:
+        stored = dict((item['name'], item) for item in swift_api(
+            request).get_container(segments_container, prefix=prefix,
+                                   full_listing=True)[1])
+    except swiftclient.client.ClientException:
+        stored = {}
+
+    open_segment = _segment_opener(object_file)
+
+    def upload_segment(index):
+        offset = index * segment_size
+        length = min(segment_size, size - offset)
+        name = '%s%08d' % (prefix, index)
+        item = stored.get(name)
+        etag = None
+        if item is not None and item['bytes'] == length:
+            segment = open_segment(offset, length)
+            try:
+                if _segment_etag(segment) == item['hash']:
+                    etag = item['hash']
+            finally:
+                segment.close()
+        uploaded = etag is None
+        if uploaded:
+            segment = open_segment(offset, length)
+            try:
+                etag = swift_api(request).put_object(
+                    segments_container, name, segment,
+                    content_length=length, chunk_size=CHUNK_SIZE)
+            finally:
+                segment.close()
+        return uploaded, {'path': '/%s/%s' % (segments_container, name),
+                          'etag': etag,
+                          'size_bytes': length}
+
+    segments = concurrency.map_bounded(
+        upload_segment, range((size + segment_size - 1) // segment_size),
+        name='swift-segments')
+    manifest = [segment for uploaded, segment in segments]
+    etag = swift_api(request).put_object(container_name,
+                                         object_name,
+                                         json.dumps(manifest),
+                                         headers=headers,
+                                         query_string='multipart-manifest=put')
+
+    duration = max(time.time() - start, 0.001)
+    uploaded_bytes = sum(segment['size_bytes']
+                         for uploaded, segment in segments if uploaded)
+    LOG.info('Uploaded %s/%s in %d segments (%d stored before): '
+             '%d bytes sent in %.1fs (%.1f MB/s).',
+             container_name, object_name, len(segments),
+             len([uploaded for uploaded, segment in segments
+                  if not uploaded]),
+             uploaded_bytes, duration, uploaded_bytes / duration / 1e6)
+    return etag
+
+
 def swift_upload_object(request, container_name, object_name,
-                        object_file=None):
+                        object_file=None, segment_size=None):
+    """Uploads ``object_file`` as ``object_name``.
+
+    Files larger than ``segment_size`` (``SWIFT_SEGMENT_SIZE`` by default)
+    are uploaded concurrently as segments stored in the
+    ``<container_name>_segments`` container, then joined by a static large
+    object manifest. Segments stored by a failed upload of the same file are
+    reused when uploading it again.
+    """
     headers = {}
     size = 0
     if object_file:
         headers['X-Object-Meta-Orig-Filename'] = object_file.name
         size = object_file.size
 
+    segment_size = segment_size or SEGMENT_SIZE
+    if object_file and size > segment_size:
+        etag = _upload_segmented_object(request, container_name,
+                                        object_name, object_file, headers,
+                                        segment_size)
+        obj_info = {'name': object_name, 'bytes': size, 'etag': etag}
+        return StorageObject(obj_info, container_name)
+
     etag = swift_api(request).put_object(container_name,
                                          object_name,
                                          object_file,
@@ -307,21 +538,21 @@ def swift_create_pseudo_folder(request, container_name, pseudo_folder_name):
 
 
 def swift_delete_object(request, container_name, object_name):
-    swift_api(request).delete_object(container_name, object_name)
+    """Deletes an object, with its segments if it is a static large object.
+    """
+    headers = swift_api(request).head_object(container_name, object_name)
+    query_string = None
+    if headers.get('x-static-large-object', '').lower() == 'true':
+        query_string = 'multipart-manifest=delete'
+    swift_api(request).delete_object(container_name, object_name,
+                                     query_string=query_string)
     return True
 
 
 def swift_delete_folder(request, container_name, object_name):
-    objects, more = swift_get_objects(request, container_name,
-                                      prefix=object_name)
     # In case the given object is pseudo folder,
     # it can be deleted only if it is empty.
-    # swift_get_objects will return at least
-    # one object (i.e container_name) even if the
-    # given pseudo folder is empty. So if swift_get_objects
-    # returns more than one object then only it will be
-    # considered as non empty folder.
-    if len(objects) > 1:
+    if not swift_is_empty(request, container_name, prefix=object_name):
         error_msg = _("The pseudo folder cannot be deleted "
                       "since it is not empty.")
         exc = exceptions.Conflict(error_msg)
@@ -331,10 +562,17 @@ def swift_delete_folder(request, container_name, object_name):
 
 
 def swift_get_object(request, container_name, object_name, with_data=True,
-                     resp_chunk_size=CHUNK_SIZE):
+                     resp_chunk_size=CHUNK_SIZE, headers=None):
+    """Returns an object and, with ``with_data``, its data.
+
+    ``headers`` are sent with the request getting the data, such as a Range
+    header or conditional headers.
+    """
     if with_data:
+        kwargs = {'headers': headers} if headers else {}
         headers, data = swift_api(request).get_object(
-            container_name, object_name, resp_chunk_size=resp_chunk_size)
+            container_name, object_name, resp_chunk_size=resp_chunk_size,
+            **kwargs)
     else:
         data = None
         headers = swift_api(request).head_object(container_name,
@@ -352,6 +590,8 @@ def swift_get_object(request, container_name, object_name, with_data=True,
         'content_type': headers.get('content-type'),
         'etag': headers.get('etag'),
         'timestamp': timestamp,
+        'last_modified': headers.get('last-modified'),
+        'content_range': headers.get('content-range'),
     }
     return StorageObject(obj_info,
                          container_name,
@@ -359,6 +599,102 @@ def swift_get_object(request, container_name, object_name, with_data=True,
                          data=data)
 
 
+class _DownloadContent(object):
+    """Iterates over the chunks of an object, then frees its download slot.
+
+    Django closes the content once the response was sent, or when the
+    client went away.
+    """
+
+    def __init__(self, data):
+        self._data = data
+        self._closed = False
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            if hasattr(self._data, 'close'):
+                self._data.close()
+            _downloads.release()
+
+
+def _quote_etag(etag):
+    if etag and not etag.startswith('"'):
+        return '"%s"' % etag
+    return etag
+
+
+def object_download_response(request, container_name, object_path):
+    """Returns a response streaming an object from Swift.
+
+    The object is streamed in chunks of ``SWIFT_FILE_TRANSFER_CHUNK_SIZE``
+    bytes. Range and conditional headers of the request are passed on to
+    Swift, so that downloads can be resumed and cached by the browser. At
+    most ``SWIFT_DOWNLOADS_PER_WORKER`` downloads are streamed at once by a
+    process, further ones are answered with "503 Service Unavailable".
+
+    Errors of Swift other than "304 Not Modified" and "416 Requested Range
+    Not Satisfiable" are raised.
+    """
+    if not _downloads.acquire(False):
+        response = http.HttpResponse(status=503)
+        response['Retry-After'] = '10'
+        return response
+
+    headers = dict((name, request.META[key])
+                   for key, name in DOWNLOAD_REQUEST_HEADERS.items()
+                   if key in request.META)
+    try:
+        obj = swift_get_object(request, container_name, object_path,
+                               resp_chunk_size=CHUNK_SIZE, headers=headers)
+    except swiftclient.client.ClientException as e:
+        _downloads.release()
+        if e.http_status == 304:
+            return http.HttpResponseNotModified()
+        if e.http_status == 416:
+            return http.HttpResponse(status=416)
+        raise
+    except Exception:
+        _downloads.release()
+        raise
+
+    content = _DownloadContent(obj.data)
+    try:
+        return _download_response(obj, object_path, content)
+    except Exception:
+        content.close()
+        raise
+
+
+def _download_response(obj, object_path, content):
+    # Add the original file extension back on if it wasn't preserved in the
+    # name given to the object.
+    filename = object_path.rsplit(FOLDER_DELIMITER)[-1]
+    if not os.path.splitext(obj.name)[1] and obj.orig_name:
+        name, ext = os.path.splitext(obj.orig_name)
+        filename = "%s%s" % (filename, ext)
+    content_range = getattr(obj, 'content_range', None)
+    response = http.StreamingHttpResponse(content,
+                                          status=206 if content_range else 200)
+    safe_name = filename.replace(",", "")
+    if six.PY2:
+        safe_name = safe_name.encode('utf-8')
+    response['Content-Disposition'] = 'attachment; filename="%s"' % safe_name
+    response['Content-Type'] = 'application/octet-stream'
+    response['Content-Length'] = obj.bytes
+    response['Accept-Ranges'] = 'bytes'
+    if content_range:
+        response['Content-Range'] = content_range
+    if getattr(obj, 'etag', None):
+        response['ETag'] = _quote_etag(obj.etag)
+    if getattr(obj, 'last_modified', None):
+        response['Last-Modified'] = obj.last_modified
+    return response
+
+
 def swift_get_capabilities(request):
     try:
         return swift_api(request).get_capabilities()
@@ -26,19 +26,18 @@ INDEX_URL = reverse('horizon:admin:floating_ips:index')
 class AdminFloatingIpViewTest(test.BaseAdminViewTests):
     @test.create_stubs({api.network: ('tenant_floating_ip_list', ),
                         api.nova: ('server_list', ),
-                        api.keystone: ('tenant_list', ),
+                        api.keystone: ('tenant_names', ),
                         api.neutron: ('network_list', )})
     def test_index(self):
         # Use neutron test data
         fips = self.q_floating_ips.list()
         servers = self.servers.list()
-        tenants = self.tenants.list()
         api.network.tenant_floating_ip_list(IsA(http.HttpRequest),
                                             all_tenants=True).AndReturn(fips)
         api.nova.server_list(IsA(http.HttpRequest), all_tenants=True) \
             .AndReturn([servers, False])
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         params = {"router:external": True}
         api.neutron.network_list(IsA(http.HttpRequest), **params) \
             .AndReturn(self.networks.list())
@@ -182,20 +181,19 @@ class AdminFloatingIpViewTest(test.BaseAdminViewTests):
     @test.create_stubs({api.network: ('tenant_floating_ip_list',
                                       'floating_ip_disassociate'),
                         api.nova: ('server_list', ),
-                        api.keystone: ('tenant_list', ),
+                        api.keystone: ('tenant_names', ),
                         api.neutron: ('network_list', )})
     def test_admin_disassociate_floatingip(self):
         # Use neutron test data
         fips = self.q_floating_ips.list()
         floating_ip = self.q_floating_ips.list()[1]
         servers = self.servers.list()
-        tenants = self.tenants.list()
         api.network.tenant_floating_ip_list(IsA(http.HttpRequest),
                                             all_tenants=True).AndReturn(fips)
         api.nova.server_list(IsA(http.HttpRequest), all_tenants=True) \
             .AndReturn([servers, False])
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         params = {"router:external": True}
         api.neutron.network_list(IsA(http.HttpRequest), **params) \
             .AndReturn(self.networks.list())
@@ -212,20 +210,19 @@ class AdminFloatingIpViewTest(test.BaseAdminViewTests):
 
     @test.create_stubs({api.network: ('tenant_floating_ip_list', ),
                         api.nova: ('server_list', ),
-                        api.keystone: ('tenant_list', ),
+                        api.keystone: ('tenant_names', ),
                         api.neutron: ('network_list', )})
     def test_admin_delete_floatingip(self):
         # Use neutron test data
         fips = self.q_floating_ips.list()
         floating_ip = self.q_floating_ips.list()[1]
         servers = self.servers.list()
-        tenants = self.tenants.list()
         api.network.tenant_floating_ip_list(IsA(http.HttpRequest),
                                             all_tenants=True).AndReturn(fips)
         api.nova.server_list(IsA(http.HttpRequest), all_tenants=True) \
             .AndReturn([servers, False])
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         params = {"router:external": True}
         api.neutron.network_list(IsA(http.HttpRequest), **params) \
             .AndReturn(self.networks.list())
@@ -241,19 +238,18 @@ class AdminFloatingIpViewTest(test.BaseAdminViewTests):
 
     @test.create_stubs({api.network: ('tenant_floating_ip_list', ),
                         api.nova: ('server_list', ),
-                        api.keystone: ('tenant_list', ),
+                        api.keystone: ('tenant_names', ),
                         api.neutron: ('network_list', )})
     def test_floating_ip_table_actions(self):
         # Use neutron test data
         fips = self.q_floating_ips.list()
         servers = self.servers.list()
-        tenants = self.tenants.list()
         api.network.tenant_floating_ip_list(IsA(http.HttpRequest),
                                             all_tenants=True).AndReturn(fips)
         api.nova.server_list(IsA(http.HttpRequest), all_tenants=True) \
             .AndReturn([servers, False])
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         params = {"router:external": True}
         api.neutron.network_list(IsA(http.HttpRequest), **params) \
             .AndReturn(self.networks.list())
@@ -13,8 +13,6 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from collections import OrderedDict
-
 from django.core.urlresolvers import reverse
 from django.core.urlresolvers import reverse_lazy
 from django.utils.translation import ugettext_lazy as _
@@ -84,8 +82,13 @@ class IndexView(tables.DataTableView):
                     _('Unable to retrieve instance list.'))
             instances_dict = dict([(obj.id, obj.name) for obj in instances])
 
-            tenants = get_tenant_list(self.request)
-            tenant_dict = OrderedDict([(t.id, t) for t in tenants])
+            try:
+                tenant_names = api.keystone.tenant_names(
+                    self.request, set(ip.tenant_id for ip in floating_ips))
+            except Exception:
+                tenant_names = {}
+                msg = _('Unable to retrieve project list.')
+                exceptions.handle(self.request, msg)
 
             pools = get_floatingip_pools(self.request)
             pool_dict = dict([(obj.id, obj.name) for obj in pools])
@@ -93,8 +96,7 @@ class IndexView(tables.DataTableView):
             for ip in floating_ips:
                 ip.instance_name = instances_dict.get(ip.instance_id)
                 ip.pool_name = pool_dict.get(ip.pool, ip.pool)
-                tenant = tenant_dict.get(ip.tenant_id, None)
-                ip.tenant_name = getattr(tenant, "name", None)
+                ip.tenant_name = tenant_names.get(ip.tenant_id)
 
         return floating_ips
 
@@ -44,3 +44,4 @@ class HypervisorHostTabs(tabs.TabGroup):
     slug = "hypervisor_info"
     tabs = (HypervisorTab, cmp_tabs.ComputeHostTab)
     sticky = True
+    concurrent_data_loading = True
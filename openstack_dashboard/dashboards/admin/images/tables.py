@@ -66,8 +66,8 @@ class UpdateRow(tables.Row):
         image = api.glance.image_get(request, image_id)
         try:
             tenant_id = getattr(image, "owner")
-            tenant = api.keystone.tenant_get(request, tenant_id)
-            image.tenant_name = getattr(tenant, "name")
+            image.tenant_name = api.keystone.tenant_names(
+                request, [tenant_id]).get(tenant_id)
         except Exception:
             msg = _('Unable to retrieve the project '
                     'information of the image.')
@@ -102,3 +102,10 @@ class AdminImagesTable(project_tables.ImagesTable):
         row_actions = (AdminEditImage, UpdateMetadata, AdminDeleteImage)
         columns = ('tenant', 'name', 'image_type', 'status', 'public',
                    'protected', 'disk_format', 'size')
+        api_pagination = True
+        api_sort_keys = {'name': 'name',
+                         'status': 'status',
+                         'disk_format': 'disk_format',
+                         'size': 'size'}
+        default_sort_key = 'name'
+        default_sort_dir = 'asc'
@@ -44,7 +44,7 @@ class ImageCreateViewTest(test.BaseAdminViewTests):
 
 class ImagesViewTest(test.BaseAdminViewTests):
     @test.create_stubs({api.glance: ('image_list_detailed',),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_names',)})
     def test_images_list(self):
         filters = {'is_public': None}
         api.glance.image_list_detailed(IsA(http.HttpRequest),
@@ -57,8 +57,8 @@ class ImagesViewTest(test.BaseAdminViewTests):
             .AndReturn([self.images.list(),
                         False, False])
         # Test tenant list
-        api.keystone.tenant_list(IsA(http.HttpRequest)).\
-            AndReturn([self.tenants.list(), False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set)).\
+            AndReturn(self.tenant_names)
         self.mox.ReplayAll()
 
         res = self.client.get(
@@ -77,7 +77,7 @@ class ImagesViewTest(test.BaseAdminViewTests):
 
     @override_settings(API_RESULT_PAGE_SIZE=2)
     @test.create_stubs({api.glance: ('image_list_detailed',),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_names',)})
     def test_images_list_get_pagination(self):
         images = self.images.list()[:5]
         filters = {'is_public': None}
@@ -101,8 +101,8 @@ class ImagesViewTest(test.BaseAdminViewTests):
                                        **kwargs) \
             .AndReturn([images[4:], True, True])
         # Test tenant list
-        api.keystone.tenant_list(IsA(http.HttpRequest)).MultipleTimes().\
-            AndReturn([self.tenants.list(), False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .MultipleTimes().AndReturn(self.tenant_names)
         self.mox.ReplayAll()
 
         url = reverse('horizon:admin:images:index')
@@ -138,7 +138,7 @@ class ImagesViewTest(test.BaseAdminViewTests):
 
     @override_settings(API_RESULT_PAGE_SIZE=2)
     @test.create_stubs({api.glance: ('image_list_detailed',),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_names',)})
     def test_images_list_get_prev_pagination(self):
         images = self.images.list()[:3]
         filters = {'is_public': None}
@@ -165,8 +165,8 @@ class ImagesViewTest(test.BaseAdminViewTests):
                                        **kwargs) \
             .AndReturn([images[:2], True, True])
         # Test tenant list
-        api.keystone.tenant_list(IsA(http.HttpRequest)).MultipleTimes().\
-            AndReturn([self.tenants.list(), False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .MultipleTimes().AndReturn(self.tenant_names)
         self.mox.ReplayAll()
 
         url = reverse('horizon:admin:images:index')
@@ -51,72 +51,54 @@ class IndexView(tables.DataTableView):
     table_class = project_tables.AdminImagesTable
     template_name = 'admin/images/index.html'
     page_title = _("Images")
-
-    def has_prev_data(self, table):
-        return self._prev
-
-    def has_more_data(self, table):
-        return self._more
+    _needs_filter_first = False
 
     def needs_filter_first(self, table):
         return self._needs_filter_first
 
-    def get_data(self):
+    def get_page(self, query):
         images = []
+        more = prev = False
 
         if not policy.check((("image", "get_images"),), self.request):
             msg = _("Insufficient privilege level to retrieve image list.")
             messages.info(self.request, msg)
-            return images
+            return images, more, prev
         filters = self.get_filters()
 
         filter_first = getattr(settings, 'FILTER_DATA_FIRST', {})
         if filter_first.get('admin.images', False) and \
                 len(filters) == len(self.DEFAULT_FILTERS):
-            self._prev = False
-            self._more = False
             self._needs_filter_first = True
-            return images
+            return images, more, prev
 
         self._needs_filter_first = False
 
-        prev_marker = self.request.GET.get(
-            project_tables.AdminImagesTable._meta.prev_pagination_param, None)
-
-        if prev_marker is not None:
-            marker = prev_marker
-        else:
-            marker = self.request.GET.get(
-                project_tables.AdminImagesTable._meta.pagination_param, None)
-        reversed_order = prev_marker is not None
         try:
-            images, self._more, self._prev = api.glance.image_list_detailed(
+            images, more, prev = api.glance.image_list_detailed(
                 self.request,
-                marker=marker,
+                marker=query.marker,
                 paginate=True,
                 filters=filters,
-                sort_dir='asc',
-                sort_key='name',
-                reversed_order=reversed_order)
+                sort_dir=query.sort_dir,
+                sort_key=query.sort_key,
+                reversed_order=query.reversed_order)
 
         except Exception:
-            self._prev = False
-            self._more = False
             msg = _('Unable to retrieve image list.')
             exceptions.handle(self.request, msg)
         if images:
             try:
-                tenants, more = api.keystone.tenant_list(self.request)
+                tenant_names = api.keystone.tenant_names(
+                    self.request, set(image.owner for image in images))
             except Exception:
-                tenants = []
+                tenant_names = {}
                 msg = _('Unable to retrieve project list.')
                 exceptions.handle(self.request, msg)
 
-            tenant_dict = dict([(t.id, t.name) for t in tenants])
-
             for image in images:
-                image.tenant_name = tenant_dict.get(image.owner)
-        return images
+                image.tenant_name = tenant_names.get(image.owner)
+        return images, more, prev
 
     def get_filters(self):
         filters = self.DEFAULT_FILTERS.copy()
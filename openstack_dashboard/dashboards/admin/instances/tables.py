@@ -88,10 +88,8 @@ class LiveMigrateInstance(policy.PolicyTargetMixin,
 class AdminUpdateRow(project_tables.UpdateRow):
     def get_data(self, request, instance_id):
         instance = super(AdminUpdateRow, self).get_data(request, instance_id)
-        tenant = api.keystone.tenant_get(request,
-                                         instance.tenant_id,
-                                         admin=True)
-        instance.tenant_name = getattr(tenant, "name", None)
+        instance.tenant_name = api.keystone.tenant_names(
+            request, [instance.tenant_id]).get(instance.tenant_id)
         return instance
 
 
@@ -111,6 +109,14 @@ class AdminInstanceFilterAction(tables.FilterAction):
                       ('flavor', _("Flavor ID ="), True))
 
 
+def get_row_actions_key(instance):
+    """Returns everything the admin instance row actions are allowed by."""
+    return (instance.status,
+            getattr(instance, "OS-EXT-STS:task_state", None),
+            getattr(instance, "tenant_id", None),
+            getattr(instance, "user_id", None))
+
+
 class AdminInstancesTable(tables.DataTable):
     TASK_STATUS_CHOICES = (
         (None, True),
@@ -190,3 +196,9 @@ class AdminInstancesTable(tables.DataTable):
                        project_tables.SoftRebootInstance,
                        project_tables.RebootInstance,
                        project_tables.DeleteInstance)
+        api_pagination = True
+        api_sort_keys = {'name': 'display_name',
+                         'host': 'host',
+                         'created': 'created_at'}
+        compiled_rows = True
+        row_actions_allowed_key = get_row_actions_key
@@ -31,18 +31,18 @@ INDEX_URL = reverse('horizon:admin:instances:index')
 class InstanceViewTest(test.BaseAdminViewTests):
     @test.create_stubs({api.nova: ('flavor_list', 'server_list',
                                    'extension_supported',),
-                        api.keystone: ('tenant_list',),
+                        api.keystone: ('tenant_names',),
                         api.network: ('servers_update_addresses',)})
     def test_index(self):
         servers = self.servers.list()
         flavors = self.flavors.list()
-        tenants = self.tenants.list()
         api.nova.extension_supported('AdminActions', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
         api.nova.extension_supported('Shelve', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
-        api.keystone.tenant_list(IsA(http.HttpRequest)).\
-            AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .AndReturn(dict((tenant.id, tenant.name)
+                            for tenant in self.tenants.list()))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
                              all_tenants=True, search_opts=search_opts) \
@@ -59,11 +59,10 @@ class InstanceViewTest(test.BaseAdminViewTests):
 
     @test.create_stubs({api.nova: ('flavor_list', 'flavor_get',
                                    'server_list', 'extension_supported',),
-                        api.keystone: ('tenant_list',),
+                        api.keystone: ('tenant_names',),
                         api.network: ('servers_update_addresses',)})
     def test_index_flavor_list_exception(self):
         servers = self.servers.list()
-        tenants = self.tenants.list()
         flavors = self.flavors.list()
         full_flavors = OrderedDict([(f.id, f) for f in flavors])
 
@@ -79,11 +78,12 @@ class InstanceViewTest(test.BaseAdminViewTests):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)). \
             AndRaise(self.exceptions.nova)
-        api.keystone.tenant_list(IsA(http.HttpRequest)).\
-            AndReturn([tenants, False])
-        for server in servers:
-            api.nova.flavor_get(IsA(http.HttpRequest), server.flavor["id"]). \
-                AndReturn(full_flavors[server.flavor["id"]])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .AndReturn(dict((tenant.id, tenant.name)
+                            for tenant in self.tenants.list()))
+        for flavor_id in set(server.flavor["id"] for server in servers):
+            api.nova.flavor_get(IsA(http.HttpRequest), flavor_id). \
+                InAnyOrder().AndReturn(full_flavors[flavor_id])
 
         self.mox.ReplayAll()
 
@@ -94,12 +94,11 @@ class InstanceViewTest(test.BaseAdminViewTests):
 
     @test.create_stubs({api.nova: ('flavor_list', 'flavor_get',
                                    'server_list', 'extension_supported', ),
-                        api.keystone: ('tenant_list',),
+                        api.keystone: ('tenant_names',),
                         api.network: ('servers_update_addresses',)})
     def test_index_flavor_get_exception(self):
         servers = self.servers.list()
         flavors = self.flavors.list()
-        tenants = self.tenants.list()
         # UUIDs generated using indexes are unlikely to match
         # any of existing flavor ids and are guaranteed to be deterministic.
         for i, server in enumerate(servers):
@@ -117,11 +116,12 @@ class InstanceViewTest(test.BaseAdminViewTests):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)). \
             AndReturn(flavors)
-        api.keystone.tenant_list(IsA(http.HttpRequest)).\
-            AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .AndReturn(dict((tenant.id, tenant.name)
+                            for tenant in self.tenants.list()))
         for server in servers:
             api.nova.flavor_get(IsA(http.HttpRequest), server.flavor["id"]). \
-                AndRaise(self.exceptions.nova)
+                InAnyOrder().AndRaise(self.exceptions.nova)
         self.mox.ReplayAll()
 
         res = self.client.get(INDEX_URL)
@@ -133,16 +133,12 @@ class InstanceViewTest(test.BaseAdminViewTests):
         self.assertMessageCount(res, error=1)
         self.assertItemsEqual(instances, servers)
 
-    @test.create_stubs({api.nova: ('server_list',),
-                        api.keystone: ('tenant_list',)})
+    @test.create_stubs({api.nova: ('server_list',)})
     def test_index_server_list_exception(self):
-        tenants = self.tenants.list()
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
                              all_tenants=True, search_opts=search_opts) \
             .AndRaise(self.exceptions.nova)
-        api.keystone.tenant_list(IsA(http.HttpRequest)).\
-            AndReturn([tenants, False])
 
         self.mox.ReplayAll()
 
@@ -153,7 +149,7 @@ class InstanceViewTest(test.BaseAdminViewTests):
     @test.create_stubs({api.nova: ('server_get', 'flavor_get',
                                    'extension_supported', ),
                         api.network: ('servers_update_addresses',),
-                        api.keystone: ('tenant_get',)})
+                        api.keystone: ('tenant_names',)})
     def test_ajax_loading_instances(self):
         server = self.servers.first()
         flavor = self.flavors.list()[0]
@@ -165,9 +161,9 @@ class InstanceViewTest(test.BaseAdminViewTests):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_get(IsA(http.HttpRequest),
                             server.flavor['id']).AndReturn(flavor)
-        api.keystone.tenant_get(IsA(http.HttpRequest),
-                                server.tenant_id,
-                                admin=True).AndReturn(tenant)
+        api.keystone.tenant_names(IsA(http.HttpRequest),
+                                  [server.tenant_id]) \
+            .AndReturn({server.tenant_id: tenant.name})
         self.mox.ReplayAll()
 
         url = (INDEX_URL +
@@ -190,12 +186,13 @@ class InstanceViewTest(test.BaseAdminViewTests):
 
     @test.create_stubs({api.nova: ('flavor_list', 'server_list',
                                    'extension_supported', ),
-                        api.keystone: ('tenant_list',),
+                        api.keystone: ('tenant_names',),
                         api.network: ('servers_update_addresses',)})
     def test_index_options_before_migrate(self):
         servers = self.servers.list()
-        api.keystone.tenant_list(IsA(http.HttpRequest)).\
-            AndReturn([self.tenants.list(), False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .AndReturn(dict((tenant.id, tenant.name)
+                            for tenant in self.tenants.list()))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest),
                              all_tenants=True, search_opts=search_opts) \
@@ -217,7 +214,7 @@ class InstanceViewTest(test.BaseAdminViewTests):
 
     @test.create_stubs({api.nova: ('flavor_list', 'server_list',
                                    'extension_supported', ),
-                        api.keystone: ('tenant_list',),
+                        api.keystone: ('tenant_names',),
                         api.network: ('servers_update_addresses',)})
     def test_index_options_after_migrate(self):
         servers = self.servers.list()
@@ -225,8 +222,9 @@ class InstanceViewTest(test.BaseAdminViewTests):
         server1.status = "VERIFY_RESIZE"
         server2 = servers[2]
         server2.status = "VERIFY_RESIZE"
-        api.keystone.tenant_list(IsA(http.HttpRequest)) \
-            .AndReturn([self.tenants.list(), False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .AndReturn(dict((tenant.id, tenant.name)
+                            for tenant in self.tenants.list()))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.extension_supported('AdminActions', IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(True)
@@ -17,8 +17,6 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from collections import OrderedDict
-
 from django.conf import settings
 from django.core.urlresolvers import reverse
 from django.core.urlresolvers import reverse_lazy
@@ -69,17 +67,15 @@ class AdminIndexView(tables.DataTableView):
     template_name = 'admin/instances/index.html'
     page_title = _("Instances")
 
-    def has_more_data(self, table):
-        return self._more
-
     def needs_filter_first(self, table):
         return self._needs_filter_first
 
-    def get_data(self):
+    def get_page(self, query):
         instances = []
-        marker = self.request.GET.get(
-            project_tables.AdminInstancesTable._meta.pagination_param, None)
-        default_search_opts = {'marker': marker, 'paginate': True}
+        default_search_opts = {'marker': query.marker, 'paginate': True}
+        if query.sort_key:
+            default_search_opts.update(sort_key=query.sort_key,
+                                       sort_dir=query.sort_dir)
 
         search_opts = self.get_filters(default_search_opts.copy())
 
@@ -90,73 +86,40 @@ class AdminIndexView(tables.DataTableView):
         if filter_first.get('admin.instances', False) and \
                 len(search_opts) == len(default_search_opts):
             self._needs_filter_first = True
-            self._more = False
-            return instances
+            return instances, False, False
 
         self._needs_filter_first = False
-        # Gather our tenants to correlate against IDs
-        try:
-            tenants, has_more = api.keystone.tenant_list(self.request)
-        except Exception:
-            tenants = []
-            msg = _('Unable to retrieve instance project information.')
-            exceptions.handle(self.request, msg)
-
         if 'project' in search_opts:
+            try:
+                tenants, has_more = api.keystone.tenant_list(self.request)
+            except Exception:
+                tenants = []
+                msg = _('Unable to retrieve instance project information.')
+                exceptions.handle(self.request, msg)
             ten_filter_ids = [t.id for t in tenants
                               if t.name == search_opts['project']]
             del search_opts['project']
             if len(ten_filter_ids) > 0:
                 search_opts['tenant_id'] = ten_filter_ids[0]
             else:
-                self._more = False
-                return []
+                return [], False, False
 
+        more = False
         try:
-            instances, self._more = api.nova.server_list(
+            instances, more = api.nova.server_list(
                 self.request,
                 search_opts=search_opts,
                 all_tenants=True)
         except Exception:
-            self._more = False
             exceptions.handle(self.request,
                               _('Unable to retrieve instance list.'))
-        if instances:
-            try:
-                api.network.servers_update_addresses(self.request, instances,
-                                                     all_tenants=True)
-            except Exception:
-                exceptions.handle(
-                    self.request,
-                    message=_('Unable to retrieve IP addresses from Neutron.'),
-                    ignore=True)
-
-            # Gather our flavors to correlate against IDs
-            try:
-                flavors = api.nova.flavor_list(self.request)
-            except Exception:
-                # If fails to retrieve flavor list, creates an empty list.
-                flavors = []
-
-            full_flavors = OrderedDict([(f.id, f) for f in flavors])
-            tenant_dict = OrderedDict([(t.id, t) for t in tenants])
-            # Loop through instances to get flavor and tenant info.
-            for inst in instances:
-                flavor_id = inst.flavor["id"]
-                try:
-                    if flavor_id in full_flavors:
-                        inst.full_flavor = full_flavors[flavor_id]
-                    else:
-                        # If the flavor_id is not in full_flavors list,
-                        # gets it via nova api.
-                        inst.full_flavor = api.nova.flavor_get(
-                            self.request, flavor_id)
-                except Exception:
-                    msg = _('Unable to retrieve instance size information.')
-                    exceptions.handle(self.request, msg)
-                tenant = tenant_dict.get(inst.tenant_id, None)
-                inst.tenant_name = getattr(tenant, "name", None)
-        return instances
+        # Only the flavors and projects of the listed page are looked up.
+        api.enrichment.servers_update_details(
+            self.request, instances, all_tenants=True, images=False,
+            tenant_names=True,
+            flavor_error_message=_('Unable to retrieve instance size '
+                                   'information.'))
+        return instances, more, False
 
 
 class LiveMigrateView(forms.ModalFormView):
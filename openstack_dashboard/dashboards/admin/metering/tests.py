@@ -13,6 +13,7 @@
 from django.core.urlresolvers import reverse
 from django import http
 
+from ceilometerclient.v2 import statistics
 from mox3.mox import IsA  # noqa
 from oslo_serialization import jsonutils
 import six
@@ -77,7 +78,21 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
 
         self.assertEqual(data.get('settings'), {})
 
-    @test.create_stubs({api.keystone: ('tenant_list',),
+    def _grouped_statistics(self, groups):
+        grouped = []
+        for groupby in groups:
+            info = dict(self.testdata.statistics.first()._info,
+                        groupby=groupby)
+            grouped.append(statistics.Statistics(
+                statistics.StatisticsManager(None), info))
+        return grouped
+
+    def _project_statistics(self):
+        return self._grouped_statistics(
+            [{'project_id': tenant.id}
+             for tenant in self.testdata.tenants.list()])
+
+    @test.create_stubs({api.keystone: ('tenant_names',),
                         api.ceilometer: ('sample_list',
                                          'statistic_list',
                                          ), })
@@ -88,12 +103,12 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
         api.ceilometer.statistic_list(IsA(http.HttpRequest),
                                       'memory',
                                       period=IsA(int),
-                                      query=IsA(list)).MultipleTimes()\
-            .AndReturn(self.testdata.statistics.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest),
-                                 domain=None,
-                                 paginate=False) \
-            .AndReturn([self.testdata.tenants.list(), False])
+                                      query=IsA(list),
+                                      groupby=['project_id'])\
+            .AndReturn(self._project_statistics())
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .AndReturn(dict((tenant.id, tenant.name)
+                            for tenant in self.testdata.tenants.list()))
 
         self.mox.ReplayAll()
 
@@ -110,7 +125,7 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
         self._verify_series(res._container[0], 4.55, '2012-12-21T11:00:55',
                             expected_names)
 
-    @test.create_stubs({api.keystone: ('tenant_list',),
+    @test.create_stubs({api.keystone: ('tenant_names',),
                         api.ceilometer: ('sample_list',
                                          'statistic_list',
                                          ), })
@@ -120,12 +135,12 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
                                    limit=IsA(int)).AndReturn([])
         api.ceilometer.statistic_list(IsA(http.HttpRequest),
                                       'memory', period=IsA(int),
-                                      query=IsA(list))\
-            .MultipleTimes().AndReturn(self.testdata.statistics.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest),
-                                 domain=None,
-                                 paginate=False) \
-            .AndReturn([self.testdata.tenants.list(), False])
+                                      query=IsA(list),
+                                      groupby=['project_id'])\
+            .AndReturn(self._project_statistics())
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .AndReturn(dict((tenant.id, tenant.name)
+                            for tenant in self.testdata.tenants.list()))
 
         self.mox.ReplayAll()
 
@@ -143,8 +158,7 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
         self._verify_series(res._container[0], 9.0, '2012-12-21T11:00:55',
                             expected_names)
 
-    @test.create_stubs({api.keystone: ('tenant_list',),
-                        api.ceilometer: ('sample_list',
+    @test.create_stubs({api.ceilometer: ('sample_list',
                                          'resource_list',
                                          'statistic_list'
                                          ), })
@@ -155,14 +169,15 @@ class MeteringLineChartTabTests(test.BaseAdminViewTests):
         api.ceilometer.resource_list(IsA(http.HttpRequest), query=None,
                                      ceilometer_usage_object=None)\
             .AndReturn(self.testdata.api_resources.list())
+        resource = self.testdata.api_resources.list()[3]
         api.ceilometer.statistic_list(IsA(http.HttpRequest),
                                       'memory', period=IsA(int),
-                                      query=IsA(list))\
-            .MultipleTimes().AndReturn(self.testdata.statistics.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest),
-                                 domain=None,
-                                 paginate=False) \
-            .AndReturn([self.testdata.tenants.list(), False])
+                                      query=IsA(list),
+                                      groupby=api.ceilometer.RESOURCE_GROUPBY)\
+            .AndReturn(self._grouped_statistics([
+                {'project_id': resource.project_id,
+                 'user_id': resource.user_id,
+                 'resource_id': resource.resource_id}]))
 
         self.mox.ReplayAll()
 
@@ -89,7 +89,7 @@ class CsvReportView(django.views.generic.View):
     def get(self, request, **response_kwargs):
         render_class = ReportCsvRenderer
         response_kwargs.setdefault("filename", "usage.csv")
-        context = {'usage': load_report_data(request)}
+        context = {'usage': iter_report_rows(request)}
         resp = render_class(request=request,
                             template=None,
                             context=context,
@@ -98,25 +98,30 @@ class CsvReportView(django.views.generic.View):
         return resp
 
 
-class ReportCsvRenderer(csvbase.BaseCsvResponse):
+class ReportCsvRenderer(csvbase.BaseCsvStreamingResponse):
 
     columns = [_("Project Name"), _("Meter"), _("Description"),
                _("Service"), _("Time"), _("Value (Avg)"), _("Unit")]
 
     def get_row_data(self):
 
-        for p in self.context['usage'].values():
-            for u in p:
-                yield (u["project"],
-                       u["meter"],
-                       u["description"],
-                       u["service"],
-                       u["time"],
-                       u["value"],
-                       u["unit"])
+        for u in self.context['usage']:
+            yield (u["project"],
+                   u["meter"],
+                   u["description"],
+                   u["service"],
+                   u["time"],
+                   u["value"],
+                   u["unit"])
 
 
-def load_report_data(request):
+def iter_report_rows(request):
+    """Returns an iterator over the rows of the usage report.
+
+    The report period and the meters are resolved right away. The statistics
+    of each meter are then only queried once the rows of the previous meter
+    were consumed. Rows are therefore grouped by meter, then by project.
+    """
     meters = ceilometer.Meters(request)
     services = {
         _('Nova'): meters.list_nova(),
@@ -127,7 +132,6 @@ def load_report_data(request):
         _('Kwapi'): meters.list_kwapi(),
         _('IPMI'): meters.list_ipmi(),
     }
-    project_rows = {}
     date_options = request.GET.get('date_options', 7)
     date_from = request.GET.get('date_from')
     date_to = request.GET.get('date_to')
@@ -145,27 +149,26 @@ def load_report_data(request):
     except Exception:
         exceptions.handle(request,
                           _('Unable to retrieve project list.'))
-    for meter in meters._cached_meters.values():
-        service = None
-        for name, m_list in services.items():
-            if meter in m_list:
-                service = name
-                break
-        res, unit = project_aggregates.query(meter.name)
-        for r in res:
-            values = r.get_meter(meter.name.replace(".", "_"))
-            if values:
-                for value in values:
-                    row = {"name": 'none',
-                           "project": r.id,
-                           "meter": meter.name,
-                           "description": meter.description,
-                           "service": service,
-                           "time": value._apiresource.period_end,
-                           "value": value._apiresource.avg,
-                           "unit": meter.unit}
-                    if r.id not in project_rows:
-                        project_rows[r.id] = [row]
-                    else:
-                        project_rows[r.id].append(row)
-    return project_rows
+
+    def rows():
+        for meter in meters._cached_meters.values():
+            service = None
+            for name, m_list in services.items():
+                if meter in m_list:
+                    service = name
+                    break
+            res, unit = project_aggregates.query(meter.name)
+            for r in sorted(res, key=lambda r: r.id):
+                values = r.get_meter(meter.name.replace(".", "_"))
+                if values:
+                    for value in values:
+                        yield {"name": 'none',
+                               "project": r.id,
+                               "meter": meter.name,
+                               "description": meter.description,
+                               "service": service,
+                               "time": value._apiresource.period_end,
+                               "value": value._apiresource.avg,
+                               "unit": meter.unit}
+
+    return rows()
@@ -31,13 +31,12 @@ class NetworkTests(test.BaseAdminViewTests):
     @test.create_stubs({api.neutron: ('network_list',
                                       'list_dhcp_agent_hosting_networks',
                                       'is_extension_supported'),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_names',)})
     def test_index(self):
-        tenants = self.tenants.list()
         api.neutron.network_list(IsA(http.HttpRequest)) \
             .AndReturn(self.networks.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         for network in self.networks.list():
             api.neutron.list_dhcp_agent_hosting_networks(IsA(http.HttpRequest),
                                                          network.id)\
@@ -704,9 +703,8 @@ class NetworkTests(test.BaseAdminViewTests):
                                       'network_delete',
                                       'list_dhcp_agent_hosting_networks',
                                       'is_extension_supported'),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_names',)})
     def test_delete_network(self):
-        tenants = self.tenants.list()
         network = self.networks.first()
         api.neutron.list_dhcp_agent_hosting_networks(IsA(http.HttpRequest),
                                                      network.id).\
@@ -717,8 +715,8 @@ class NetworkTests(test.BaseAdminViewTests):
         api.neutron.is_extension_supported(
             IsA(http.HttpRequest),
             'dhcp_agent_scheduler').AndReturn(True)
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         api.neutron.network_list(IsA(http.HttpRequest))\
             .AndReturn([network])
         api.neutron.network_delete(IsA(http.HttpRequest), network.id)
@@ -734,9 +732,8 @@ class NetworkTests(test.BaseAdminViewTests):
                                       'network_delete',
                                       'list_dhcp_agent_hosting_networks',
                                       'is_extension_supported'),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_names',)})
     def test_delete_network_exception(self):
-        tenants = self.tenants.list()
         network = self.networks.first()
         api.neutron.list_dhcp_agent_hosting_networks(IsA(http.HttpRequest),
                                                      network.id).\
@@ -747,8 +744,8 @@ class NetworkTests(test.BaseAdminViewTests):
         api.neutron.is_extension_supported(
             IsA(http.HttpRequest),
             'dhcp_agent_scheduler').AndReturn(True)
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         api.neutron.network_list(IsA(http.HttpRequest))\
             .AndReturn([network])
         api.neutron.network_delete(IsA(http.HttpRequest), network.id)\
@@ -12,8 +12,6 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-from collections import OrderedDict
-
 from django.conf import settings
 from django.core.urlresolvers import reverse_lazy
 from django.utils.translation import ugettext_lazy as _
@@ -49,18 +47,16 @@ class IndexView(tables.DataTableView):
                        'router:external': {_("yes"): True, _("no"): False},
                        'admin_state_up': {_("up"): True, _("down"): False}}
 
-    @memoized.memoized_method
-    def _get_tenant_list(self):
+    def _get_tenant_names(self, resources):
+        """Returns the names of the projects owning ``resources``, by id."""
         try:
-            tenants, has_more = api.keystone.tenant_list(self.request)
+            return api.keystone.tenant_names(
+                self.request, set(r.tenant_id for r in resources))
         except Exception:
-            tenants = []
             msg = _("Unable to retrieve information about the "
                     "networks' projects.")
             exceptions.handle(self.request, msg)
-
-        tenant_dict = OrderedDict([(t.id, t) for t in tenants])
-        return tenant_dict
+            return {}
 
     def _get_agents_data(self, network):
         agents = []
@@ -104,11 +100,10 @@ class IndexView(tables.DataTableView):
             exceptions.handle(self.request, msg)
         if networks:
             self.exception = False
-            tenant_dict = self._get_tenant_list()
+            tenant_names = self._get_tenant_names(networks)
             for n in networks:
                 # Set tenant name
-                tenant = tenant_dict.get(n.tenant_id, None)
-                n.tenant_name = getattr(tenant, 'name', None)
+                n.tenant_name = tenant_names.get(n.tenant_id)
                 n.num_agents = self._get_agents_data(n.id)
         return networks
 
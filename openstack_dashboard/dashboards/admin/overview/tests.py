@@ -42,7 +42,7 @@ class UsageViewTests(test.BaseAdminViewTests):
         self.mox.StubOutWithMock(api.nova, 'usage_list')
         self.mox.StubOutWithMock(api.nova, 'tenant_absolute_limits')
         self.mox.StubOutWithMock(api.nova, 'extension_supported')
-        self.mox.StubOutWithMock(api.keystone, 'tenant_list')
+        self.mox.StubOutWithMock(api.keystone, 'tenant_names')
         self.mox.StubOutWithMock(api.neutron, 'is_extension_supported')
         self.mox.StubOutWithMock(api.network, 'floating_ip_supported')
         self.mox.StubOutWithMock(api.network, 'tenant_floating_ip_list')
@@ -83,11 +83,11 @@ class UsageViewTests(test.BaseAdminViewTests):
             .AndReturn(nova_stu_enabled)
         usage_list = [api.nova.NovaUsage(u) for u in self.usages.list()]
         if tenant_deleted:
-            api.keystone.tenant_list(IsA(http.HttpRequest)) \
-                .AndReturn([[self.tenants.first()], False])
+            tenants = [self.tenants.first()]
         else:
-            api.keystone.tenant_list(IsA(http.HttpRequest)) \
-                .AndReturn([self.tenants.list(), False])
+            tenants = self.tenants.list()
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .AndReturn(dict((t.id, t.name) for t in tenants))
 
         if nova_stu_enabled:
             start_day, now = self._get_start_end_range(overview_days_range)
@@ -97,7 +97,8 @@ class UsageViewTests(test.BaseAdminViewTests):
                                                   start_day.day, 0, 0, 0, 0),
                                 datetime.datetime(now.year,
                                                   now.month,
-                                                  now.day, 23, 59, 59, 0)) \
+                                                  now.day, 23, 59, 59, 0),
+                                detailed=False) \
                 .AndReturn(usage_list)
         api.nova.tenant_absolute_limits(IsA(http.HttpRequest), reserved=True) \
             .AndReturn(self.limits['absolute'])
@@ -182,8 +183,8 @@ class UsageViewTests(test.BaseAdminViewTests):
             'SimpleTenantUsage', IsA(http.HttpRequest)) \
             .AndReturn(nova_stu_enabled)
         usage_obj = [api.nova.NovaUsage(u) for u in self.usages.list()]
-        api.keystone.tenant_list(IsA(http.HttpRequest)) \
-                    .AndReturn([self.tenants.list(), False])
+        names = dict((tenant.id, tenant.name)
+                     for tenant in self.tenants.list())
         if nova_stu_enabled:
             start_day, now = self._get_start_end_range(overview_days_range)
             api.nova.usage_list(IsA(http.HttpRequest),
@@ -193,34 +194,31 @@ class UsageViewTests(test.BaseAdminViewTests):
                                                   0, 0, 0, 0),
                                 datetime.datetime(now.year,
                                                   now.month,
-                                                  now.day, 23, 59, 59, 0)) \
+                                                  now.day, 23, 59, 59, 0),
+                                detailed=False) \
                 .AndReturn(usage_obj)
-        api.nova.tenant_absolute_limits(IsA(http.HttpRequest), reserved=True)\
-            .AndReturn(self.limits['absolute'])
-        api.neutron.is_extension_supported(IsA(http.HttpRequest),
-                                           'security-group').AndReturn(True)
-        api.network.floating_ip_supported(IsA(http.HttpRequest)) \
-            .AndReturn(True)
-        api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.floating_ips.list())
-        api.network.security_group_list(IsA(http.HttpRequest)) \
-            .AndReturn(self.q_secgroups.list())
-        api.cinder.tenant_absolute_limits(IsA(http.HttpRequest)) \
-            .AndReturn(self.cinder_limits['absolute'])
+            api.keystone.tenant_names(
+                IsA(http.HttpRequest),
+                set(u.tenant_id for u in usage_obj)).AndReturn(names)
         self.mox.ReplayAll()
 
         csv_url = reverse('horizon:admin:overview:index') + "?format=csv"
         res = self.client.get(csv_url)
         self.assertTemplateUsed(res, 'admin/overview/usage.csv')
         self.assertIsInstance(res.context['usage'], usage.GlobalUsage)
+        content = encoding.force_text(b''.join(res.streaming_content))
         hdr = 'Project Name,VCPUs,RAM (MB),Disk (GB),Usage (Hours)'
-        self.assertContains(res, '%s\r\n' % hdr)
+        self.assertIn('%s\r\n' % hdr, content)
 
         if nova_stu_enabled:
             for obj in usage_obj:
-                row = u'{0},{1},{2},{3},{4:.2f}\r\n'.format(obj.project_name,
-                                                            obj.vcpus,
-                                                            obj.memory_mb,
-                                                            obj.disk_gb_hours,
-                                                            obj.vcpu_hours)
-                self.assertContains(res, row)
+                row = u'{0},{1},{2},{3},{4:.2f}\r\n'.format(
+                    names[obj.tenant_id],
+                    obj.vcpus,
+                    obj.memory_mb,
+                    obj.disk_gb_hours,
+                    obj.vcpu_hours)
+                self.assertIn(row, content)
+            # The totals follow the rows they summarize.
+            self.assertIn('Total VCPU Usage (Hours):,%.2f' % sum(
+                obj.vcpu_hours for obj in usage_obj), content)
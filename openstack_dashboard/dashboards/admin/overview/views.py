@@ -16,6 +16,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import itertools
+
 from django.conf import settings
 from django.template.defaultfilters import floatformat  # noqa
 from django.utils import translation
@@ -28,19 +30,33 @@ from openstack_dashboard import api
 from openstack_dashboard import usage
 
 
-class GlobalUsageCsvRenderer(csvbase.BaseCsvResponse):
+# Number of rows of the CSV report whose project names are looked up at once.
+CSV_NAMES_BATCH_SIZE = 100
+
+
+class GlobalUsageCsvRenderer(csvbase.BaseCsvStreamingResponse):
 
     columns = [_("Project Name"), _("VCPUs"), _("RAM (MB)"),
                _("Disk (GB)"), _("Usage (Hours)")]
 
     def get_row_data(self):
-
-        for u in self.context['usage'].usage_list:
-            yield (u.project_name or u.tenant_id,
-                   u.vcpus,
-                   u.memory_mb,
-                   u.local_gb,
-                   floatformat(u.vcpu_hours, 2))
+        usages = iter(self.context['usage'].usage_list)
+        while True:
+            batch = list(itertools.islice(usages, CSV_NAMES_BATCH_SIZE))
+            if not batch:
+                return
+            try:
+                names = api.keystone.tenant_names(
+                    self.request, set(u.tenant_id for u in batch))
+            except Exception:
+                names = {}
+                exceptions.handle(self.request, ignore=True)
+            for u in batch:
+                yield (names.get(u.tenant_id) or u.tenant_id,
+                       u.vcpus,
+                       u.memory_mb,
+                       u.local_gb,
+                       floatformat(u.vcpu_hours, 2))
 
 
 class GlobalOverview(usage.UsageView):
@@ -56,19 +72,22 @@ class GlobalOverview(usage.UsageView):
 
     def get_data(self):
         data = super(GlobalOverview, self).get_data()
+        if self.request.GET.get('format', 'html') == 'csv':
+            # The CSV report looks up the names of its projects itself.
+            return data
         # Pre-fill project names
         try:
-            projects, has_more = api.keystone.tenant_list(self.request)
+            names = api.keystone.tenant_names(
+                self.request, set(instance.tenant_id for instance in data))
         except Exception:
-            projects = []
+            names = {}
             exceptions.handle(self.request,
                               _('Unable to retrieve project list.'))
         for instance in data:
-            project = [t for t in projects if t.id == instance.tenant_id]
             # If we could not get the project name, show the tenant_id with
             # a 'Deleted' identifier instead.
-            if project:
-                instance.project_name = getattr(project[0], "name", None)
+            if instance.tenant_id in names:
+                instance.project_name = names[instance.tenant_id]
             else:
                 deleted = _("Deleted")
                 instance.project_name = translation.string_concat(
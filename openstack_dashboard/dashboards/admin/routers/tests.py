@@ -34,13 +34,12 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
         return res
 
     @test.create_stubs({api.neutron: ('router_list', 'network_list'),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_names',)})
     def test_index(self):
-        tenants = self.tenants.list()
         api.neutron.router_list(
             IsA(http.HttpRequest)).AndReturn(self.routers.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         self._mock_external_network_list()
 
         self.mox.ReplayAll()
@@ -52,7 +51,7 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
         self.assertItemsEqual(routers, self.routers.list())
 
     @test.create_stubs({api.neutron: ('router_list',),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_names',)})
     def test_index_router_list_exception(self):
         api.neutron.router_list(
             IsA(http.HttpRequest)).AndRaise(self.exceptions.neutron)
@@ -67,9 +66,8 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
     @test.create_stubs({api.neutron: ('agent_list',
                                       'router_list_on_l3_agent',
                                       'network_list'),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_names',)})
     def test_list_by_l3_agent(self):
-        tenants = self.tenants.list()
         agent = self.agents.list()[1]
         api.neutron.agent_list(
             IsA(http.HttpRequest),
@@ -78,8 +76,8 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
             IsA(http.HttpRequest),
             agent.id,
             search_opts=None).AndReturn(self.routers.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         self._mock_external_network_list()
 
         self.mox.ReplayAll()
@@ -92,13 +90,13 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
         self.assertItemsEqual(routers, self.routers.list())
 
     @test.create_stubs({api.neutron: ('router_list', 'network_list'),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_names',)})
     def test_set_external_network_empty(self):
         router = self.routers.first()
         api.neutron.router_list(
             IsA(http.HttpRequest)).AndReturn([router])
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([self.tenants.list(), False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         self._mock_external_network_list(alter_ids=True)
         self.mox.ReplayAll()
 
@@ -113,19 +111,18 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
 
     @test.create_stubs({api.neutron: ('router_list', 'network_list',
                                       'port_list', 'router_delete',),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_names',)})
     def test_router_delete(self):
         router = self.routers.first()
-        tenants = self.tenants.list()
         api.neutron.router_list(
             IsA(http.HttpRequest)).AndReturn(self.routers.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         self._mock_external_network_list()
         api.neutron.router_list(
             IsA(http.HttpRequest)).AndReturn(self.routers.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         self._mock_external_network_list()
         api.neutron.port_list(IsA(http.HttpRequest),
                               device_id=router.id, device_owner=IgnoreArg())\
@@ -133,8 +130,8 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
         api.neutron.router_delete(IsA(http.HttpRequest), router.id)
         api.neutron.router_list(
             IsA(http.HttpRequest)).AndReturn(self.routers.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         self._mock_external_network_list()
         self.mox.ReplayAll()
 
@@ -150,20 +147,19 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
     @test.create_stubs({api.neutron: ('router_list', 'network_list',
                                       'port_list', 'router_remove_interface',
                                       'router_delete',),
-                        api.keystone: ('tenant_list',)})
+                        api.keystone: ('tenant_names',)})
     def test_router_with_interface_delete(self):
         router = self.routers.first()
         ports = self.ports.list()
-        tenants = self.tenants.list()
         api.neutron.router_list(
             IsA(http.HttpRequest)).AndReturn(self.routers.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         self._mock_external_network_list()
         api.neutron.router_list(
             IsA(http.HttpRequest)).AndReturn(self.routers.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         self._mock_external_network_list()
         api.neutron.port_list(IsA(http.HttpRequest),
                               device_id=router.id, device_owner=IgnoreArg())\
@@ -174,8 +170,8 @@ class RouterTests(test.BaseAdminViewTests, r_test.RouterTests):
         api.neutron.router_delete(IsA(http.HttpRequest), router.id)
         api.neutron.router_list(
             IsA(http.HttpRequest)).AndReturn(self.routers.list())
-        api.keystone.tenant_list(IsA(http.HttpRequest))\
-            .AndReturn([tenants, False])
+        api.keystone.tenant_names(IsA(http.HttpRequest), IsA(set))\
+            .AndReturn(self.tenant_names)
         self._mock_external_network_list()
         self.mox.ReplayAll()
 
@@ -46,8 +46,8 @@ class UpdateRow(tables.Row):
         tenant_id = getattr(snapshot._volume,
                             'os-vol-tenant-attr:tenant_id')
         try:
-            tenant = keystone.tenant_get(request, tenant_id)
-            snapshot.tenant_name = getattr(tenant, "name")
+            snapshot.tenant_name = keystone.tenant_names(
+                request, [tenant_id]).get(tenant_id)
         except Exception:
             msg = _('Unable to retrieve volume project information.')
             exceptions.handle(request, msg)
@@ -33,6 +33,18 @@ from openstack_dashboard.dashboards.project.volumes \
     import tabs as volumes_tabs
 
 
+def get_tenant_names(request, volumes):
+    """Returns the names of the projects owning ``volumes``, by id."""
+    try:
+        return keystone.tenant_names(
+            request, set(getattr(volume, 'os-vol-tenant-attr:tenant_id', None)
+                         for volume in volumes))
+    except Exception:
+        msg = _('Unable to retrieve volume project information.')
+        exceptions.handle(request, msg)
+        return {}
+
+
 class VolumeTab(volumes_tabs.PagedTableMixin, tabs.TableTab,
                 volumes_tabs.VolumeTableMixIn, tables.DataTableView):
     table_classes = (volumes_tables.VolumesTable,)
@@ -80,19 +92,11 @@ class VolumeTab(volumes_tabs.PagedTableMixin, tabs.TableTab,
         self._set_volume_attributes(
             volumes, instances, volume_ids_with_snapshots)
 
-        # Gather our tenants to correlate against IDs
-        try:
-            tenants, has_more = keystone.tenant_list(self.request)
-        except Exception:
-            tenants = []
-            msg = _('Unable to retrieve volume project information.')
-            exceptions.handle(self.request, msg)
-
-        tenant_dict = OrderedDict([(t.id, t) for t in tenants])
+        # Resolve the names of the projects of this page only
+        tenant_names = get_tenant_names(self.request, volumes)
         for volume in volumes:
             tenant_id = getattr(volume, "os-vol-tenant-attr:tenant_id", None)
-            tenant = tenant_dict.get(tenant_id, None)
-            volume.tenant_name = getattr(tenant, "name", None)
+            volume.tenant_name = tenant_names.get(tenant_id)
 
         return volumes
 
@@ -184,22 +188,16 @@ class SnapshotTab(volumes_tabs.PagedTableMixin, tabs.TableTab):
                 exceptions.handle(self.request, _("Unable to retrieve "
                                                   "volume snapshots."))
 
-            # Gather our tenants to correlate against volume IDs
-            try:
-                tenants, has_more = keystone.tenant_list(self.request)
-            except Exception:
-                tenants = []
-                msg = _('Unable to retrieve volume project information.')
-                exceptions.handle(self.request, msg)
-
-            tenant_dict = dict([(t.id, t) for t in tenants])
+            # Resolve the names of the projects of this page only
+            tenant_names = get_tenant_names(
+                self.request,
+                [volumes.get(snapshot.volume_id) for snapshot in snapshots])
             for snapshot in snapshots:
                 volume = volumes.get(snapshot.volume_id)
                 tenant_id = getattr(volume,
                                     'os-vol-tenant-attr:tenant_id', None)
-                tenant = tenant_dict.get(tenant_id, None)
                 snapshot._volume = volume
-                snapshot.tenant_name = getattr(tenant, "name", None)
+                snapshot.tenant_name = tenant_names.get(tenant_id)
                 snapshot.host_name = getattr(
                     volume, 'os-vol-host-attr:host', None)
 
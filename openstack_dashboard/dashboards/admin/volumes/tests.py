@@ -39,7 +39,7 @@ class VolumeTests(test.BaseAdminViewTests):
     @test.create_stubs({api.nova: ('server_list',),
                         cinder: ('volume_list_paged',
                                  'volume_snapshot_list'),
-                        keystone: ('tenant_list',)})
+                        keystone: ('tenant_names',)})
     def _test_index(self, instanceless_volumes=False):
         volumes = self.cinder_volumes.list()
         if instanceless_volumes:
@@ -56,8 +56,8 @@ class VolumeTests(test.BaseAdminViewTests):
             api.nova.server_list(IsA(http.HttpRequest), search_opts={
                                  'all_tenants': True}) \
                 .AndReturn([self.servers.list(), False])
-        keystone.tenant_list(IsA(http.HttpRequest)) \
-            .AndReturn([self.tenants.list(), False])
+        keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .AndReturn(self.tenant_names)
 
         self.mox.ReplayAll()
         res = self.client.get(INDEX_URL)
@@ -75,7 +75,7 @@ class VolumeTests(test.BaseAdminViewTests):
     @test.create_stubs({api.nova: ('server_list',),
                         cinder: ('volume_list_paged',
                                  'volume_snapshot_list'),
-                        keystone: ('tenant_list',)})
+                        keystone: ('tenant_names',)})
     def _test_index_paginated(self, marker, sort_dir, volumes, url,
                               has_more, has_prev):
         vol_snaps = self.cinder_volume_snapshots.list()
@@ -88,8 +88,8 @@ class VolumeTests(test.BaseAdminViewTests):
         api.nova.server_list(IsA(http.HttpRequest), search_opts={
                              'all_tenants': True}) \
             .AndReturn([self.servers.list(), False])
-        keystone.tenant_list(IsA(http.HttpRequest)) \
-            .AndReturn([self.tenants.list(), False])
+        keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .AndReturn(self.tenant_names)
 
         self.mox.ReplayAll()
 
@@ -204,7 +204,7 @@ class VolumeTests(test.BaseAdminViewTests):
 
     @test.create_stubs({cinder: ('volume_list',
                                  'volume_snapshot_list_paged',),
-                        keystone: ('tenant_list',)})
+                        keystone: ('tenant_names',)})
     def test_snapshots_tab(self):
         cinder.volume_snapshot_list_paged(
             IsA(http.HttpRequest), paginate=True, marker=None, sort_dir='desc',
@@ -213,8 +213,8 @@ class VolumeTests(test.BaseAdminViewTests):
         cinder.volume_list(IsA(http.HttpRequest), search_opts={
             'all_tenants': True}).\
             AndReturn(self.cinder_volumes.list())
-        keystone.tenant_list(IsA(http.HttpRequest)). \
-            AndReturn([self.tenants.list(), False])
+        keystone.tenant_names(IsA(http.HttpRequest), IsA(set)). \
+            AndReturn(self.tenant_names)
 
         self.mox.ReplayAll()
         url = reverse('horizon:admin:volumes:snapshots_tab')
@@ -227,7 +227,7 @@ class VolumeTests(test.BaseAdminViewTests):
 
     @test.create_stubs({cinder: ('volume_list',
                                  'volume_snapshot_list_paged',),
-                        keystone: ('tenant_list',)})
+                        keystone: ('tenant_names',)})
     def _test_snapshots_index_paginated(self, marker, sort_dir, snapshots, url,
                                         has_more, has_prev):
         cinder.volume_snapshot_list_paged(
@@ -237,8 +237,8 @@ class VolumeTests(test.BaseAdminViewTests):
         cinder.volume_list(IsA(http.HttpRequest), search_opts={
             'all_tenants': True}).\
             AndReturn(self.cinder_volumes.list())
-        keystone.tenant_list(IsA(http.HttpRequest)) \
-            .AndReturn([self.tenants.list(), False])
+        keystone.tenant_names(IsA(http.HttpRequest), IsA(set)) \
+            .AndReturn(self.tenant_names)
 
         self.mox.ReplayAll()
 
@@ -114,3 +114,4 @@ class VolumesTable(volumes_tables.VolumesTable):
                        MigrateVolume)
         columns = ('tenant', 'host', 'name', 'size', 'status', 'volume_type',
                    'attachments', 'bootable', 'encryption',)
+        api_pagination = True
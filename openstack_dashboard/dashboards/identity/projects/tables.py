@@ -264,3 +264,4 @@ class TenantsTable(tables.DataTable):
         table_actions = (TenantFilterAction, CreateProject,
                          DeleteTenantsAction)
         pagination_param = "tenant_marker"
+        api_pagination = True
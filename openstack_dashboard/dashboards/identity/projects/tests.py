@@ -1598,11 +1598,6 @@ class UsageViewTests(test.BaseAdminViewTests):
             api.nova.usage_get(IsA(http.HttpRequest),
                                self.tenant.id,
                                start, end).AndReturn(usage_obj)
-        api.nova.tenant_absolute_limits(IsA(http.HttpRequest), reserved=True)\
-            .AndReturn(self.limits['absolute'])
-        api.cinder.tenant_absolute_limits(IsA(http.HttpRequest)) \
-            .AndReturn(self.cinder_limits['absolute'])
-        self._stub_neutron_api_calls()
         self.mox.ReplayAll()
 
         project_id = self.tenants.first().id
@@ -72,20 +72,16 @@ class IndexView(tables.DataTableView):
     template_name = 'identity/projects/index.html'
     page_title = _("Projects")
 
-    def has_more_data(self, table):
-        return self._more
-
-    def get_data(self):
+    def get_page(self, query):
         tenants = []
-        marker = self.request.GET.get(
-            project_tables.TenantsTable._meta.pagination_param, None)
-        self._more = False
+        marker = query.marker
+        more = False
         filters = self.get_filters()
         if policy.check((("identity", "identity:list_projects"),),
                         self.request):
             domain_id = identity.get_domain_id_for_operation(self.request)
             try:
-                tenants, self._more = api.keystone.tenant_list(
+                tenants, more = api.keystone.tenant_list(
                     self.request,
                     domain=domain_id,
                     paginate=True,
@@ -97,7 +93,7 @@ class IndexView(tables.DataTableView):
         elif policy.check((("identity", "identity:list_user_projects"),),
                           self.request):
             try:
-                tenants, self._more = api.keystone.tenant_list(
+                tenants, more = api.keystone.tenant_list(
                     self.request,
                     user=self.request.user.id,
                     paginate=True,
@@ -117,7 +113,7 @@ class IndexView(tables.DataTableView):
             for t in tenants:
                 t.domain_name = domain_lookup.get(t.domain_id)
 
-        return tenants
+        return tenants, more, False
 
 
 class ProjectUsageView(usage.UsageView):
@@ -24,6 +24,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from django.conf import settings
+
 import horizon
 
 from horizon import views
@@ -54,33 +56,11 @@ class MainIndexView(views.APIView):
             context["cluster"]["clusters_list"] = request.user.available_services_regions
             context["cluster"]["current_cluster"] = request.user.services_region
 
-            stats = api.nova.hypervisor_stats(self.request)
-            context["cluster"]["hypervisor_stats"] = api.nova.hypervisor_stats(self.request)
-
-            hypervisor_list = api.nova.hypervisor_list(self.request)
-            for hypervisor in hypervisor_list:
-                if hypervisor.state == 'up':
-                    hypervisor_stats_count['up'] += 1
-                if hypervisor.state == 'down':
-                    hypervisor_stats_count['down'] += 1
-
-            # TODO check data and other api
-            instance_list = api.nova.server_list(self.request, all_tenants=True)[0]
-            for instance in instance_list:
-                if instance.status == 'ACTIVE':
-                    instance_stats_count['active'] += 1
-                    instance_stats_count['up'] += 1
-                if instance.status == 'RUNNING':
-                    instance_stats_count['running'] += 1
-                    instance_stats_count['up'] += 1
-                if instance.status == 'SUSPENDED':
-                    instance_stats_count['idle'] += 1
-                    instance_stats_count['up'] += 1
-                if instance.status == 'CRASHED':
-                    instance_stats_count['free'] += 1
-                    instance_stats_count['up'] += 1
-                if instance.status == 'SHUTOFF':
-                    instance_stats_count['down'] += 1
+            # The overview widgets are loaded by the page from the REST API,
+            # summed up over every region with MULTI_DATA_CENTERS.
+            context["cluster"]["lazy_overview"] = True
+            context["cluster"]["all_regions"] = getattr(
+                settings, 'MULTI_DATA_CENTERS', False)
 
         elif policy.check((('identity', 'admin_or_owner'),),self.request):
             # doing
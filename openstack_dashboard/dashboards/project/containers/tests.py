@@ -28,6 +28,7 @@ from django.utils import http as utils_http
 
 from mox3.mox import IsA  # noqa
 import six
+import swiftclient
 
 from openstack_dashboard import api
 from openstack_dashboard.dashboards.project.containers import forms
@@ -93,12 +94,11 @@ class SwiftTests(test.TestCase):
             handled = table.maybe_handle()
             self.assertEqual(handled['location'], CONTAINER_INDEX_URL)
 
-    @test.create_stubs({api.swift: ('swift_get_objects', )})
+    @test.create_stubs({api.swift: ('swift_is_empty', )})
     def test_delete_container_nonempty(self):
         container = self.containers.first()
-        objects = self.objects.list()
-        api.swift.swift_get_objects(IsA(http.HttpRequest),
-                                    container.name).AndReturn([objects, False])
+        api.swift.swift_is_empty(IsA(http.HttpRequest),
+                                 container.name).AndReturn(False)
         self.mox.ReplayAll()
 
         action_string = u"containers__delete__%s" % container.name
@@ -346,7 +346,8 @@ class SwiftTests(test.TestCase):
                     IsA(http.HttpRequest),
                     container.name,
                     obj.name,
-                    resp_chunk_size=api.swift.CHUNK_SIZE).AndReturn(obj)
+                    resp_chunk_size=api.swift.CHUNK_SIZE,
+                    headers={}).AndReturn(obj)
                 self.mox.ReplayAll()
 
                 download_url = reverse(
@@ -382,6 +383,47 @@ class SwiftTests(test.TestCase):
 
                 self.assertEqual(content, expected)
 
+    @test.create_stubs({api.swift: ('swift_get_object',)})
+    def test_download_range(self):
+        container = self.containers.first()
+        obj = copy.copy(self.objects.first())
+        obj.data = iter([obj.data[:2]])
+        obj.content_range = 'bytes 0-1/%d' % len(self.objects.first().data)
+        api.swift.swift_get_object(
+            IsA(http.HttpRequest), container.name, obj.name,
+            resp_chunk_size=api.swift.CHUNK_SIZE,
+            headers={'Range': 'bytes=0-1', 'If-Range': '"etag"'}) \
+            .AndReturn(obj)
+        self.mox.ReplayAll()
+
+        download_url = reverse('horizon:project:containers:object_download',
+                               args=[container.name, obj.name])
+        res = self.client.get(download_url, HTTP_RANGE='bytes=0-1',
+                              HTTP_IF_RANGE='"etag"')
+
+        self.assertEqual(206, res.status_code)
+        self.assertEqual(obj.content_range, res['Content-Range'])
+        self.assertEqual(b''.join(res.streaming_content),
+                         self.objects.first().data[:2])
+
+    @test.create_stubs({api.swift: ('swift_get_object',)})
+    def test_download_not_modified(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+        exc = swiftclient.client.ClientException('Not Modified',
+                                                 http_status=304)
+        api.swift.swift_get_object(
+            IsA(http.HttpRequest), container.name, obj.name,
+            resp_chunk_size=api.swift.CHUNK_SIZE,
+            headers={'If-None-Match': '"etag"'}).AndRaise(exc)
+        self.mox.ReplayAll()
+
+        download_url = reverse('horizon:project:containers:object_download',
+                               args=[container.name, obj.name])
+        res = self.client.get(download_url, HTTP_IF_NONE_MATCH='"etag"')
+
+        self.assertEqual(304, res.status_code)
+
     @test.create_stubs({api.swift: ('swift_get_containers',)})
     def test_copy_index(self):
         ret = (self.containers.list(), False)
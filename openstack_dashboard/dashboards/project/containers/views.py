@@ -23,11 +23,9 @@ Views for managing Swift containers.
 import os
 
 from django.core.urlresolvers import reverse
-from django import http
 from django.utils.functional import cached_property  # noqa
 from django.utils.translation import ugettext_lazy as _
 from django.views import generic
-import six
 
 from horizon import browsers
 from horizon import exceptions
@@ -199,27 +197,13 @@ class UploadView(forms.ModalFormView):
 
 def object_download(request, container_name, object_path):
     try:
-        obj = api.swift.swift_get_object(request, container_name, object_path,
-                                         resp_chunk_size=swift.CHUNK_SIZE)
+        return api.swift.object_download_response(request, container_name,
+                                                  object_path)
     except Exception:
         redirect = reverse("horizon:project:containers:index")
         exceptions.handle(request,
                           _("Unable to retrieve object."),
                           redirect=redirect)
-    # Add the original file extension back on if it wasn't preserved in the
-    # name given to the object.
-    filename = object_path.rsplit(swift.FOLDER_DELIMITER)[-1]
-    if not os.path.splitext(obj.name)[1] and obj.orig_name:
-        name, ext = os.path.splitext(obj.orig_name)
-        filename = "%s%s" % (filename, ext)
-    response = http.StreamingHttpResponse(obj.data)
-    safe_name = filename.replace(",", "")
-    if six.PY2:
-        safe_name = safe_name.encode('utf-8')
-    response['Content-Disposition'] = 'attachment; filename="%s"' % safe_name
-    response['Content-Type'] = 'application/octet-stream'
-    response['Content-Length'] = obj.bytes
-    return response
 
 
 class CopyView(forms.ModalFormView):
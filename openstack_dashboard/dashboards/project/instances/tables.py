@@ -84,6 +84,7 @@ def is_deleting(instance):
 class DeleteInstance(policy.PolicyTargetMixin, tables.DeleteAction):
     policy_rules = (("compute", "compute:delete"),)
     help_text = _("Deleted instances are not recoverable.")
+    concurrent_actions = True
 
     @staticmethod
     def action_present(count):
@@ -795,6 +796,7 @@ class StartInstance(policy.PolicyTargetMixin, tables.BatchAction):
     name = "start"
     classes = ('btn-confirm',)
     policy_rules = (("compute", "compute:start"),)
+    concurrent_actions = True
 
     @staticmethod
     def action_present(count):
@@ -824,6 +826,7 @@ class StopInstance(policy.PolicyTargetMixin, tables.BatchAction):
     name = "stop"
     policy_rules = (("compute", "compute:stop"),)
     help_text = _("The instance(s) will be shut off.")
+    concurrent_actions = True
     action_type = "danger"
 
     @staticmethod
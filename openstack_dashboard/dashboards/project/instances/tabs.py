@@ -112,3 +112,4 @@ class InstanceDetailTabs(tabs.TabGroup):
     slug = "instance_details"
     tabs = (OverviewTab, LogTab, ConsoleTab, AuditTab)
     sticky = True
+    concurrent_data_loading = True
@@ -86,7 +86,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -154,11 +154,11 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndRaise(self.exceptions.nova)
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
-        for server in servers:
-            api.nova.flavor_get(IsA(http.HttpRequest), server.flavor["id"]). \
-                AndReturn(full_flavors[server.flavor["id"]])
+        for flavor_id in set(server.flavor["id"] for server in servers):
+            api.nova.flavor_get(IsA(http.HttpRequest), flavor_id). \
+                InAnyOrder().AndReturn(full_flavors[flavor_id])
         api.nova.tenant_absolute_limits(IsA(http.HttpRequest), reserved=True) \
            .MultipleTimes().AndReturn(self.limits['absolute'])
         api.network.floating_ip_supported(IsA(http.HttpRequest)) \
@@ -197,7 +197,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -258,7 +258,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
         api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         api.nova.server_delete(IsA(http.HttpRequest), server.id)
         self.mox.ReplayAll()
@@ -283,7 +283,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
         api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         api.nova.server_delete(IsA(http.HttpRequest), server.id)
         self.mox.ReplayAll()
@@ -307,7 +307,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
         api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         api.nova.server_delete(IsA(http.HttpRequest), server.id) \
             .AndRaise(self.exceptions.nova)
@@ -334,7 +334,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -364,7 +364,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -395,7 +395,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -426,7 +426,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -452,7 +452,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
         server = servers[0]
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -479,7 +479,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
 
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -507,7 +507,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
 
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -538,7 +538,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -569,7 +569,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -601,7 +601,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -632,7 +632,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -663,7 +663,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -692,7 +692,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -724,7 +724,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -755,7 +755,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -784,7 +784,8 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
 
         api.nova.extension_supported('AdminActions', IsA(
             http.HttpRequest)).MultipleTimes().AndReturn(True)
-        api.glance.image_list_detailed(IgnoreArg()).AndReturn((
+        api.glance.image_list_detailed(
+            IgnoreArg(), filters=IgnoreArg()).AndReturn((
             self.images.list(), False, False))
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
@@ -814,7 +815,8 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
 
         api.nova.extension_supported('AdminActions', IsA(
             http.HttpRequest)).MultipleTimes().AndReturn(True)
-        api.glance.image_list_detailed(IgnoreArg()).AndReturn((
+        api.glance.image_list_detailed(
+            IgnoreArg(), filters=IgnoreArg()).AndReturn((
             self.images.list(), False, False))
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
@@ -846,7 +848,8 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             http.HttpRequest)).MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()).AndReturn((
+        api.glance.image_list_detailed(
+            IgnoreArg(), filters=IgnoreArg()).AndReturn((
             self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(
@@ -874,7 +877,8 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
 
         api.nova.extension_supported('AdminActions', IsA(
             http.HttpRequest)).MultipleTimes().AndReturn(True)
-        api.glance.image_list_detailed(IgnoreArg()).AndReturn((
+        api.glance.image_list_detailed(
+            IgnoreArg(), filters=IgnoreArg()).AndReturn((
             self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.flavor_list(IsA(http.HttpRequest)) \
@@ -1322,7 +1326,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -3957,7 +3961,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -4004,7 +4008,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -4188,7 +4192,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         search_opts = {'marker': None, 'paginate': True}
         api.nova.server_list(IsA(http.HttpRequest), search_opts=search_opts) \
@@ -4319,7 +4323,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
         api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         api.network.floating_ip_target_get_by_instance(
             IsA(http.HttpRequest),
@@ -4354,7 +4358,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .AndReturn([servers, False])
         api.network.servers_update_addresses(IsA(http.HttpRequest), servers)
         api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         api.network.floating_ip_target_list_by_instance(
             IsA(http.HttpRequest),
@@ -4771,7 +4775,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
             .MultipleTimes().AndReturn(True)
         api.nova.flavor_list(IsA(http.HttpRequest)) \
             .MultipleTimes().AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .MultipleTimes().AndReturn((self.images.list(), False, False))
 
         search_opts = {'marker': None, 'paginate': True}
@@ -4832,7 +4836,7 @@ class InstanceTests(helpers.ResetImageAPIVersionMixin, helpers.TestCase):
         api.network.servers_update_addresses(IsA(http.HttpRequest),
                                              servers[page_size:])
         api.nova.flavor_list(IgnoreArg()).AndReturn(self.flavors.list())
-        api.glance.image_list_detailed(IgnoreArg()) \
+        api.glance.image_list_detailed(IgnoreArg(), filters=IgnoreArg()) \
             .AndReturn((self.images.list(), False, False))
         api.nova.server_delete(IsA(http.HttpRequest), server.id)
         self.mox.ReplayAll()
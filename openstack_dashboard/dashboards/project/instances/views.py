@@ -78,56 +78,7 @@ class IndexView(tables.DataTableView):
             exceptions.handle(self.request,
                               _('Unable to retrieve instances.'))
 
-        if instances:
-            try:
-                api.network.servers_update_addresses(self.request, instances)
-            except Exception:
-                exceptions.handle(
-                    self.request,
-                    message=_('Unable to retrieve IP addresses from Neutron.'),
-                    ignore=True)
-
-            # Gather our flavors and images and correlate our instances to them
-            try:
-                flavors = api.nova.flavor_list(self.request)
-            except Exception:
-                flavors = []
-                exceptions.handle(self.request, ignore=True)
-
-            try:
-                # TODO(gabriel): Handle pagination.
-                images, more, prev = api.glance.image_list_detailed(
-                    self.request)
-            except Exception:
-                images = []
-                exceptions.handle(self.request, ignore=True)
-
-            full_flavors = OrderedDict([(str(flavor.id), flavor)
-                                       for flavor in flavors])
-            image_map = OrderedDict([(str(image.id), image)
-                                    for image in images])
-
-            # Loop through instances to get flavor info.
-            for instance in instances:
-                if hasattr(instance, 'image'):
-                    # Instance from image returns dict
-                    if isinstance(instance.image, dict):
-                        if instance.image.get('id') in image_map:
-                            instance.image = image_map[instance.image['id']]
-
-                try:
-                    flavor_id = instance.flavor["id"]
-                    if flavor_id in full_flavors:
-                        instance.full_flavor = full_flavors[flavor_id]
-                    else:
-                        # If the flavor_id is not in full_flavors list,
-                        # get it via nova api.
-                        instance.full_flavor = api.nova.flavor_get(
-                            self.request, flavor_id)
-                except Exception:
-                    msg = ('Unable to retrieve flavor "%s" for instance "%s".'
-                           % (flavor_id, instance.id))
-                    LOG.info(msg)
+        api.enrichment.servers_update_details(self.request, instances)
         return instances
 
 
@@ -0,0 +1,201 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Versioned network topology of a project, shared through the Django cache.
+
+The topology is made of servers, networks and routers (the nodes) and of the
+ports linking them (the edges). It is kept in the cache for every project and
+rebuilt once older than ``NETWORK_TOPOLOGY_REFRESH_INTERVAL`` or after a
+resource was created or deleted from the dashboard. Each rebuild changing the
+topology gets a new version, so that a client can ask for the nodes and edges
+that changed since the version it holds instead of the whole topology.
+"""
+
+import collections
+import hashlib
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from horizon.utils import memoized
+
+from openstack_dashboard.api import base
+
+
+KINDS = ('servers', 'networks', 'ports', 'routers')
+
+# Number of rebuilds whose changes are remembered; clients holding an older
+# version are sent the whole topology.
+HISTORY_LENGTH = 20
+
+# Seconds during which a topology nobody asked for is kept.
+MAX_AGE = 3600
+
+# A process rebuilding a topology holds a lock for at most this many
+# seconds. Meanwhile, the other processes serve the previous version.
+LOCK_TIMEOUT = 60
+
+
+def _scope(request):
+    scope = '%s:%s' % (request.user.services_region,
+                       request.user.project_id)
+    return hashlib.md5(scope.encode('utf-8')).hexdigest()
+
+
+class _Generation(object):
+    """Counters bumped when a resource is created or deleted.
+
+    A counter is kept for each region and project, and one for all of them.
+    """
+
+    key = 'horizon:network-topology:generation'
+
+    def _scope_key(self, request):
+        return '%s:%s' % (self.key, _scope(request))
+
+    def get(self, request):
+        keys = [self.key, self._scope_key(request)]
+        values = cache.get_many(keys)
+        return tuple(values.get(key, 0) for key in keys)
+
+    def invalidate(self, request=None):
+        memoized.bump_generation(
+            self.key if request is None else self._scope_key(request))
+
+
+generation = base.register_usage_cache(_Generation())
+
+
+def node_key(kind, node):
+    """Returns the key identifying ``node`` among the nodes of ``kind``.
+
+    Gateway ports made up for routers share the id of their network, so
+    ports are told apart by their device too. Ports without a device get
+    an empty device id, as in horizon.networktopologycommon.js.
+    """
+    if kind == 'ports':
+        return '%s:%s' % (node.get('device_id') or '', node['id'])
+    return node['id']
+
+
+def _cache_key(request):
+    return 'horizon:network-topology:%s' % _scope(request)
+
+
+def _index(topology):
+    return dict((kind, collections.OrderedDict(
+        (node_key(kind, node), node) for node in topology[kind]))
+        for kind in KINDS)
+
+
+def _changed_keys(old_nodes, new_nodes):
+    changes = {}
+    for kind in KINDS:
+        old, new = old_nodes[kind], new_nodes[kind]
+        keys = set(key for key, node in new.items() if old.get(key) != node)
+        keys.update(key for key in old if key not in new)
+        if keys or list(old) != list(new):
+            changes[kind] = keys
+    return changes
+
+
+def _rebuild(state, build, current_generation):
+    nodes = _index(build())
+    if state is None:
+        return {'epoch': uuid.uuid4().hex, 'serial': 1, 'nodes': nodes,
+                'history': [], 'generation': current_generation,
+                'built_at': time.time()}
+    changes = _changed_keys(state['nodes'], nodes)
+    state = dict(state, nodes=nodes, generation=current_generation,
+                 built_at=time.time())
+    if changes:
+        state['serial'] += 1
+        state['history'] = (state['history'] +
+                            [(state['serial'], changes)])[-HISTORY_LENGTH:]
+    return state
+
+
+def _parse_version(version, state):
+    epoch, _sep, serial = (version or '').partition('.')
+    if epoch != state['epoch'] or not serial.isdigit():
+        return None
+    serial = int(serial)
+    oldest = state['history'][0][0] - 1 if state['history'] else \
+        state['serial']
+    if not oldest <= serial <= state['serial']:
+        return None
+    return serial
+
+
+def get_topology(request, build, since=None):
+    """Returns the topology of the project of ``request``.
+
+    ``build`` is called to build the topology when the cached one is stale.
+    It returns a dictionary with a list of nodes for each of ``KINDS``.
+
+    The result always carries the ``version`` of the topology. It holds the
+    nodes of every kind, like the result of ``build``, unless ``since`` is a
+    recent version of the topology. It then only holds the ``changes`` made
+    since that version: for each kind that changed, the ``changed`` nodes and
+    the ``keys`` (see ``node_key``) of all the nodes of that kind, in order.
+    """
+    key = _cache_key(request)
+    state = cache.get(key)
+    current_generation = generation.get(request)
+    interval = getattr(settings, 'NETWORK_TOPOLOGY_REFRESH_INTERVAL', 30)
+
+    def is_stale(state):
+        return (state is None or
+                state['generation'] != current_generation or
+                time.time() - state['built_at'] > interval)
+
+    if is_stale(state):
+        # Serials are only bumped under the lock, so that a version always
+        # stands for the same topology.
+        lock_key = key + ':lock'
+        if cache.add(lock_key, True, LOCK_TIMEOUT):
+            try:
+                # Another process may have rebuilt it in the meantime.
+                state = cache.get(key)
+                if is_stale(state):
+                    state = _rebuild(state, build, current_generation)
+                    cache.set(key, state, MAX_AGE)
+            finally:
+                cache.delete(lock_key)
+        elif state is None:
+            # The first version is being built by another process. This
+            # one gets its own epoch, so it is never used as a base for
+            # changes.
+            state = _rebuild(None, build, current_generation)
+
+    version = '%s.%d' % (state['epoch'], state['serial'])
+    nodes = state['nodes']
+    serial = _parse_version(since, state)
+    if serial is None:
+        return dict(((kind, list(nodes[kind].values())) for kind in KINDS),
+                    version=version)
+
+    changed = collections.defaultdict(set)
+    for change_serial, changes in state['history']:
+        if change_serial > serial:
+            for kind, keys in changes.items():
+                changed[kind].update(keys)
+    return {
+        'version': version,
+        'changes': dict((kind, {'changed': [node for node_id, node
+                                            in nodes[kind].items()
+                                            if node_id in keys],
+                                'keys': list(nodes[kind])})
+                        for kind, keys in changed.items()),
+    }
@@ -12,9 +12,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import copy
+
+from django.core.cache import cache
 from django.core.urlresolvers import reverse
 from django import http
 import django.test
+import mock
 
 from mox3.mox import IgnoreArg  # noqa
 from mox3.mox import IsA  # noqa
@@ -22,6 +26,7 @@ from oslo_serialization import jsonutils
 
 from openstack_dashboard import api
 from openstack_dashboard.dashboards.project.instances import console
+from openstack_dashboard.dashboards.project.network_topology import graph
 from openstack_dashboard.dashboards.project.network_topology.views import \
     TranslationHelper
 from openstack_dashboard.test import helpers as test
@@ -188,6 +193,99 @@ class NetworkTopologyTests(test.TestCase):
         self.assertEqual(expect_port_urls, data['ports'])
 
 
+class NetworkTopologyGraphTests(test.TestCase):
+    def setUp(self):
+        super(NetworkTopologyGraphTests, self).setUp()
+        cache.clear()
+
+    def _topology(self):
+        return {'servers': [{'id': 'server1', 'status': 'BUILD'},
+                            {'id': 'server2', 'status': 'ACTIVE'}],
+                'networks': [{'id': 'net1'}],
+                'ports': [{'id': 'port1', 'device_id': 'server1'},
+                          {'id': 'port2', 'device_id': 'server2'},
+                          {'id': 'gatewaynet1', 'device_id': 'router1'},
+                          {'id': 'gatewaynet1', 'device_id': 'router2'}],
+                'routers': [{'id': 'router1'}, {'id': 'router2'}]}
+
+    def test_get_topology_changes(self):
+        topology = self._topology()
+        builds = []
+
+        def build():
+            builds.append(True)
+            return copy.deepcopy(topology)
+
+        data = graph.get_topology(self.request, build)
+        self.assertEqual(4, len(data['ports']))
+        version = data['version']
+
+        # The cached topology is served until a resource is created or
+        # deleted.
+        self.assertEqual({'version': version, 'changes': {}},
+                         graph.get_topology(self.request, build,
+                                            since=version))
+        self.assertEqual(1, len(builds))
+
+        topology['servers'][0]['status'] = 'ACTIVE'
+        del topology['ports'][1]
+        # Changes made in another project are ignored.
+        other_request = http.HttpRequest()
+        other_request.user = mock.Mock(
+            services_region=self.request.user.services_region,
+            project_id='other')
+        api.base.usage_changed(other_request)
+        self.assertEqual({'version': version, 'changes': {}},
+                         graph.get_topology(self.request, build,
+                                            since=version))
+        self.assertEqual(1, len(builds))
+
+        api.base.usage_changed(self.request)
+        data = graph.get_topology(self.request, build, since=version)
+
+        self.assertEqual(2, len(builds))
+        self.assertNotEqual(version, data['version'])
+        self.assertItemsEqual(['servers', 'ports'], data['changes'])
+        self.assertEqual({'changed': [topology['servers'][0]],
+                          'keys': ['server1', 'server2']},
+                         data['changes']['servers'])
+        self.assertEqual({'changed': [],
+                          'keys': ['server1:port1',
+                                   'router1:gatewaynet1',
+                                   'router2:gatewaynet1']},
+                         data['changes']['ports'])
+
+        # Unknown versions get the whole topology.
+        data = graph.get_topology(self.request, build, since='unknown.1')
+        self.assertEqual(topology['servers'], data['servers'])
+
+    def test_get_topology_rebuilt_by_one_process(self):
+        topology = self._topology()
+        builds = []
+
+        def build():
+            builds.append(True)
+            return copy.deepcopy(topology)
+
+        version = graph.get_topology(self.request, build)['version']
+        # While another process holds the lock, the previous version is
+        # served instead of bumping the serial concurrently.
+        lock_key = graph._cache_key(self.request) + ':lock'
+        cache.add(lock_key, True)
+        self.addCleanup(cache.delete, lock_key)
+        api.base.usage_changed(self.request)
+        self.assertEqual({'version': version, 'changes': {}},
+                         graph.get_topology(self.request, build,
+                                            since=version))
+        self.assertEqual(1, len(builds))
+
+    def test_node_key_without_device(self):
+        self.assertEqual(':port1', graph.node_key('ports', {'id': 'port1'}))
+        self.assertEqual(':port1', graph.node_key('ports',
+                                                  {'id': 'port1',
+                                                   'device_id': None}))
+
+
 class NetworkTopologyCreateTests(test.TestCase):
 
     def _test_new_button_disabled_when_quota_exceeded(
@@ -31,6 +31,7 @@ from horizon import tabs
 from horizon.utils.lazy_encoder import LazyTranslationEncoder
 
 from openstack_dashboard import api
+from openstack_dashboard.dashboards.project.network_topology import graph
 from openstack_dashboard.dashboards.project.network_topology.instances \
     import tables as instances_tables
 from openstack_dashboard.dashboards.project.network_topology.networks \
@@ -372,13 +373,21 @@ class JSONView(View):
                          'fixed_ips': []}
             ports.append(fake_port)
 
-    def get(self, request, *args, **kwargs):
+    def _build_topology(self):
+        request = self.request
         networks = self._get_networks(request)
         data = {'servers': self._get_servers(request),
                 'networks': networks,
                 'ports': self._get_ports(request, networks),
                 'routers': self._get_routers(request)}
         self._prepare_gateway_ports(data['routers'], data['ports'])
+        return data
+
+    def get(self, request, *args, **kwargs):
+        # With the version of the topology it already has, the client is
+        # only sent the nodes and ports that changed since.
+        data = graph.get_topology(request, self._build_topology,
+                                  since=request.GET.get('version'))
         json_string = json.dumps(data, cls=LazyTranslationEncoder,
                                  ensure_ascii=False)
         return HttpResponse(json_string, content_type='text/json')
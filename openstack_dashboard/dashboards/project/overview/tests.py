@@ -194,16 +194,45 @@ class UsageViewTests(test.TestCase):
     def test_usage_csv_disabled(self):
         self._test_usage_csv(nova_stu_enabled=False)
 
+    @test.create_stubs({api.nova: ('usage_get',
+                                   'extension_supported')})
     def _test_usage_csv(self, nova_stu_enabled=True, overview_days_range=None):
-        self._stub_nova_api_calls(nova_stu_enabled,
-                                  overview_days_range=overview_days_range)
-        self._stub_neutron_api_calls()
-        self._stub_cinder_api_calls()
+        # Limits are not part of the report, so only the usage is retrieved.
+        api.nova.extension_supported(
+            'SimpleTenantUsage', IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(nova_stu_enabled)
+        if nova_stu_enabled:
+            self._nova_stu_enabled(overview_days_range=overview_days_range)
         self.mox.ReplayAll()
         res = self.client.get(reverse('horizon:project:overview:index') +
                               "?format=csv")
         self.assertTemplateUsed(res, 'project/overview/usage.csv')
         self.assertIsInstance(res.context['usage'], usage.ProjectUsage)
+        content = b''.join(res.streaming_content).decode('utf-8')
+        self.assertIn('Instance Name,VCPUs,RAM (MB)', content)
+        if nova_stu_enabled:
+            for server_usage in self.usages.first().server_usages:
+                self.assertIn(server_usage['name'], content)
+            self.assertIn('Active Instances:,', content)
+
+    @test.create_stubs({api.nova: ('usage_get',
+                                   'extension_supported')})
+    def test_usage_csv_exception_usage(self):
+        api.nova.extension_supported(
+            'SimpleTenantUsage', IsA(http.HttpRequest)) \
+            .MultipleTimes().AndReturn(True)
+        self._nova_stu_enabled(exception=self.exceptions.nova,
+                               overview_days_range=None)
+        self.mox.ReplayAll()
+
+        # The usage is retrieved before the report is streamed, so the
+        # error is handled as for the HTML page.
+        res = self.client.get(reverse('horizon:project:overview:index') +
+                              "?format=csv")
+        self.assertMessageCount(error=1)
+        content = b''.join(res.streaming_content).decode('utf-8')
+        self.assertIn('Instance Name,VCPUs,RAM (MB)', content)
+        self.assertIn('Active Instances:,', content)
 
     def test_usage_exception_usage(self):
         self._stub_nova_api_calls(stu_exception=self.exceptions.nova)
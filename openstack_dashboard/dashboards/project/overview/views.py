@@ -32,7 +32,7 @@ from openstack_dashboard.dashboards.project.instances \
 from openstack_dashboard.utils import filters
 
 
-class ProjectUsageCsvRenderer(csvbase.BaseCsvResponse):
+class ProjectUsageCsvRenderer(csvbase.BaseCsvStreamingResponse):
 
     columns = [_("Instance Name"), _("VCPUs"), _("RAM (MB)"),
                _("Disk (GB)"), _("Usage (Hours)"),
@@ -41,16 +41,17 @@ class ProjectUsageCsvRenderer(csvbase.BaseCsvResponse):
     def get_row_data(self):
 
         choices = project_tables.STATUS_DISPLAY_CHOICES
-        for inst in self.context['usage'].get_instances():
-            state_label = (
-                filters.get_display_label(choices, inst['state']))
-            yield (inst['name'],
-                   inst['vcpus'],
-                   inst['memory_mb'],
-                   inst['local_gb'],
-                   floatformat(inst['hours'], 2),
-                   inst['uptime'],
-                   capfirst(state_label))
+        for project_usage in self.context['usage'].usage_list:
+            for inst in project_usage.server_usages:
+                state_label = (
+                    filters.get_display_label(choices, inst['state']))
+                yield (inst['name'],
+                       inst['vcpus'],
+                       inst['memory_mb'],
+                       inst['local_gb'],
+                       floatformat(inst['hours'], 2),
+                       inst['uptime'],
+                       capfirst(state_label))
 
 
 class ProjectOverview(usage.UsageView):
@@ -60,7 +61,10 @@ class ProjectOverview(usage.UsageView):
     csv_response_class = ProjectUsageCsvRenderer
 
     def get_data(self):
-        super(ProjectOverview, self).get_data()
+        data = super(ProjectOverview, self).get_data()
+        if self.request.GET.get('format', 'html') == 'csv':
+            # The instances are streamed by the CSV report itself.
+            return data
         return self.usage.get_instances()
 
 
@@ -122,15 +122,13 @@ class PagedTableMixin(object):
         return self._has_more_data
 
     def _get_marker(self):
-        meta = self.table_classes[0]._meta
-        prev_marker = self.request.GET.get(meta.prev_pagination_param, None)
-        if prev_marker:
-            return prev_marker, "asc"
-        else:
-            marker = self.request.GET.get(meta.pagination_param, None)
-            if marker:
-                return marker, "desc"
-            return None, "desc"
+        table = self._tables[self.table_classes[0]._meta.name]
+        query = table.get_page_query()
+        sort_dir = query.sort_dir
+        if query.reversed_order:
+            # Cinder is asked for the previous page in the reverse order.
+            sort_dir = 'asc' if sort_dir == 'desc' else 'desc'
+        return query.marker, sort_dir
 
 
 class VolumeTab(PagedTableMixin, tabs.TableTab, VolumeTableMixIn):
@@ -93,6 +93,7 @@ class LaunchVolumeNG(LaunchVolume):
 class DeleteVolume(VolumePolicyTargetMixin, tables.DeleteAction):
     help_text = _("Deleted volumes are not recoverable. "
                   "All data stored in the volume will be removed.")
+    concurrent_actions = True
 
     @staticmethod
     def action_present(count):
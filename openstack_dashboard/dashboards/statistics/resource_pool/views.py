@@ -25,32 +25,6 @@ class MainIndexView(views.APIView):
             # TODO get region extra or description
             context["clusters_list"] = request.user.available_services_regions
             context["current_cluster"] = request.user.services_region
-            # stats = api.nova.hypervisor_stats(self.request)
-            context["hypervisor_stats"] = api.nova.hypervisor_stats(self.request)
-            hypervisor_list = api.nova.hypervisor_list(self.request)
-            for hypervisor in hypervisor_list:
-                if hypervisor.state == 'up':
-                    context["hypervisor_stats_count"]["up"] += 1
-                if hypervisor.state == 'down':
-                    context["hypervisor_stats_count"]['down'] += 1
-
-            # TODO check data and other api
-            instance_list = api.nova.server_list(self.request, all_tenants=True)[0]
-            for instance in instance_list:
-                if instance.status == 'ACTIVE':
-                    context["instance_stats_count"]['active'] += 1
-                    context["instance_stats_count"]['up'] += 1
-                if instance.status == 'RUNNING':
-                    context["instance_stats_count"]['running'] += 1
-                    context["instance_stats_count"]['up'] += 1
-                if instance.status == 'SUSPENDED':
-                    context["instance_stats_count"]['idle'] += 1
-                    context["instance_stats_count"]['up'] += 1
-                if instance.status == 'CRASHED':
-                    context["instance_stats_count"]['free'] += 1
-                    context["instance_stats_count"]['up'] += 1
-                if instance.status == 'SHUTOFF':
-                    context["instance_stats_count"]['down'] += 1
 
         elif policy.check((('identity', 'admin_or_owner'),), self.request):
             tenant_id = self.request.user.token.project.get('id')
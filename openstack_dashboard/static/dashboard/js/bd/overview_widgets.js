@@ -0,0 +1,93 @@
+/*
+ * Fills the cluster overview of a page from the overview REST API.
+ *
+ * The page element carrying data-overview-url enables the loader; its
+ * optional data-overview-widgets lists widgets to load besides those used by
+ * the page. Every element with a data-widget attribute belongs to that widget
+ * and is filled in as soon as its widget is loaded, independently of the
+ * other widgets:
+ *
+ *   data-field="hypervisor_stats.vcpus"     text set to the value
+ *   data-ratio="a.used/a.total"             text set to the percentage
+ *
+ * With data-overview-all-regions, the widgets are summed up over every
+ * region of the user.
+ *
+ * A "overview:loaded" event is triggered on the page element with the widget
+ * name and data, so that charts can be drawn from it.
+ */
+(function ($) {
+  'use strict';
+
+  function lookup(data, path) {
+    var value = data;
+    $.each(path.split('.'), function (index, key) {
+      value = value === undefined || value === null ? undefined : value[key];
+    });
+    return value === undefined || value === null ? '' : value;
+  }
+
+  function render($page, widget, data) {
+    var $elements = $page.find('[data-widget="' + widget + '"]');
+    $elements.filter('[data-field]').each(function () {
+      $(this).text(lookup(data, $(this).attr('data-field')));
+    });
+    $elements.filter('[data-ratio]').each(function () {
+      var paths = $(this).attr('data-ratio').split('/');
+      var total = Number(lookup(data, paths[1]));
+      var part = Number(lookup(data, paths[0]));
+      $(this).text(total ? Math.round(100 * part / total) : 0);
+    });
+    $elements.removeClass('overview-loading');
+
+    var $age = $page.find('[data-overview-age]');
+    var age = Math.round(data.age || 0);
+    if (age > Number($age.text() || 0)) {
+      $age.text(age);
+    }
+    $page.trigger('overview:loaded', [widget, data]);
+  }
+
+  function load($page, widget) {
+    var params = {};
+    if (/[?&]refresh=/.test(window.location.search)) {
+      params.refresh = 1;
+    }
+    if ($page.attr('data-overview-region')) {
+      params.region = $page.attr('data-overview-region');
+    }
+    if ($page.attr('data-overview-all-regions')) {
+      params.all_regions = 1;
+    }
+    $.ajax({
+      url: $page.attr('data-overview-url') + widget + '/',
+      data: params,
+      dataType: 'json',
+      headers: {'X-Requested-With': 'XMLHttpRequest'}
+    }).done(function (data) {
+      render($page, widget, data);
+    }).fail(function () {
+      $page.find('[data-widget="' + widget + '"]')
+        .removeClass('overview-loading').addClass('overview-error');
+    });
+  }
+
+  $(function () {
+    $('[data-overview-url]').each(function () {
+      var $page = $(this);
+      var widgets = {};
+      $.each(($page.attr('data-overview-widgets') || '').split(/\s+/),
+             function (index, widget) {
+        if (widget) {
+          widgets[widget] = true;
+        }
+      });
+      $page.find('[data-widget]').each(function () {
+        widgets[$(this).attr('data-widget')] = true;
+      });
+      $.each(widgets, function (widget) {
+        load($page, widget);
+      });
+    });
+  });
+}(jQuery));
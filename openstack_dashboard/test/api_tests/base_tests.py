@@ -240,6 +240,31 @@ class ApiHelperTests(test.TestCase):
         with self.assertRaises(exceptions.ServiceCatalogException):
             url = api_base.url_for(self.request, 'image')
 
+    def test_url_for_region_scoped_request(self):
+        scoped = api_base.RegionScopedRequest(self.request, "RegionTwo")
+        url = api_base.url_for(scoped, 'compute')
+        self.assertEqual('http://public.nova2.example.com:8774/v2', url)
+        self.assertEqual("RegionTwo", scoped.user.services_region)
+        self.assertEqual(self.request.user.token, scoped.user.token)
+
+        # The shared user object keeps its own region.
+        self.assertNotEqual("RegionTwo", self.request.user.services_region)
+        url = api_base.url_for(self.request, 'compute')
+        self.assertEqual('http://public.nova.example.com:8774/v2', url)
+
+    def test_cache_namespace_per_roles(self):
+        namespace = api_base.cache_namespace('compute', per_project=True,
+                                             per_roles=True)
+        self.request.user.roles = [self.roles.admin._info]
+        admin_namespace = namespace(self.request)
+        self.request.user.roles = [self.roles.member._info]
+        member_namespace = namespace(self.request)
+        self.assertEqual(('http://public.nova.example.com:8774/v2',
+                          self.request.user.project_id),
+                         member_namespace[:2])
+        self.assertEqual(admin_namespace[:2], member_namespace[:2])
+        self.assertNotEqual(admin_namespace, member_namespace)
+
 
 class QuotaSetTests(test.TestCase):
 
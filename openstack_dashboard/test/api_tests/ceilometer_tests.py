@@ -12,15 +12,46 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from ceilometerclient.v2 import statistics as ceilometer_statistics
+from django.core.cache import cache
 from django import http
+from keystoneauth1 import session
 
+import mock
 from mox3.mox import IsA  # noqa
 
 from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 
 
+def grouped_statistics(statistics, resources):
+    """Returns a copy of the statistics for each resource, grouped by it."""
+    grouped = []
+    for resource in resources:
+        for statistic in statistics:
+            info = dict(statistic._info,
+                        groupby={'project_id': resource.project_id,
+                                 'user_id': resource.user_id,
+                                 'resource_id': resource.resource_id})
+            grouped.append(ceilometer_statistics.Statistics(
+                ceilometer_statistics.StatisticsManager(None), info))
+    return grouped
+
+
 class CeilometerApiTests(test.APITestCase):
+    def setUp(self):
+        super(CeilometerApiTests, self).setUp()
+        cache.clear()
+
+    def test_ceilometerclient_keeps_alarms_on_metering(self):
+        with mock.patch.object(session.Session, 'request') as request:
+            client = self._original_ceilometerclient(self.request)
+
+        self.assertFalse(request.called)
+        self.assertIs(client.http_client, client.alarms.api)
+        self.assertFalse(client.alarms.aodh_enabled)
+        self.assertEqual('metering', client.http_client.service_type)
+
     def test_sample_list(self):
         samples = self.samples.list()
         meter_name = "meter_name"
@@ -117,7 +148,7 @@ class CeilometerApiTests(test.APITestCase):
         ceilometerclient = self.stub_ceilometerclient()
         ceilometerclient.statistics = self.mox.CreateMockAnything()
         ceilometerclient.statistics.list(meter_name=meter_name,
-                                         period=None, q=[]).\
+                                         period=None, q=[], groupby=None).\
             AndReturn(statistics)
         self.mox.ReplayAll()
 
@@ -134,7 +165,7 @@ class CeilometerApiTests(test.APITestCase):
 
         ceilometerclient = self.stub_ceilometerclient()
         ceilometerclient.meters = self.mox.CreateMockAnything()
-        ceilometerclient.meters.list(None).AndReturn(meters)
+        ceilometerclient.meters.list(unique=True).AndReturn(meters)
 
         self.mox.ReplayAll()
 
@@ -152,12 +183,28 @@ class CeilometerApiTests(test.APITestCase):
             self.assertIn(ret.name, names)
             names.remove(ret.name)
 
+    def test_meters_catalog_is_cached(self):
+        meters = self.meters.list()
+
+        ceilometerclient = self.stub_ceilometerclient()
+        ceilometerclient.meters = self.mox.CreateMockAnything()
+        # The catalog is fetched only once for both Meters objects.
+        ceilometerclient.meters.list(unique=True).AndReturn(meters)
+
+        self.mox.ReplayAll()
+
+        first = api.ceilometer.Meters(self.request).list_all()
+        second = api.ceilometer.Meters(self.request).list_all()
+
+        self.assertEqual(sorted(m.name for m in first),
+                         sorted(m.name for m in second))
+
     def test_meters_list_all_only(self):
         meters = self.meters.list()
 
         ceilometerclient = self.stub_ceilometerclient()
         ceilometerclient.meters = self.mox.CreateMockAnything()
-        ceilometerclient.meters.list(None).AndReturn(meters)
+        ceilometerclient.meters.list(unique=True).AndReturn(meters)
 
         self.mox.ReplayAll()
 
@@ -179,7 +226,7 @@ class CeilometerApiTests(test.APITestCase):
 
         ceilometerclient = self.stub_ceilometerclient()
         ceilometerclient.meters = self.mox.CreateMockAnything()
-        ceilometerclient.meters.list(None).AndReturn(meters)
+        ceilometerclient.meters.list(unique=True).AndReturn(meters)
 
         self.mox.ReplayAll()
 
@@ -202,7 +249,9 @@ class CeilometerApiTests(test.APITestCase):
     # TODO(lsmola) Test resource aggregates.
 
     @test.create_stubs({api.ceilometer.CeilometerUsage: ("get_user",
-                                                         "get_tenant")})
+                                                         "get_tenant",
+                                                         "preload_users",
+                                                         "preload_tenants")})
     def test_global_data_get(self):
         class TempUsage(api.base.APIResourceWrapper):
             _attrs = ["id", "tenant", "user", "resource", "get_meter"]
@@ -223,15 +272,18 @@ class CeilometerApiTests(test.APITestCase):
         # I am returning only 1 resource
         ceilometerclient.resources.list(q=IsA(list)).AndReturn(resources[:1])
 
+        statistics = grouped_statistics(statistics, resources[:1])
         ceilometerclient.statistics = self.mox.CreateMockAnything()
-        # check that list is called twice for one resource and 2 meters
-        ceilometerclient.statistics.list(meter_name=IsA(str),
-                                         period=None, q=IsA(list)).\
-            AndReturn(statistics)
-        ceilometerclient.statistics.list(meter_name=IsA(str),
-                                         period=None, q=IsA(list)).\
-            AndReturn(statistics)
-
+        # check that list is called once per meter, grouped by resource
+        ceilometerclient.statistics.list(
+            meter_name=IsA(str), period=None, q=IsA(list),
+            groupby=api.ceilometer.RESOURCE_GROUPBY).AndReturn(statistics)
+        ceilometerclient.statistics.list(
+            meter_name=IsA(str), period=None, q=IsA(list),
+            groupby=api.ceilometer.RESOURCE_GROUPBY).AndReturn(statistics)
+
+        api.ceilometer.CeilometerUsage.preload_tenants(IsA(list))
+        api.ceilometer.CeilometerUsage.preload_users(IsA(list))
         api.ceilometer.CeilometerUsage\
             .get_user(IsA(str)).AndReturn(user)
         api.ceilometer.CeilometerUsage\
@@ -258,7 +310,9 @@ class CeilometerApiTests(test.APITestCase):
         self.assertEqual(1, len(data))
 
     @test.create_stubs({api.ceilometer.CeilometerUsage: ("get_user",
-                                                         "get_tenant")})
+                                                         "get_tenant",
+                                                         "preload_users",
+                                                         "preload_tenants")})
     def test_global_data_get_without_statistic_data(self):
         class TempUsage(api.base.APIResourceWrapper):
             _attrs = ["id", "tenant", "user", "resource", "fake_meter_1",
@@ -278,6 +332,8 @@ class CeilometerApiTests(test.APITestCase):
         ceilometerclient.resources = self.mox.CreateMockAnything()
         ceilometerclient.resources.list(q=IsA(list)).AndReturn(resources)
 
+        api.ceilometer.CeilometerUsage.preload_tenants(IsA(list))
+        api.ceilometer.CeilometerUsage.preload_users(IsA(list))
         api.ceilometer.CeilometerUsage\
             .get_user(IsA(str)).MultipleTimes().AndReturn(user)
         api.ceilometer.CeilometerUsage\
@@ -304,7 +360,9 @@ class CeilometerApiTests(test.APITestCase):
         self.assertEqual(len(resources), len(data))
 
     @test.create_stubs({api.ceilometer.CeilometerUsage: ("get_user",
-                                                         "get_tenant")})
+                                                         "get_tenant",
+                                                         "preload_users",
+                                                         "preload_tenants")})
     def test_global_data_get_all_statistic_data(self):
         class TempUsage(api.base.APIResourceWrapper):
             _attrs = ["id", "tenant", "user", "resource", "get_meter", ]
@@ -317,7 +375,7 @@ class CeilometerApiTests(test.APITestCase):
 
         resources = self.resources.list()
 
-        statistics = self.statistics.list()
+        statistics = grouped_statistics(self.statistics.list(), resources)
         user = self.ceilometer_users.list()[0]
         tenant = self.ceilometer_tenants.list()[0]
 
@@ -326,11 +384,13 @@ class CeilometerApiTests(test.APITestCase):
         ceilometerclient.resources.list(q=IsA(list)).AndReturn(resources)
 
         ceilometerclient.statistics = self.mox.CreateMockAnything()
-        ceilometerclient.statistics.list(meter_name=IsA(str),
-                                         period=None, q=IsA(list)).\
-            MultipleTimes().\
+        ceilometerclient.statistics.list(
+            meter_name=IsA(str), period=None, q=IsA(list),
+            groupby=api.ceilometer.RESOURCE_GROUPBY).MultipleTimes().\
             AndReturn(statistics)
 
+        api.ceilometer.CeilometerUsage.preload_tenants(IsA(list))
+        api.ceilometer.CeilometerUsage.preload_users(IsA(list))
         api.ceilometer.CeilometerUsage\
             .get_user(IsA(str)).MultipleTimes().AndReturn(user)
         api.ceilometer.CeilometerUsage\
@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mock
+
+from horizon.utils import memoized
+
 from openstack_dashboard.api.rest import config
 from openstack_dashboard.test import helpers as test
 
@@ -24,3 +28,24 @@ class ConfigRestTestCase(test.TestCase):
         self.assertIn(b"REST_API_SETTING_1", response.content)
         self.assertIn(b"REST_API_SETTING_2", response.content)
         self.assertNotIn(b"REST_API_SECURITY", response.content)
+
+    @mock.patch.object(config.policy, 'check', return_value=True)
+    def test_memoized_caches_get(self, check):
+        @memoized.memoized(max_entries=2)
+        def double(value):
+            return value * 2
+
+        for value in range(3):
+            double(value)
+        response = config.MemoizedCaches().get(self.mock_rest_request())
+        self.assertStatusCode(response, 200)
+        name = '%s.double' % __name__
+        sizes = [size for size in response.json['items']
+                 if size['name'] == name]
+        self.assertEqual([{'name': name, 'entries': 2, 'max_entries': 2,
+                           'ttl': None}], sizes)
+
+    @mock.patch.object(config.policy, 'check', return_value=False)
+    def test_memoized_caches_get_not_admin(self, check):
+        response = config.MemoizedCaches().get(self.mock_rest_request())
+        self.assertStatusCode(response, 403)
@@ -18,6 +18,7 @@
 
 from django.conf import settings
 from django.test.utils import override_settings
+import mock
 
 from openstack_dashboard import api
 from openstack_dashboard.api import base
@@ -253,6 +254,24 @@ class GlanceApiTests(test.APITestCase):
         self.assertEqual(len(list(images_iter)),
                          len(api_images) - len(expected_images) - 1)
 
+    def test_image_list_by_ids(self):
+        images = self.images.list()
+        image_ids = sorted(image.id for image in images[:3])
+        self.mox.StubOutWithMock(api.glance, 'image_list_detailed')
+        api.glance.image_list_detailed(
+            self.request, filters={'id': 'in:%s' % ','.join(image_ids[:2])}) \
+            .AndReturn((images[:2], False, False))
+        api.glance.image_list_detailed(
+            self.request, filters={'id': 'in:%s' % image_ids[2]}) \
+            .AndReturn((images[2:3], False, False))
+        self.mox.ReplayAll()
+
+        with mock.patch.object(api.glance, 'IMAGE_IDS_PER_QUERY', 2):
+            result = api.glance.image_list_by_ids(self.request,
+                                                  image_ids + image_ids)
+        self.assertItemsEqual(result, images[:3])
+        self.assertEqual([], api.glance.image_list_by_ids(self.request, []))
+
     def test_get_image_empty_name(self):
         glanceclient = self.stub_glanceclient()
         glanceclient.images = self.mox.CreateMockAnything()
@@ -18,7 +18,11 @@
 
 from __future__ import absolute_import
 
+from django.core.cache import cache
+from django import http
+from keystoneclient import exceptions as keystone_exceptions
 from keystoneclient.v2_0 import client as keystone_client
+from mox3.mox import IsA  # noqa
 import six
 
 from openstack_dashboard import api
@@ -114,3 +118,29 @@ class ServiceAPITests(test.APITestCase):
         self.assertEqual("http://public.nova2.example.com:8774/v2",
                          service.public_url)
         self.assertEqual("int.nova2.example.com", service.host)
+
+
+class IdentityNameTests(test.APITestCase):
+    def setUp(self):
+        super(IdentityNameTests, self).setUp()
+        cache.clear()
+
+    @test.create_stubs({api.keystone: ('tenant_get',)})
+    def test_tenant_names_are_cached(self):
+        tenant = self.tenants.first()
+        api.keystone.tenant_get(IsA(http.HttpRequest), tenant.id) \
+            .AndReturn(tenant)
+        api.keystone.tenant_get(IsA(http.HttpRequest), 'deleted') \
+            .AndRaise(keystone_exceptions.NotFound)
+        self.mox.ReplayAll()
+
+        expected = {tenant.id: tenant.name}
+        self.assertEqual(expected,
+                         api.keystone.tenant_names(self.request, [tenant.id]))
+        self.assertEqual(expected,
+                         api.keystone.tenant_names(self.request,
+                                                   [tenant.id, 'deleted']))
+        # Both the name and the missing project are served from the cache.
+        self.assertEqual(expected,
+                         api.keystone.tenant_names(self.request,
+                                                   [tenant.id, 'deleted']))
@@ -16,6 +16,7 @@ import uuid
 
 from mox3.mox import IsA  # noqa
 
+from django.core.cache import cache
 from django import http
 from django.test.utils import override_settings
 
@@ -27,6 +28,19 @@ from openstack_dashboard.test import helpers as test
 
 
 class NeutronApiTests(test.APITestCase):
+    def test_resource_count(self):
+        networks = {'networks': [{'id': network['id']} for network
+                                 in self.api_networks.list()]}
+
+        neutronclient = self.stub_neutronclient()
+        neutronclient.list_networks(fields='id', tenant_id='1') \
+            .AndReturn(networks)
+        self.mox.ReplayAll()
+
+        self.assertEqual(len(self.api_networks.list()),
+                         api.neutron.resource_count(self.request, 'networks',
+                                                    tenant_id='1'))
+
     def test_network_list(self):
         networks = {'networks': self.api_networks.list()}
         subnets = {'subnets': self.api_subnets.list()}
@@ -712,13 +726,56 @@ class NeutronApiTests(test.APITestCase):
         neutronclient = self.stub_neutronclient()
         uri_len_exc = neutron_exc.RequestURITooLong(excess=220)
         neutronclient.list_ports(id=port_ids).AndRaise(uri_len_exc)
-        for i in range(0, 10, 4):
+        # The chunks are listed concurrently, and the learned filter
+        # length lets the second call split the filter values up front.
+        for attempt in range(2):
+            for i in range(0, 10, 4):
+                neutronclient.list_ports(id=port_ids[i:i + 4]) \
+                    .InAnyOrder(attempt).AndReturn({'ports': ports[i:i + 4]})
+        self.mox.ReplayAll()
+
+        for attempt in range(2):
+            ret_val = api.neutron.list_resources_with_long_filters(
+                api.neutron.port_list, 'id', port_ids,
+                request=self.request)
+            self.assertEqual(10, len(ret_val))
+            self.assertEqual(port_ids, [p.id for p in ret_val])
+
+    def test_list_resources_with_long_filters_stale_length(self):
+        # A filter length of 200 cached for another set of parameters
+        # splits the 10 port IDs into two chunks of 5. Both are still too
+        # long by 40 chars, so each is split again into 4 and 1 IDs.
+        ports = [{'id': str(uuid.uuid4()),
+                  'name': 'port%s' % i,
+                  'admin_state_up': True}
+                 for i in range(10)]
+        port_ids = [port['id'] for port in ports]
+        cache_key = api.neutron._filter_length_cache_key(
+            api.neutron.port_list, {'request': self.request})
+        self.addCleanup(cache.delete, cache_key)
+        cache.set(cache_key, 200)
+
+        neutronclient = self.stub_neutronclient()
+        uri_len_exc = neutron_exc.RequestURITooLong(excess=40)
+        for i in (0, 5):
+            neutronclient.list_ports(id=port_ids[i:i + 5]) \
+                .InAnyOrder().AndRaise(uri_len_exc)
             neutronclient.list_ports(id=port_ids[i:i + 4]) \
-                .AndReturn({'ports': ports[i:i + 4]})
+                .InAnyOrder().AndReturn({'ports': ports[i:i + 4]})
+            neutronclient.list_ports(id=port_ids[i + 4:i + 5]) \
+                .InAnyOrder().AndReturn({'ports': ports[i + 4:i + 5]})
         self.mox.ReplayAll()
 
         ret_val = api.neutron.list_resources_with_long_filters(
-            api.neutron.port_list, 'id', port_ids,
-            request=self.request)
-        self.assertEqual(10, len(ret_val))
+            api.neutron.port_list, 'id', port_ids, request=self.request)
         self.assertEqual(port_ids, [p.id for p in ret_val])
+        self.assertEqual(160, cache.get(cache_key))
+
+    def test_filter_length_cache_key(self):
+        cache_key = api.neutron._filter_length_cache_key(
+            api.neutron.port_list, {'request': self.request})
+        self.assertNotEqual(cache_key, api.neutron._filter_length_cache_key(
+            api.neutron.port_list,
+            {'request': self.request, 'network_id': 'net'}))
+        self.assertNotEqual(cache_key, api.neutron._filter_length_cache_key(
+            api.neutron.network_list, {'request': self.request}))
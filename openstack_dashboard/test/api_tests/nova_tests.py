@@ -149,6 +149,20 @@ class ComputeApiTests(test.APITestCase):
         for server in ret_val:
             self.assertIsInstance(server, api.nova.Server)
 
+    def test_server_status_counts(self):
+        counts = [{'status': 'ACTIVE', 'vm_state': 'active', 'count': 2}]
+
+        novaclient = self.stub_novaclient()
+        novaclient.server_status_counts = self.mox.CreateMockAnything()
+        novaclient.server_status_counts.list(
+            group_by=['host'], host=None, availability_zone=None,
+            project_id=None).AndReturn(counts)
+        self.mox.ReplayAll()
+
+        ret_val = api.nova.server_status_counts(self.request,
+                                                group_by=['host'])
+        self.assertEqual(counts, ret_val)
+
     def test_server_list_pagination(self):
         page_size = getattr(settings, 'API_RESULT_PAGE_SIZE', 20)
         servers = self.servers.list()
@@ -214,6 +228,28 @@ class ComputeApiTests(test.APITestCase):
         for usage in ret_val:
             self.assertIsInstance(usage, api.nova.NovaUsage)
 
+    def test_usage_list_summaries(self):
+        usages = self.usages.list()
+
+        novaclient = self.stub_novaclient()
+        novaclient.usage = self.mox.CreateMockAnything()
+        novaclient.usage.list('start', 'end', True).AndReturn(usages)
+        self.mox.ReplayAll()
+
+        ret_val = api.nova.usage_list(self.request, 'start', 'end',
+                                      detailed=False)
+        # The summaries of the period are shared, not retrieved again.
+        self.assertEqual(
+            [usage.get_summary() for usage in ret_val],
+            [usage.get_summary() for usage in api.nova.usage_list(
+                self.request, 'start', 'end', detailed=False)])
+        for usage, summary in zip(usages, ret_val):
+            self.assertIsInstance(summary, api.nova.NovaUsageSummary)
+            self.assertEqual(usage.tenant_id, summary.tenant_id)
+            self.assertEqual(api.nova.NovaUsage(usage).get_summary(),
+                             summary.get_summary())
+            self.assertFalse(summary.server_usages)
+
     def test_server_get(self):
         server = self.servers.first()
 
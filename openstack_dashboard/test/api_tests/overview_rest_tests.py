@@ -0,0 +1,97 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datetime
+
+import mock
+
+from openstack_dashboard.api.rest import overview
+from openstack_dashboard.test import helpers as test
+
+
+class OverviewRestTestCase(test.TestCase):
+
+    def _request(self, **params):
+        request = self.mock_rest_request(GET=params)
+        request.user.available_services_regions = ['RegionOne', 'RegionTwo']
+        return request
+
+    @mock.patch.object(overview.policy, 'check', return_value=True)
+    @mock.patch.object(overview.overview, 'get_widget')
+    def test_instances_widget(self, get_widget, check):
+        computed_at = datetime.datetime(2016, 9, 1, 12, 0, 0)
+        get_widget.return_value = {
+            'instance_stats_count': {'up': 2, 'down': 1},
+            'region': 'RegionTwo',
+            'computed_at': computed_at,
+            'age': 5.0,
+        }
+        request = self._request(region='RegionTwo')
+        response = overview.OverviewWidget().get(request, 'instances')
+        self.assertStatusCode(response, 200)
+        self.assertEqual({'up': 2, 'down': 1},
+                         response.json['instance_stats_count'])
+        self.assertEqual(computed_at.isoformat(),
+                         response.json['computed_at'])
+        get_widget.assert_called_once_with(request, 'instances',
+                                           region='RegionTwo',
+                                           refresh=False)
+
+    @mock.patch.object(overview.policy, 'check', return_value=True)
+    @mock.patch.object(overview.overview, 'get_widget')
+    def test_hypervisors_widget_display(self, get_widget, check):
+        get_widget.return_value = {
+            'hypervisor_stats': {'memory_mb': 2048, 'memory_mb_used': 1024,
+                                 'local_gb': 100, 'local_gb_used': 40},
+            'hypervisor_stats_count': {'up': 1, 'down': 0},
+            'computed_at': datetime.datetime(2016, 9, 1, 12, 0, 0),
+        }
+        response = overview.OverviewWidget().get(
+            self._request(refresh='1'), 'hypervisors')
+        self.assertStatusCode(response, 200)
+        self.assertEqual('60GB', response.json['display']['local_gb_free'])
+        self.assertTrue(get_widget.call_args[1]['refresh'])
+
+    @mock.patch.object(overview.policy, 'check', return_value=True)
+    @mock.patch.object(overview.overview, 'get_regions_widget')
+    def test_all_regions_widget(self, get_regions_widget, check):
+        get_regions_widget.return_value = {
+            'instance_stats_count': {'up': 5, 'down': 2},
+            'regions': ['RegionOne', 'RegionTwo'],
+            'region_timings': {'RegionOne': 0.1, 'RegionTwo': 0.2},
+            'missing_regions': [],
+            'computed_at': datetime.datetime(2016, 9, 1, 12, 0, 0),
+            'age': 5.0,
+        }
+        request = self._request(all_regions='1')
+        response = overview.OverviewWidget().get(request, 'instances')
+        self.assertStatusCode(response, 200)
+        self.assertEqual(['RegionOne', 'RegionTwo'],
+                         response.json['regions'])
+        get_regions_widget.assert_called_once_with(
+            request, 'instances', ['RegionOne', 'RegionTwo'], refresh=False)
+
+    @mock.patch.object(overview.policy, 'check', return_value=True)
+    def test_unknown_widget(self, check):
+        response = overview.OverviewWidget().get(self._request(), 'unknown')
+        self.assertStatusCode(response, 404)
+
+    @mock.patch.object(overview.policy, 'check', return_value=True)
+    def test_unknown_region(self, check):
+        response = overview.OverviewWidget().get(
+            self._request(region='bogus'), 'instances')
+        self.assertStatusCode(response, 400)
+
+    @mock.patch.object(overview.policy, 'check', return_value=False)
+    def test_not_admin(self, check):
+        response = overview.OverviewWidget().get(self._request(),
+                                                 'instances')
+        self.assertStatusCode(response, 403)
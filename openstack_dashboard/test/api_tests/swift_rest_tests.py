@@ -117,8 +117,8 @@ class SwiftRestTestCase(test.TestCase):
     @mock.patch.object(swift.api, 'swift')
     def test_objects_get(self, nc):
         request = self.mock_rest_request(GET={})
-        nc.swift_get_objects.return_value = (
-            self._objects + self._folder, False
+        nc.swift_iter_objects.return_value = iter(
+            self._objects + self._folder
         )
         response = swift.Objects().get(request, u'container one%\u6346')
         self.assertStatusCode(response, 200)
@@ -138,20 +138,20 @@ class SwiftRestTestCase(test.TestCase):
         self.assertEqual(False, response.json['items'][4]['is_object'])
         self.assertEqual(True, response.json['items'][4]['is_subdir'])
 
-        nc.swift_get_objects.assert_called_once_with(request,
-                                                     u'container one%\u6346',
-                                                     prefix=None)
+        nc.swift_iter_objects.assert_called_once_with(request,
+                                                      u'container one%\u6346',
+                                                      prefix=None)
 
     @mock.patch.object(swift.api, 'swift')
     def test_container_get_path_folder(self, nc):
         request = self.mock_rest_request(GET={'path': u'test folder%\u6346/'})
-        nc.swift_get_objects.return_value = (self._subfolder, False)
+        nc.swift_iter_objects.return_value = iter(self._subfolder)
         response = swift.Objects().get(request, u'container one%\u6346')
         self.assertStatusCode(response, 200)
         self.assertEqual(1, len(response.json['items']))
         self.assertEqual(True, response.json['items'][0]['is_object'])
         self.assertEqual(False, response.json['items'][0]['is_subdir'])
-        nc.swift_get_objects.assert_called_once_with(
+        nc.swift_iter_objects.assert_called_once_with(
             request,
             u'container one%\u6346', prefix=u'test folder%\u6346/'
         )
@@ -183,6 +183,14 @@ class SwiftRestTestCase(test.TestCase):
                                                        'container',
                                                        'test.txt')
 
+    @mock.patch.object(swift.api, 'swift')
+    def test_object_download(self, nc):
+        request = self.mock_rest_request()
+        response = swift.Object().get(request, 'container', 'test.txt')
+        self.assertIs(nc.object_download_response.return_value, response)
+        nc.object_download_response.assert_called_once_with(
+            request, 'container', 'test.txt')
+
     @mock.patch.object(swift, 'UploadObjectForm')
     @mock.patch.object(swift.api, 'swift')
     def test_object_create(self, nc, uf):
@@ -18,7 +18,16 @@
 
 from __future__ import absolute_import
 
+import hashlib
+import json
+import os
+import threading
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+import mock
 from mox3.mox import IsA  # noqa
+import six
+import swiftclient
 
 from horizon import exceptions
 
@@ -26,6 +35,49 @@ from openstack_dashboard import api
 from openstack_dashboard.test import helpers as test
 
 
+class FakeSwiftConnection(object):
+    """In-memory stand-in for the object store used by segmented uploads.
+
+    Uploading an object listed in ``failures`` fails once.
+    """
+
+    def __init__(self, failures=()):
+        self.containers = {}
+        self.uploads = []
+        self.failures = set(failures)
+        self._lock = threading.Lock()
+
+    def put_container(self, container, headers=None):
+        with self._lock:
+            self.containers.setdefault(container, {})
+
+    def get_container(self, container, prefix='', full_listing=False):
+        with self._lock:
+            if container not in self.containers:
+                raise swiftclient.client.ClientException('Not found',
+                                                         http_status=404)
+            return {}, [{'name': name, 'bytes': len(data),
+                         'hash': hashlib.md5(data).hexdigest()}
+                        for name, (data, headers)
+                        in sorted(self.containers[container].items())
+                        if name.startswith(prefix or '')]
+
+    def put_object(self, container, obj, contents, content_length=None,
+                   chunk_size=None, headers=None, query_string=None):
+        if hasattr(contents, 'read'):
+            contents = b''.join(iter(lambda: contents.read(chunk_size),
+                                     b''))
+        if isinstance(contents, six.text_type):
+            contents = contents.encode('utf-8')
+        with self._lock:
+            if obj in self.failures:
+                self.failures.remove(obj)
+                raise swiftclient.client.ClientException('Failed')
+            self.containers[container][obj] = (contents, headers)
+            self.uploads.append(obj)
+        return hashlib.md5(contents).hexdigest()
+
+
 class SwiftApiTests(test.APITestCase):
     def test_swift_get_containers(self):
         containers = self.containers.list()
@@ -114,8 +166,7 @@ class SwiftApiTests(test.APITestCase):
                                 limit=1001,
                                 marker=None,
                                 prefix=None,
-                                delimiter='/',
-                                full_listing=True).AndReturn([{}, objects])
+                                delimiter='/').AndReturn([{}, objects])
         self.mox.ReplayAll()
 
         (objs, more) = api.swift.swift_get_objects(self.request,
@@ -123,6 +174,112 @@ class SwiftApiTests(test.APITestCase):
         self.assertEqual(len(objects), len(objs))
         self.assertFalse(more)
 
+    def test_swift_iter_objects(self):
+        container = self.containers.first()
+        objects = [{'name': 'a'}, {'subdir': 'b/'}, {'name': 'c'}]
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_container(container.name, prefix=None, marker=None,
+                                limit=2, delimiter='/') \
+            .AndReturn([{}, objects[:2]])
+        swift_api.get_container(container.name, prefix=None, marker='b/',
+                                limit=2, delimiter='/') \
+            .AndReturn([{}, objects[2:]])
+        self.mox.ReplayAll()
+
+        objs = api.swift.swift_iter_objects(self.request, container.name,
+                                            page_size=2)
+        self.assertEqual(['a', 'b', 'c'], [obj.name for obj in objs])
+
+    def test_swift_filter_objects_trailing_wildcard(self):
+        container = self.containers.first()
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_container(container.name, prefix='folder/',
+                                marker=None, limit=1000, delimiter='/') \
+            .AndReturn([{}, [{'name': 'folder/Abc'}, {'name': 'folder/aBd'},
+                             {'name': 'folder/xab'}, {'name': 'folder/xyz'},
+                             {'subdir': 'folder/ab/'}]])
+        self.mox.ReplayAll()
+
+        # The whole folder is listed: names containing the filter text
+        # anywhere match, ignoring case.
+        objs = api.swift.swift_filter_objects(self.request, ' Ab* ',
+                                              container.name,
+                                              prefix='folder/')
+        self.assertEqual(['folder/Abc', 'folder/aBd', 'folder/xab',
+                          'folder/ab'],
+                         [obj.name for obj in objs])
+
+    def test_swift_filter_objects_wildcard(self):
+        container = self.containers.first()
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_container(container.name, prefix=None, marker=None,
+                                limit=1000, delimiter='/') \
+            .AndReturn([{}, [{'name': 'abc'}, {'name': 'xbz'},
+                             {'name': 'Bcd'}]])
+        self.mox.ReplayAll()
+
+        objs = api.swift.swift_filter_objects(self.request, '*b*',
+                                              container.name)
+        self.assertEqual(['abc', 'xbz', 'Bcd'], [obj.name for obj in objs])
+
+    def test_swift_delete_folder_nonempty(self):
+        container = self.containers.first()
+
+        swift_api = self.stub_swiftclient()
+        swift_api.get_container(container.name, prefix='folder/', limit=2) \
+            .AndReturn([{}, [{'name': 'folder/'}, {'name': 'folder/a'}]])
+        self.mox.ReplayAll()
+
+        with self.assertRaises(exceptions.Conflict):
+            api.swift.swift_delete_folder(self.request, container.name,
+                                          'folder/')
+
+    def test_swift_delete_folder(self):
+        container = self.containers.first()
+
+        swift_api = self.stub_swiftclient(expected_calls=2)
+        swift_api.get_container(container.name, prefix='folder/', limit=2) \
+            .AndReturn([{}, [{'name': 'folder/'}]])
+        swift_api.delete_object(container.name, 'folder/')
+        self.mox.ReplayAll()
+
+        self.assertTrue(api.swift.swift_delete_folder(self.request,
+                                                      container.name,
+                                                      'folder/'))
+
+    def test_swift_delete_object(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+
+        swift_api = self.stub_swiftclient(expected_calls=2)
+        swift_api.head_object(container.name, obj.name) \
+            .AndReturn({'content-length': '10'})
+        swift_api.delete_object(container.name, obj.name, query_string=None)
+        self.mox.ReplayAll()
+
+        self.assertTrue(api.swift.swift_delete_object(self.request,
+                                                      container.name,
+                                                      obj.name))
+
+    def test_swift_delete_static_large_object(self):
+        container = self.containers.first()
+        obj = self.objects.first()
+
+        swift_api = self.stub_swiftclient(expected_calls=2)
+        swift_api.head_object(container.name, obj.name) \
+            .AndReturn({'x-static-large-object': 'True'})
+        # The segments are deleted along with the manifest.
+        swift_api.delete_object(container.name, obj.name,
+                                query_string='multipart-manifest=delete')
+        self.mox.ReplayAll()
+
+        self.assertTrue(api.swift.swift_delete_object(self.request,
+                                                      container.name,
+                                                      obj.name))
+
     def test_swift_get_object_with_data_non_chunked(self):
         container = self.containers.first()
         object = self.objects.first()
@@ -225,6 +382,82 @@ class SwiftApiTests(test.APITestCase):
                                       obj.name,
                                       test_file)
 
+    def test_swift_upload_segmented_object(self):
+        swift = FakeSwiftConnection()
+        swift.put_container('container')
+        data = b'0123456789'
+        object_file = SimpleUploadedFile('numbers.txt', data)
+
+        with mock.patch.object(api.swift, 'swift_api', return_value=swift):
+            obj = api.swift.swift_upload_object(self.request, 'container',
+                                                'numbers', object_file,
+                                                segment_size=4)
+
+        self.assertEqual(10, obj.bytes)
+        segments = swift.containers['container_segments']
+        self.assertEqual([b'0123', b'4567', b'89'],
+                         [segments[name][0] for name in sorted(segments)])
+        manifest, headers = swift.containers['container']['numbers']
+        self.assertEqual(
+            ['/container_segments/numbers/slo/10/4/%08d' % index
+             for index in range(3)],
+            [segment['path'] for segment in json.loads(manifest)])
+        self.assertEqual({'X-Object-Meta-Orig-Filename': 'numbers.txt'},
+                         headers)
+
+    def test_swift_upload_segmented_object_resume(self):
+        prefix = 'numbers/slo/10/4/'
+        swift = FakeSwiftConnection(failures=[prefix + '00000002'])
+        swift.put_container('container')
+        object_file = SimpleUploadedFile('numbers.txt', b'0123456789')
+
+        with mock.patch.object(api.swift, 'swift_api', return_value=swift):
+            self.assertRaises(swiftclient.client.ClientException,
+                              api.swift.swift_upload_object, self.request,
+                              'container', 'numbers', object_file,
+                              segment_size=4)
+            self.assertNotIn('numbers', swift.containers['container'])
+
+            del swift.uploads[:]
+            api.swift.swift_upload_object(self.request, 'container',
+                                          'numbers', object_file,
+                                          segment_size=4)
+
+        # Only the segment that failed is uploaded again.
+        self.assertEqual([prefix + '00000002', 'numbers'], swift.uploads)
+
+    def test_segment_reader_seek(self):
+        object_file = SimpleUploadedFile('numbers.txt', b'0123456789')
+        segment = api.swift._segment_opener(object_file)(4, 4)
+        try:
+            self.assertEqual(b'45', segment.read(2))
+            self.assertEqual(2, segment.tell())
+            self.assertEqual(b'67', segment.read())
+            self.assertEqual(b'', segment.read())
+            # A retried upload reads the segment again from its start.
+            segment.seek(0)
+            self.assertEqual(0, segment.tell())
+            self.assertEqual(b'4567', segment.read())
+            segment.seek(-1, os.SEEK_END)
+            self.assertEqual(b'7', segment.read())
+        finally:
+            segment.close()
+
+    def test_segment_opener_releases_lock(self):
+        object_file = SimpleUploadedFile('numbers.txt', b'0123456789')
+        open_segment = api.swift._segment_opener(object_file)
+        with mock.patch.object(object_file, 'seek',
+                               side_effect=IOError('Failed')):
+            self.assertRaises(IOError, open_segment, 0, 4)
+        # The lock is free for the next segment, and closing a segment
+        # twice releases it once.
+        segment = open_segment(4, 4)
+        segment.close()
+        segment.close()
+        segment = open_segment(8, 2)
+        self.assertEqual(b'89', segment.read())
+        segment.close()
+
     def test_swift_upload_object_without_file(self):
         container = self.containers.first()
         obj = self.objects.first()
@@ -26,6 +26,7 @@ import unittest
 import django
 from django.conf import settings
 from django.contrib.messages.storage import default_storage  # noqa
+from django.core.cache import cache
 from django.core.handlers import wsgi
 from django.core import urlresolvers
 from django.test.client import RequestFactory  # noqa
@@ -175,6 +176,10 @@ class TestCase(horizon_helpers.TestCase):
         self.patchers = {}
         self.add_panel_mocks()
 
+        # API calls memoized in the shared cache must not be answered from
+        # a previous test.
+        cache.clear()
+
         super(TestCase, self).setUp()
 
     def _setup_test_data(self):
@@ -182,6 +187,11 @@ class TestCase(horizon_helpers.TestCase):
         test_utils.load_test_data(self)
         self.context = {'authorized_tenants': self.tenants.list()}
 
+    @property
+    def tenant_names(self):
+        """The names of the test projects by id, as keystone resolves them."""
+        return dict((tenant.id, tenant.name) for tenant in self.tenants.list())
+
     def _setup_factory(self):
         # For some magical reason we need a copy of this here.
         self.factory = RequestFactoryWithMessages()
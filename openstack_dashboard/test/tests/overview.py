@@ -0,0 +1,161 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+
+from django.core.cache import cache
+from django.test.utils import override_settings
+from django.utils import timezone
+import mock
+from mox3.mox import IgnoreArg  # noqa
+
+from openstack_dashboard import api
+from openstack_dashboard.test import helpers as test
+from openstack_dashboard.usage import overview
+
+
+class OverviewWidgetTests(test.APITestCase):
+
+    def setUp(self):
+        super(OverviewWidgetTests, self).setUp()
+        cache.clear()
+
+    def _expect_instances(self, status_counts=None):
+        api.nova.extension_supported('ServerStatusCounts', IgnoreArg()) \
+            .AndReturn(status_counts is not None)
+        if status_counts is None:
+            api.nova.server_list(IgnoreArg(), all_tenants=True) \
+                .AndReturn([self.servers.list(), False])
+        else:
+            api.nova.server_status_counts(IgnoreArg()) \
+                .AndReturn(status_counts)
+
+    @test.create_stubs({api.nova: ('hypervisor_stats',
+                                   'hypervisor_list')})
+    def test_hypervisors_widget(self):
+        stats = api.base.APIDictWrapper(
+            self.hypervisors.stats['hypervisor_statistics'])
+        api.nova.hypervisor_stats(IgnoreArg()).AndReturn(stats)
+        api.nova.hypervisor_list(IgnoreArg()) \
+            .AndReturn(self.hypervisors.list())
+        self.mox.ReplayAll()
+
+        data = overview.get_widget(self.request, 'hypervisors')
+        self.assertEqual(160, data['hypervisor_stats']['vcpus'])
+        self.assertEqual(self.request.user.services_region, data['region'])
+
+    @test.create_stubs({api.nova: ('server_list',
+                                   'extension_supported')})
+    def test_instances_widget_is_cached(self):
+        self._expect_instances()
+        self.mox.ReplayAll()
+
+        data = overview.get_widget(self.request, 'instances')
+        active = len([s for s in self.servers.list()
+                      if s.status == 'ACTIVE'])
+        self.assertEqual(active, data['instance_stats_count']['active'])
+
+        # Served from the cache: no further API calls are expected.
+        cached = overview.get_widget(self.request, 'instances')
+        self.assertEqual(data['computed_at'], cached['computed_at'])
+        self.assertLess(cached['age'], 60)
+
+    @test.create_stubs({api.nova: ('server_list',
+                                   'extension_supported')})
+    def test_instances_widget_refresh(self):
+        self._expect_instances()
+        self._expect_instances()
+        self.mox.ReplayAll()
+
+        data = overview.get_widget(self.request, 'instances')
+        refreshed = overview.get_widget(self.request, 'instances',
+                                        refresh=True)
+        self.assertGreaterEqual(refreshed['computed_at'],
+                                data['computed_at'])
+
+    @test.create_stubs({api.nova: ('server_status_counts',
+                                   'extension_supported')})
+    def test_instances_widget_with_status_counts(self):
+        status_counts = [
+            api.base.APIDictWrapper({'status': 'ACTIVE', 'count': 4}),
+            api.base.APIDictWrapper({'status': 'SUSPENDED', 'count': 2}),
+            api.base.APIDictWrapper({'status': 'SHUTOFF', 'count': 1}),
+        ]
+        self._expect_instances(status_counts)
+        self.mox.ReplayAll()
+
+        data = overview.get_widget(self.request, 'instances')
+        self.assertEqual({'up': 6, 'down': 1, 'active': 4, 'running': 0,
+                          'idle': 2, 'free': 0},
+                         data['instance_stats_count'])
+
+    @override_settings(OVERVIEW_SNAPSHOT_INTERVAL=60)
+    def test_stale_widget_is_served_and_refreshed(self):
+        self.mox.StubOutWithMock(overview, '_refresh_in_background')
+        overview._refresh_in_background(IgnoreArg(), 'instances',
+                                        IgnoreArg())
+        self.mox.ReplayAll()
+
+        key = overview._cache_key(self.request, 'instances')
+        computed_at = timezone.now() - datetime.timedelta(minutes=5)
+        cache.set(key, {'computed_at': computed_at})
+
+        data = overview.get_widget(self.request, 'instances')
+        self.assertEqual(computed_at, data['computed_at'])
+        self.assertGreaterEqual(data['age'], 300)
+
+    def test_get_unknown_widget(self):
+        self.assertRaises(KeyError, overview.get_widget, self.request,
+                          'unknown')
+
+    def test_regions_widget(self):
+        computed_at = timezone.now()
+
+        def get_widget(request, widget, region=None, refresh=False):
+            if region == 'RegionThree':
+                raise Exception('Region unavailable.')
+            up = 2 if region == 'RegionOne' else 3
+            return {'instance_stats_count': {'up': up, 'down': 1},
+                    'region': region,
+                    'computed_at': computed_at,
+                    'age': 10.0 if region == 'RegionTwo' else 1.0}
+
+        with mock.patch.object(overview, 'get_widget',
+                               side_effect=get_widget) as mocked:
+            data = overview.get_regions_widget(
+                self.request, 'instances',
+                ['RegionOne', 'RegionTwo', 'RegionThree'])
+
+        self.assertEqual(3, mocked.call_count)
+        self.assertEqual({'up': 5, 'down': 2}, data['instance_stats_count'])
+        self.assertEqual(['RegionOne', 'RegionTwo'], data['regions'])
+        self.assertEqual(['RegionOne', 'RegionTwo'],
+                         list(data['region_timings']))
+        self.assertEqual(['RegionThree'], data['missing_regions'])
+        self.assertEqual(10.0, data['age'])
+
+    def test_regions_widget_availability_zones(self):
+        def get_widget(request, widget, region=None, refresh=False):
+            return {'availability_zones': [{'name': 'nova', 'count': 1}],
+                    'region': region,
+                    'computed_at': timezone.now(),
+                    'age': 0}
+
+        with mock.patch.object(overview, 'get_widget',
+                               side_effect=get_widget):
+            data = overview.get_regions_widget(
+                self.request, 'availability_zones',
+                ['RegionOne', 'RegionTwo'])
+
+        self.assertEqual([{'name': 'nova', 'count': 1, 'region': 'RegionOne'},
+                          {'name': 'nova', 'count': 1, 'region': 'RegionTwo'}],
+                         data['availability_zones'])
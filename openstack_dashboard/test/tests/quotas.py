@@ -22,6 +22,7 @@ from __future__ import absolute_import
 from django import http
 from django.test.utils import override_settings
 from django.utils.translation import ugettext_lazy as _
+import mock
 from mox3.mox import IsA  # noqa
 
 from horizon import exceptions
@@ -348,6 +349,82 @@ class QuotaTests(test.APITestCase):
         # Compare internal structure of usages to expected.
         self.assertItemsEqual(expected_output, quota_usages.usages)
 
+    @test.create_stubs({quotas: ('get_disabled_quotas',
+                                 'get_tenant_quota_data')})
+    def test_tenant_quota_usages_shared_cache(self):
+        fetched = []
+
+        def fetch(request, usages, disabled_quotas, tenant_id):
+            fetched.append(tenant_id)
+            usages.tally('instances', 2)
+
+        for i in range(2):
+            quotas.get_disabled_quotas(IsA(http.HttpRequest)) \
+                .AndReturn(set())
+            quotas.get_tenant_quota_data(IsA(http.HttpRequest),
+                                         disabled_quotas=set(),
+                                         tenant_id='1') \
+                .AndReturn(api.base.QuotaSet({'instances': 10}))
+        self.mox.ReplayAll()
+
+        with mock.patch.object(quotas, 'USAGE_FETCHES',
+                               {'instances': fetch}):
+            quota_usages = quotas.tenant_quota_usages(self.request)
+            self.assertEqual({'quota': 10, 'used': 2, 'available': 8},
+                             quota_usages['instances'])
+
+            # Another request of the project uses the shared result.
+            request = http.HttpRequest()
+            request.user = self.request.user
+            quota_usages = quotas.tenant_quota_usages(request)
+            self.assertEqual(2, quota_usages['instances']['used'])
+            self.assertEqual(['1'], fetched)
+
+            # Changes made in another project are ignored.
+            other_request = http.HttpRequest()
+            other_request.user = mock.Mock(
+                services_region=self.request.user.services_region,
+                project_id='other')
+            api.base.usage_changed(other_request)
+            request = http.HttpRequest()
+            request.user = self.request.user
+            quotas.tenant_quota_usages(request)
+            self.assertEqual(['1'], fetched)
+
+            # Until a resource of the project is created or deleted.
+            api.base.usage_changed(request)
+            request = http.HttpRequest()
+            request.user = self.request.user
+            quotas.tenant_quota_usages(request)
+            self.assertEqual(['1', '1'], fetched)
+
+    @test.create_stubs({api.network: ('floating_ip_supported',
+                                      'tenant_floating_ip_list',
+                                      'security_group_list'),
+                        api.neutron: ('resource_count',)})
+    def test_get_tenant_network_usages(self):
+        api.network.floating_ip_supported(IsA(http.HttpRequest)) \
+            .AndReturn(True)
+        api.network.tenant_floating_ip_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.floating_ips.list())
+        api.network.security_group_list(IsA(http.HttpRequest)) \
+            .AndReturn(self.security_groups.list())
+        for resource, count in (('networks', 3), ('subnets', 4),
+                                ('routers', 1)):
+            api.neutron.resource_count(IsA(http.HttpRequest), resource,
+                                       tenant_id='1').AndReturn(count)
+        self.mox.ReplayAll()
+
+        usages = quotas.QuotaUsage()
+        quotas._get_tenant_network_usages(self.request, usages, set(), '1')
+        self.assertEqual(len(self.floating_ips.list()),
+                         usages['floating_ips']['used'])
+        self.assertEqual(len(self.security_groups.list()),
+                         usages['security_groups']['used'])
+        self.assertEqual(3, usages['networks']['used'])
+        self.assertEqual(4, usages['subnets']['used'])
+        self.assertEqual(1, usages['routers']['used'])
+
     @test.create_stubs({cinder: ('volume_list',),
                         exceptions: ('handle',)})
     def test_get_tenant_volume_usages_cinder_exception(self):
@@ -210,8 +210,19 @@ class BaseUsage(object):
         return []
 
     def summarize(self, start, end):
+        self.usage_list = list(self.iter_summarize(start, end))
+
+    def iter_summarize(self, start, end):
+        """Returns an iterator over the usages between ``start`` and ``end``.
+
+        The usages are retrieved, and errors handled, by this call. Each
+        usage is then added to ``summary`` as it is consumed, so that the
+        summary is complete once they were all consumed without having to
+        keep them.
+        """
+        usage_list = []
         if not api.nova.extension_supported('SimpleTenantUsage', self.request):
-            return
+            return iter(usage_list)
 
         if start <= end and start <= self.today:
             # The API can't handle timezone aware datetime, so convert back
@@ -219,7 +230,7 @@ class BaseUsage(object):
             start = timezone.make_naive(start, timezone.utc)
             end = timezone.make_naive(end, timezone.utc)
             try:
-                self.usage_list = self.get_usage_list(start, end)
+                usage_list = self.get_usage_list(start, end)
             except Exception:
                 exceptions.handle(self.request,
                                   _('Unable to retrieve usage information.'))
@@ -231,12 +242,15 @@ class BaseUsage(object):
             messages.error(self.request,
                            _("Invalid time period. You are requesting "
                              "data from the future which may not exist."))
+        return self._iter_summary(usage_list)
 
-        for project_usage in self.usage_list:
+    def _iter_summary(self, usage_list):
+        for project_usage in usage_list:
             project_summary = project_usage.get_summary()
             for key, value in project_summary.items():
                 self.summary.setdefault(key, 0)
                 self.summary[key] += value
+            yield project_usage
 
     def csv_link(self):
         form = self.get_form()
@@ -253,7 +267,8 @@ class GlobalUsage(BaseUsage):
     show_deleted = True
 
     def get_usage_list(self, start, end):
-        return api.nova.usage_list(self.request, start, end)
+        # Only the totals of each project are shown.
+        return api.nova.usage_list(self.request, start, end, detailed=False)
 
 
 class ProjectUsage(BaseUsage):
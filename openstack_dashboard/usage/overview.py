@@ -0,0 +1,269 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Cached snapshots of the cluster overview shown on admin landing pages.
+
+The overview of one region is made of widgets: hypervisor totals and state
+counts, instance state counts and availability zone rollups. Each widget is
+cached on its own in the Django cache so that every dashboard process renders
+from the same data and widgets can be loaded independently. A request serves
+the cached widget as is and, once it is older than
+``OVERVIEW_SNAPSHOT_INTERVAL``, recomputes it in the background.
+
+The widgets of several regions can be summed up, their regions being loaded
+concurrently with a request scoped to each of them.
+"""
+
+import collections
+import hashlib
+import logging
+import time
+
+from concurrent import futures
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from horizon.utils import concurrency
+
+from openstack_dashboard.api import base
+from openstack_dashboard.api import nova
+
+
+LOG = logging.getLogger(__name__)
+
+HYPERVISOR_FIELDS = ('count', 'running_vms', 'vcpus', 'vcpus_used',
+                     'memory_mb', 'memory_mb_used', 'local_gb',
+                     'local_gb_used')
+
+# Counter incremented, besides 'up', for each running instance status.
+INSTANCE_STATUS_COUNTERS = {
+    'ACTIVE': 'active',
+    'RUNNING': 'running',
+    'SUSPENDED': 'idle',
+    'CRASHED': 'free',
+}
+
+
+def _counters(*keys):
+    return dict.fromkeys(keys, 0)
+
+
+def _cache_key(request, widget):
+    endpoint = base.url_for(request, 'compute')
+    digest = hashlib.md5(endpoint.encode('utf-8')).hexdigest()
+    return 'horizon:overview:%s:%s:%s' % (widget,
+                                          request.user.services_region,
+                                          digest)
+
+
+def _hypervisors(request):
+    stats = nova.hypervisor_stats(request)
+    hypervisor_stats_count = _counters('up', 'down')
+    for hypervisor in nova.hypervisor_list(request):
+        state = getattr(hypervisor, 'state', None)
+        if state in hypervisor_stats_count:
+            hypervisor_stats_count[state] += 1
+    return {
+        'hypervisor_stats': dict((field, getattr(stats, field))
+                                 for field in HYPERVISOR_FIELDS),
+        'hypervisor_stats_count': hypervisor_stats_count,
+    }
+
+
+def _instances(request):
+    if nova.extension_supported('ServerStatusCounts', request):
+        status_counts = [(item.status, item.count)
+                         for item in nova.server_status_counts(request)]
+    else:
+        status_counts = [(server.status, 1) for server in
+                         nova.server_list(request, all_tenants=True)[0]]
+
+    instance_stats_count = _counters('up', 'down', 'active', 'running',
+                                     'idle', 'free')
+    for status, count in status_counts:
+        counter = INSTANCE_STATUS_COUNTERS.get(status)
+        if counter:
+            instance_stats_count[counter] += count
+            instance_stats_count['up'] += count
+        elif status == 'SHUTOFF':
+            instance_stats_count['down'] += count
+    return {'instance_stats_count': instance_stats_count}
+
+
+def _availability_zones(request):
+    zones = nova.availability_zone_list(request, detailed=True)
+    by_host = dict((h.hypervisor_hostname, h)
+                   for h in nova.hypervisor_list(request))
+    availability_zones = []
+    for zone in zones:
+        hosts = [host for host, services in (zone.hosts or {}).items()
+                 if 'nova-compute' in services]
+        if not hosts:
+            continue
+        rollup = _counters(*HYPERVISOR_FIELDS)
+        rollup['name'] = zone.zoneName
+        rollup['count'] = len(hosts)
+        for host in hosts:
+            hypervisor = by_host.get(host)
+            if hypervisor is None:
+                continue
+            for field in HYPERVISOR_FIELDS[1:]:
+                rollup[field] += getattr(hypervisor, field)
+        availability_zones.append(rollup)
+    return {'availability_zones': availability_zones}
+
+
+# The independently cached parts of an overview, in display order.
+WIDGETS = collections.OrderedDict([
+    ('hypervisors', _hypervisors),
+    ('instances', _instances),
+    ('availability_zones', _availability_zones),
+])
+
+
+def compute_widget(request, widget):
+    """Computes one widget of the overview of the region of ``request``."""
+    return dict(WIDGETS[widget](request),
+                region=request.user.services_region,
+                computed_at=timezone.now())
+
+
+def _store_widget(request, widget, key):
+    data = compute_widget(request, widget)
+    cache.set(key, data,
+              getattr(settings, 'OVERVIEW_SNAPSHOT_MAX_AGE', 3600))
+    return data
+
+
+def _refresh_in_background(request, widget, key):
+    lock_key = key + ':refreshing'
+    interval = getattr(settings, 'OVERVIEW_SNAPSHOT_INTERVAL', 60)
+    # Only one process refreshes a widget at a time; the lock expires on
+    # its own should that process die half way.
+    if not cache.add(lock_key, True, interval):
+        return
+
+    def refresh():
+        try:
+            _store_widget(request, widget, key)
+        except Exception:
+            LOG.exception('Unable to refresh the %s overview of region %s.',
+                          widget, request.user.services_region)
+        finally:
+            cache.delete(lock_key)
+
+    concurrency.submit(concurrency.get_executor('overview', 2), refresh)
+
+
+def get_widget(request, widget, region=None, refresh=False):
+    """Returns the cached ``widget`` of the overview of ``region``.
+
+    The region defaults to the one selected by the user. The cached widget
+    is returned when there is one, and is recomputed in the background once
+    it is older than ``OVERVIEW_SNAPSHOT_INTERVAL`` seconds. It is computed
+    right away when missing or when ``refresh`` is set.
+
+    The returned dictionary carries the widget ``age`` in seconds next to
+    the time it was ``computed_at``.
+    """
+    if widget not in WIDGETS:
+        raise KeyError(widget)
+    # The widget may be refreshed after the response was sent; pin the
+    # region so that it does not follow later changes of the user.
+    request = base.RegionScopedRequest(
+        request, region or request.user.services_region)
+    key = _cache_key(request, widget)
+
+    data = None if refresh else cache.get(key)
+    if data is None:
+        data = _store_widget(request, widget, key)
+
+    age = (timezone.now() - data['computed_at']).total_seconds()
+    if age > getattr(settings, 'OVERVIEW_SNAPSHOT_INTERVAL', 60):
+        _refresh_in_background(request, widget, key)
+
+    return dict(data, age=age)
+
+
+def _merge(widget, parts):
+    """Sums up the ``widget`` of several regions."""
+    if widget == 'availability_zones':
+        return {'availability_zones': [
+            dict(zone, region=part['region'])
+            for part in parts for zone in part['availability_zones']]}
+    merged = {}
+    for part in parts:
+        for key, counters in part.items():
+            if not isinstance(counters, dict):
+                continue
+            total = merged.setdefault(key, dict.fromkeys(counters, 0))
+            for field, value in counters.items():
+                total[field] += value
+    return merged
+
+
+def get_regions_widget(request, widget, regions, refresh=False):
+    """Returns ``widget`` summed up over ``regions``.
+
+    Every region is served by ``get_widget``, and the regions are loaded
+    concurrently on a pool of ``MAIN_REGION_MAX_WORKERS`` threads. Regions
+    not loaded within ``MAIN_REGION_TIMEOUT`` seconds, or whose loading
+    failed, are left out of the sums and listed in ``missing_regions``.
+    The load time of every other region is in ``region_timings``, and the
+    widget is as old as its oldest region.
+    """
+    if widget not in WIDGETS:
+        raise KeyError(widget)
+    executor = concurrency.get_executor(
+        'overview-regions',
+        getattr(settings, 'MAIN_REGION_MAX_WORKERS',
+                concurrency.DEFAULT_MAX_WORKERS))
+
+    def load(region):
+        started = time.time()
+        data = get_widget(request, widget, region=region, refresh=refresh)
+        return data, time.time() - started
+
+    pending = [(region, concurrency.submit(executor, load, region))
+               for region in regions]
+    deadline = time.time() + getattr(settings, 'MAIN_REGION_TIMEOUT', 30)
+    parts = []
+    timings = collections.OrderedDict()
+    missing = []
+    for region, future in pending:
+        try:
+            data, elapsed = future.result(
+                timeout=max(deadline - time.time(), 0))
+        except futures.TimeoutError:
+            future.cancel()
+            LOG.warning('Timed out loading the %s overview of region %s.',
+                        widget, region)
+            missing.append(region)
+            continue
+        except Exception:
+            LOG.exception('Unable to load the %s overview of region %s.',
+                          widget, region)
+            missing.append(region)
+            continue
+        parts.append(data)
+        timings[region] = round(elapsed, 3)
+    LOG.debug('Loaded the %s overview of %s', widget,
+              ', '.join('%s in %.3fs' % item for item in timings.items()))
+
+    return dict(_merge(widget, parts),
+                regions=list(timings),
+                region_timings=timings,
+                missing_regions=missing,
+                computed_at=min([part['computed_at'] for part in parts] or
+                                [timezone.now()]),
+                age=max([part['age'] for part in parts] or [0]))
@@ -11,13 +11,16 @@
 # under the License.
 
 from collections import defaultdict
+from collections import OrderedDict
+import functools
 import itertools
 import logging
 
 from django.utils.translation import ugettext_lazy as _
 
 from horizon import exceptions
-from horizon.utils.memoized import memoized  # noqa
+from horizon.utils import concurrency
+from horizon.utils.memoized import memoized_with_shared_cache  # noqa
 
 from openstack_dashboard.api import base
 from openstack_dashboard.api import cinder
@@ -309,7 +312,8 @@ def _get_tenant_compute_usages(request, usages, disabled_quotas, tenant_id):
         usages.tally('ram', 0)
 
 
-def _get_tenant_network_usages(request, usages, disabled_quotas, tenant_id):
+def _get_tenant_floating_ip_usages(request, usages, disabled_quotas,
+                                   tenant_id):
     floating_ips = []
     try:
         if network.floating_ip_supported(request):
@@ -318,41 +322,35 @@ def _get_tenant_network_usages(request, usages, disabled_quotas, tenant_id):
         pass
     usages.tally('floating_ips', len(floating_ips))
 
+
+def _get_tenant_security_group_usages(request, usages, disabled_quotas,
+                                      tenant_id):
     if 'security_group' not in disabled_quotas:
-        security_groups = []
         security_groups = network.security_group_list(request)
         usages.tally('security_groups', len(security_groups))
 
-    if 'network' not in disabled_quotas:
-        networks = []
-        networks = neutron.network_list(request, shared=False)
-        if tenant_id:
-            networks = [net for net in networks if net.tenant_id == tenant_id]
-        usages.tally('networks', len(networks))
-        # get shared networks
-        shared_networks = neutron.network_list(request, shared=True)
-        if tenant_id:
-            shared_networks = [net for net in shared_networks
-                               if net.tenant_id == tenant_id]
-        usages.tally('networks', len(shared_networks))
-
-    if 'subnet' not in disabled_quotas:
-        subnets = neutron.subnet_list(request, shared=False)
-        if tenant_id:
-            subnets = [sub for sub in subnets if sub.tenant_id == tenant_id]
-        # get shared subnets
-        shared_subnets = neutron.subnet_list(request, shared=True)
-        if tenant_id:
-            shared_subnets = [subnet for subnet in shared_subnets
-                              if subnet.tenant_id == tenant_id]
-        usages.tally('subnets', len(subnets) + len(shared_subnets))
-
-    if 'router' not in disabled_quotas:
-        routers = []
-        routers = neutron.router_list(request)
-        if tenant_id:
-            routers = [rou for rou in routers if rou.tenant_id == tenant_id]
-        usages.tally('routers', len(routers))
+
+def _get_tenant_neutron_usages(request, usages, disabled_quotas, tenant_id,
+                               quota):
+    """Tallies the neutron resources of the project counted by ``quota``.
+
+    ``quota`` is one of "network", "subnet" and "router"; shared resources
+    owned by the project are counted too.
+    """
+    if quota not in disabled_quotas:
+        params = {'tenant_id': tenant_id} if tenant_id else {}
+        usages.tally(quota + 's',
+                     neutron.resource_count(request, quota + 's', **params))
+
+
+def _get_tenant_network_usages(request, usages, disabled_quotas, tenant_id):
+    _get_tenant_floating_ip_usages(request, usages, disabled_quotas,
+                                   tenant_id)
+    _get_tenant_security_group_usages(request, usages, disabled_quotas,
+                                      tenant_id)
+    for quota in ('network', 'subnet', 'router'):
+        _get_tenant_neutron_usages(request, usages, disabled_quotas,
+                                   tenant_id, quota)
 
 
 def _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id):
@@ -373,27 +371,69 @@ def _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id):
             exceptions.handle(request, msg)
 
 
-@memoized
+# The independent fetches of tenant_quota_usages, each tallying the usage
+# of some quotas.
+USAGE_FETCHES = OrderedDict([
+    ('compute', _get_tenant_compute_usages),
+    ('floating_ips', _get_tenant_floating_ip_usages),
+    ('security_groups', _get_tenant_security_group_usages),
+    ('networks', functools.partial(_get_tenant_neutron_usages,
+                                   quota='network')),
+    ('subnets', functools.partial(_get_tenant_neutron_usages,
+                                  quota='subnet')),
+    ('routers', functools.partial(_get_tenant_neutron_usages,
+                                  quota='router')),
+    ('volumes', _get_tenant_volume_usages),
+])
+
+
+def _fetch_usages(fetch, request, disabled_quotas, tenant_id):
+    usages = QuotaUsage()
+    fetch(request, usages, disabled_quotas, tenant_id)
+    return usages
+
+
+def _project_namespace(request):
+    return request.user.services_region, request.user.project_id
+
+
+@base.register_usage_cache
+@memoized_with_shared_cache(_project_namespace, timeout=30)
 def tenant_quota_usages(request, tenant_id=None):
     """Get our quotas and construct our usage object.
     If no tenant_id is provided, a the request.user.project_id
     is assumed to be used
+
+    Once the disabled quotas are known, the quotas and the usages of
+    USAGE_FETCHES are retrieved concurrently. The result is shared for 30
+    seconds by the requests of the same project and dropped when resources
+    are created or deleted through the API modules.
     """
     if not tenant_id:
         tenant_id = request.user.project_id
 
     disabled_quotas = get_disabled_quotas(request)
-    usages = QuotaUsage()
+    # Disabled further by get_tenant_quota_data when cinder fails.
+    quota_disabled_quotas = set(disabled_quotas)
+
+    fetches = OrderedDict()
+    fetches['quotas'] = functools.partial(
+        get_tenant_quota_data, request,
+        disabled_quotas=quota_disabled_quotas, tenant_id=tenant_id)
+    for name, fetch in USAGE_FETCHES.items():
+        fetches[name] = functools.partial(_fetch_usages, fetch, request,
+                                          disabled_quotas, tenant_id)
+    results = concurrency.load_all(fetches, concurrent=True,
+                                   name='quotas')[0]
 
-    for quota in get_tenant_quota_data(request,
-                                       disabled_quotas=disabled_quotas,
-                                       tenant_id=tenant_id):
+    usages = QuotaUsage()
+    for quota in results.pop('quotas'):
         usages.add_quota(quota)
-
-    # Get our usages.
-    _get_tenant_compute_usages(request, usages, disabled_quotas, tenant_id)
-    _get_tenant_network_usages(request, usages, disabled_quotas, tenant_id)
-    _get_tenant_volume_usages(request, usages, disabled_quotas, tenant_id)
+    if 'volumes' in quota_disabled_quotas:
+        results.pop('volumes')
+    for partial_usages in results.values():
+        for name, usage in partial_usages.usages.items():
+            usages.tally(name, usage['used'])
 
     return usages
 
@@ -22,6 +22,7 @@ class UsageView(tables.DataTableView):
     usage_class = None
     show_deleted = True
     csv_template_name = None
+    csv_summary_template_name = None
     page_title = _("Overview")
 
     def __init__(self, *args, **kwargs):
@@ -36,6 +37,11 @@ class UsageView(tables.DataTableView):
                     ".".join((self.template_name.rsplit('.', 1)[0], 'csv')))
         return self.template_name
 
+    def get_summary_template_name(self):
+        """Returns the template of the totals ending CSV reports."""
+        return (self.csv_summary_template_name or
+                "%s_summary.csv" % self.get_template_names().rsplit('.', 1)[0])
+
     def get_content_type(self):
         if self.request.GET.get('format', 'html') == 'csv':
             return "text/csv"
@@ -46,6 +52,13 @@ class UsageView(tables.DataTableView):
             project_id = self.kwargs.get('project_id',
                                          self.request.user.tenant_id)
             self.usage = self.usage_class(self.request, project_id)
+            if self.request.GET.get('format', 'html') == 'csv':
+                # The usage is retrieved now, but summarized by the response
+                # while it streams the rows of the report.
+                self.usage.usage_list = self.usage.iter_summarize(
+                    *self.usage.get_date_range())
+                self.kwargs['usage'] = self.usage
+                return []
             self.usage.summarize(*self.usage.get_date_range())
             self.usage.get_limits()
             self.kwargs['usage'] = self.usage
@@ -104,6 +117,8 @@ class UsageView(tables.DataTableView):
         if self.request.GET.get('format', 'html') == 'csv':
             render_class = self.csv_response_class
             response_kwargs.setdefault("filename", "usage.csv")
+            response_kwargs.setdefault("footer_template",
+                                       self.get_summary_template_name())
         else:
             render_class = self.response_class
         context = self.render_context_with_title(context)
@@ -191,24 +191,16 @@ class ProjectAggregatesQuery(object):
         self.request = request
         self.period = period
         self.additional_query = additional_query
-        tenants, more = api.keystone.tenant_list(request,
-                                                 domain=None,
-                                                 paginate=False)
-        self.queries = {}
-
-        for tenant in tenants:
-            tenant_query = [{
-                            "field": "project_id",
-                            "op": "eq",
-                            "value": tenant.id}]
-
-            self.queries[tenant.name] = tenant_query
+        # The projects are discovered from the statistics grouped by
+        # project, so the whole project directory is never listed. Their
+        # names are shared by all the queries through this object.
+        self.queries = None
+        self.ceilometer_usage = api.ceilometer.CeilometerUsage(request)
 
     def query(self, meter):
         unit = get_unit(meter, self.request)
-        ceilometer_usage = api.ceilometer.CeilometerUsage(self.request)
-        resources = ceilometer_usage.resource_aggregates_with_statistics(
-            self.queries, [meter], period=self.period,
+        resources = self.ceilometer_usage.project_aggregates_with_statistics(
+            [meter], period=self.period,
             stats_attr=None,
             additional_query=self.additional_query)
         return resources, unit
@@ -220,8 +212,6 @@ class MeterQuery(ProjectAggregatesQuery):
         filterfunc = kwargs.pop('filterfunc', None)
         super(MeterQuery, self).__init__(*args, **kwargs)
         self.filterfunc = filterfunc
-        # Resetting the tenant based filter set in base class
-        self.queries = None
 
     def query(self, meter):
         def filter_by_meter_name(resource):
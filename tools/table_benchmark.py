@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Times the rendering of a large instance table with and without compiled
+rows.
+
+Run from the top of the source tree:
+
+    python tools/table_benchmark.py --rows 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'horizon.test.settings')
+
+import django  # noqa
+django.setup()
+
+from django.conf.urls import url  # noqa
+from django.contrib.auth.models import AnonymousUser  # noqa
+from django import http  # noqa
+from django.test import RequestFactory  # noqa
+from django.test.utils import override_settings  # noqa
+
+from horizon import tables  # noqa
+
+
+STATUSES = ('ACTIVE', 'ACTIVE', 'ACTIVE', 'SHUTOFF', 'PAUSED', 'ERROR')
+TASK_STATES = (None, None, None, None, 'deleting')
+
+
+def detail(request, instance_id):
+    return http.HttpResponse(instance_id)
+
+
+urlpatterns = [
+    url(r'^instances/(?P<instance_id>[^/]+)/$', detail, name='detail'),
+]
+
+
+class Instance(object):
+    def __init__(self, index):
+        self.id = str(uuid.uuid4())
+        self.name = 'instance-%05d' % index
+        self.tenant_name = 'project-%02d' % (index % 20)
+        self.host = 'compute-%03d' % (index % 100)
+        self.status = STATUSES[index % len(STATUSES)]
+        self.task_state = TASK_STATES[index % len(TASK_STATES)]
+        self.ip = '10.0.%d.%d' % (index // 250, index % 250)
+
+
+class DeleteInstance(tables.Action):
+    name = 'delete'
+    verbose_name = 'Delete Instance'
+
+    def allowed(self, request, instance=None):
+        return instance.task_state != 'deleting'
+
+
+class RebootInstance(tables.Action):
+    name = 'reboot'
+    verbose_name = 'Reboot Instance'
+
+    def allowed(self, request, instance=None):
+        return (instance.status in ('ACTIVE', 'SHUTOFF') and
+                instance.task_state != 'deleting')
+
+
+class TogglePause(tables.Action):
+    name = 'pause'
+    verbose_name = 'Pause Instance'
+
+    def allowed(self, request, instance=None):
+        if instance.status == 'PAUSED':
+            self.verbose_name = 'Resume Instance'
+        return instance.status in ('ACTIVE', 'PAUSED')
+
+
+class InstancesTable(tables.DataTable):
+    tenant = tables.Column('tenant_name', verbose_name='Project')
+    host = tables.Column('host', verbose_name='Host')
+    name = tables.Column('name', link='detail', verbose_name='Name')
+    ip = tables.Column('ip', verbose_name='IP Address')
+    status = tables.Column('status', verbose_name='Status', status=True,
+                           status_choices=(('active', True),
+                                           ('error', False)))
+    task = tables.Column('task_state', verbose_name='Task')
+
+    class Meta(object):
+        name = 'instances'
+        status_columns = ['status']
+        row_actions = (TogglePause, RebootInstance, DeleteInstance)
+
+
+class CompiledInstancesTable(InstancesTable):
+    class Meta(InstancesTable.Meta):
+        compiled_rows = True
+        row_actions_allowed_key = staticmethod(
+            lambda instance: (instance.status, instance.task_state))
+
+
+def render_rows(table_class, request, data):
+    start = time.time()
+    table = table_class(request, data)
+    html = u''.join(row.render() for row in table.get_rows())
+    return time.time() - start, len(html)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    request = RequestFactory().get('/instances/')
+    request.user = AnonymousUser()
+    data = [Instance(index) for index in range(args.rows)]
+
+    with override_settings(ROOT_URLCONF=__name__):
+        for table_class in (InstancesTable, CompiledInstancesTable):
+            timings = [render_rows(table_class, request, data)[0]
+                       for _ in range(args.repeat)]
+            print('%-24s %d rows: best %.3fs' % (table_class.__name__,
+                                                args.rows, min(timings)))
+
+
+if __name__ == '__main__':
+    main()